@@ -0,0 +1,57 @@
+import asyncio
+from pimoroni_yukon import Yukon
+
+"""
+Use Yukon's asyncio monitoring task to read the internal sensors,
+whilst other tasks run alongside it. Power needs to be provided to
+the XT30 connector, otherwise the monitoring will raise an UnderVoltageError.
+
+Press "Boot/User" to exit the program.
+"""
+
+# Constants
+MONITOR_PERIOD_MS = 10      # How often the monitoring task checks the sensors
+REPORT_PERIOD_MS = 500      # How often to print out the readings
+BLINK_PERIOD_MS = 250       # How often to toggle LED A
+
+# Variables
+yukon = Yukon()             # A new Yukon object
+
+
+# Toggle one of the LEDs, as an example of other work happening alongside the monitoring
+async def blink():
+    while True:
+        yukon.set_led('A', not yukon.is_led_on('A'))
+        await asyncio.sleep_ms(BLINK_PERIOD_MS)
+
+
+async def main():
+    # Start the monitoring task, and the other tasks to run alongside it
+    monitor = asyncio.create_task(yukon.monitor_task(MONITOR_PERIOD_MS))
+    blinker = asyncio.create_task(blink())
+
+    try:
+        # Loop until the BOOT/USER button is pressed
+        while not yukon.is_boot_pressed():
+            await asyncio.sleep_ms(REPORT_PERIOD_MS)
+
+            # If the monitoring task has stopped, awaiting it raises the error that stopped it
+            if monitor.done():
+                await monitor
+
+            # Process the readings taken by the monitoring task, print them, then start afresh
+            yukon.process_readings()
+            yukon.print_readings()
+            yukon.clear_readings()
+    finally:
+        monitor.cancel()
+        blinker.cancel()
+
+
+# Wrap the code in a try block, to catch any exceptions (including KeyboardInterrupt)
+try:
+    asyncio.run(main())
+
+finally:
+    # Put the board back into a safe state, regardless of how the program may have ended
+    yukon.reset()
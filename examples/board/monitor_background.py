@@ -0,0 +1,40 @@
+import time
+from pimoroni_yukon import Yukon
+
+"""
+Use Yukon's background monitor to check the internal sensors on a timer,
+whilst the program's own loop runs at full speed. Power needs to be provided
+to the XT30 connector, otherwise the monitoring will raise an UnderVoltageError.
+
+Press "Boot/User" to exit the program.
+"""
+
+# Constants
+MONITOR_PERIOD_MS = 10      # How often the background monitor checks the sensors
+REPORT_PERIOD_MS = 500      # How often to print out the readings
+
+# Variables
+yukon = Yukon()             # A new Yukon object
+
+# Wrap the code in a try block, to catch any exceptions (including KeyboardInterrupt)
+try:
+    # Start checking the sensors in the background
+    yukon.start_background_monitor(MONITOR_PERIOD_MS)
+
+    # Loop until the BOOT/USER button is pressed
+    while not yukon.is_boot_pressed():
+
+        # Raise any error that stopped the background monitor (the main output will have already been turned off)
+        yukon.check_background_monitor()
+
+        # Perform work that would otherwise leave the sensors unchecked, such as waiting on a slow device
+        time.sleep_ms(REPORT_PERIOD_MS)
+
+        # Process the readings taken in the background, print them, then start afresh
+        yukon.process_readings()
+        yukon.print_readings()
+        yukon.clear_readings()
+
+finally:
+    # Put the board back into a safe state, regardless of how the program may have ended
+    yukon.reset()
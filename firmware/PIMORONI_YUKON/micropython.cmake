@@ -51,4 +51,5 @@ include(modules_py/modules_py)
 # Must call `enable_ulab()` to enable
 include(micropython-common-ulab)
 
-include(tca9555/micropython)
\ No newline at end of file
+include(tca9555/micropython)
+include(yukon_monitor/micropython)
\ No newline at end of file
@@ -17,6 +17,8 @@
 #define TCA9555_CHIP_ADDRESSES { 0x20, 0x26 }
 #define TCA9555_LOCAL_MEMORY (1)
 #define TCA9555_READ_INTERNALS (1)
+#define TCA9555_INPUT_CACHE (1)
+#define TCA9555_INT_PIN (28)
 
 #define MICROPY_BOARD_EARLY_INIT board_init
 void board_init(void);
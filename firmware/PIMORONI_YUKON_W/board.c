@@ -34,5 +34,8 @@ void board_reset(void) {
         hw_set_bits(&padsbank0_hw->io[i], PADS_BANK0_GPIO0_OD_BITS);
     }
 
+    // Release the interrupt pin, should the last program have cached the expanders' inputs
+    tca_input_cache_enable(false);
+
     board_init();
 }
@@ -2,6 +2,9 @@ include("$(PORT_DIR)/boards/manifest.py")
 
 freeze("$(BOARD_DIR)/../frozen/")
 
+# The Yukon library, so it is compiled ahead of time and runs from flash rather than being compiled into RAM on every boot
+package("pimoroni_yukon", base_path="$(BOARD_DIR)/../../lib")
+
 require("sdcard")
 
 require("bundle-networking")
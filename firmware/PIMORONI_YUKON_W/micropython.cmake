@@ -52,3 +52,4 @@ include(modules_py/modules_py)
 include(micropython-common-ulab)
 
 include(tca9555/micropython)
+include(yukon_monitor/micropython)
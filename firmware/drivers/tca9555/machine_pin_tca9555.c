@@ -49,30 +49,36 @@ void machine_pin_ext_init(void) {
 }
 
 void machine_pin_ext_set(machine_pin_obj_t *self, bool value) {
+    tca_lock();
     tca_gpio_set_output(self->id, value);
     tca_gpio_set_config(self->id, true);  // Set to output (even if we already think it is)
+    tca_unlock();
     self->last_output_value = value;
     self->is_output = true;
 }
 
 bool machine_pin_ext_get(machine_pin_obj_t *self) {
     bool value;
+    tca_lock();
     if (self->is_output) {
         value = tca_gpio_get_output(self->id);
     } else {
         value = tca_gpio_get_input(self->id);
     }
+    tca_unlock();
     return value;
 }
 
 void machine_pin_ext_config(machine_pin_obj_t *self, int mode, int value) {
     if (mode == MACHINE_PIN_MODE_IN) {
+        tca_lock();
         if (value != -1) {
             // figure if you pass a value to IN it should still remember it (this is what regular GPIO does)
             tca_gpio_set_output(self->id, value);
             self->last_output_value = value;
         }
         tca_gpio_set_config(self->id, false);  // Set to input (even if we already think it is)
+        tca_unlock();
         self->is_output = false;
     } else if (mode == MACHINE_PIN_MODE_OUT) {
         if (value == -1) {
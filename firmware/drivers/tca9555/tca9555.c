@@ -31,6 +31,8 @@
 #include "py/mphal.h"
 #include "tca9555.h"
 #include "hardware/i2c.h"
+#include "hardware/gpio.h"
+#include "pico/mutex.h"
 
 #if defined(MICROPY_PY_TCA9555) && defined(MICROPY_HW_PIN_EXT_COUNT)
 
@@ -42,6 +44,16 @@ uint8_t tca9555_polarity_state[TCA9555_CHIP_COUNT * 2] = {0};
 #endif
 bool i2c_created = false;
 
+auto_init_recursive_mutex(tca9555_mutex);
+
+void tca_lock(void) {
+    recursive_mutex_enter_blocking(&tca9555_mutex);
+}
+
+void tca_unlock(void) {
+    recursive_mutex_exit(&tca9555_mutex);
+}
+
 void configure_i2c() {
     if(!i2c_created) {
         i2c_init(i2c0, 400000);
@@ -56,17 +68,55 @@ void configure_i2c() {
 
 #define BUS_TIMEOUT_US 1000000
 
+uint32_t tca9555_issued[TCA9555_CHIP_COUNT] = {0};
+uint32_t tca9555_skipped[TCA9555_CHIP_COUNT] = {0};
+
+static inline void count_issued(uint8_t address) {
+    for (uint i = 0; i < TCA9555_CHIP_COUNT; i++) {
+        if (tca9555_addresses[i] == address) {
+            tca9555_issued[i]++;
+            return;
+        }
+    }
+}
+
+void tca_reset_counters(void) {
+    for (uint i = 0; i < TCA9555_CHIP_COUNT; i++) {
+        tca9555_issued[i] = 0;
+        tca9555_skipped[i] = 0;
+    }
+}
+
+#if TCA9555_INPUT_CACHE
+static bool input_cache_enabled = false;
+static uint8_t input_cache_valid = 0;   // A bitmask of the expanders whose cached input port can be used
+static uint16_t input_cache[TCA9555_CHIP_COUNT] = {0};
+#endif
+
 static void reg_write_uint8(uint8_t address, uint8_t reg, uint8_t value) {
+    count_issued(address);
     uint8_t buffer[2] = {reg, value};
     i2c_write_timeout_us(i2c0, address, buffer, 2, false, BUS_TIMEOUT_US);
+    #if TCA9555_INPUT_CACHE
+    if (reg >= POLARITY_PORT0) {
+        input_cache_valid = 0;  // Changing a pin's direction or polarity does not raise an interrupt
+    }
+    #endif
 }
 
 static void reg_write_uint16(uint8_t address, uint8_t reg, uint16_t value) {
+    count_issued(address);
     uint8_t buffer[3] = { reg, (uint8_t)(value & 0xFF), (uint8_t)(value >> 8) };
     i2c_write_timeout_us(i2c0, address, buffer, 3, false, BUS_TIMEOUT_US);
+    #if TCA9555_INPUT_CACHE
+    if (reg >= POLARITY_PORT0) {
+        input_cache_valid = 0;  // Changing a pin's direction or polarity does not raise an interrupt
+    }
+    #endif
 }
 
 static uint8_t reg_read_uint8(uint8_t address, uint8_t reg) {
+    count_issued(address);
     uint8_t value;
     i2c_write_timeout_us(i2c0, address, &reg, 1, false, BUS_TIMEOUT_US);
     i2c_read_timeout_us(i2c0, address, (uint8_t *)&value, sizeof(uint8_t), false, BUS_TIMEOUT_US);
@@ -74,15 +124,57 @@ static uint8_t reg_read_uint8(uint8_t address, uint8_t reg) {
 }
 
 static uint16_t reg_read_uint16(uint8_t address, uint8_t reg) {
+    count_issued(address);
     uint16_t value;
     i2c_write_timeout_us(i2c0, address, &reg, 1, true, BUS_TIMEOUT_US);
     i2c_read_timeout_us(i2c0, address, (uint8_t *)&value, sizeof(uint16_t), false, BUS_TIMEOUT_US);
     return value;
 }
 
+#if TCA9555_INPUT_CACHE
+void tca_input_cache_enable(bool enable) {
+    if (enable && !input_cache_enabled) {
+        // The interrupt output is open drain and active low
+        gpio_init(TCA9555_INT_PIN);
+        gpio_set_dir(TCA9555_INT_PIN, GPIO_IN);
+        gpio_pull_up(TCA9555_INT_PIN);
+    }
+    input_cache_enabled = enable;
+    input_cache_valid = 0;
+}
+
+bool tca_input_cache_enabled(void) {
+    return input_cache_enabled;
+}
+
+static uint16_t cached_input_port(uint tca_index) {
+    if (!gpio_get(TCA9555_INT_PIN)) {
+        // An input has changed on one of the expanders. Their interrupt outputs are shared, and each is only
+        // released once its own input port is read, so read them all to know which changed and clear the line
+        for (uint i = 0; i < TCA9555_CHIP_COUNT; i++) {
+            input_cache[i] = reg_read_uint16(tca9555_addresses[i], INPUT_PORT0);
+        }
+        input_cache_valid = (1u << TCA9555_CHIP_COUNT) - 1u;
+    } else if ((input_cache_valid & (1u << tca_index)) == 0) {
+        input_cache[tca_index] = reg_read_uint16(tca9555_addresses[tca_index], INPUT_PORT0);
+        input_cache_valid |= (1u << tca_index);
+    }
+
+    // Pins set as outputs do not raise an interrupt when written, so take their levels from the stored output state
+    uint16_t inputs = (tca9555_config_state[HIGH_BYTE(tca_index)] << 8) | tca9555_config_state[LOW_BYTE(tca_index)];
+    uint16_t outputs = (tca9555_output_state[HIGH_BYTE(tca_index)] << 8) | tca9555_output_state[LOW_BYTE(tca_index)];
+    return (input_cache[tca_index] & inputs) | (outputs & ~inputs);
+}
+#endif
+
 bool tca_gpio_get_input(uint tca_gpio) {
     invalid_params_if(TCA9555, tca_gpio >= TCA9555_VIRTUAL_GPIO_COUNT);
     configure_i2c();
+    #if TCA9555_INPUT_CACHE
+    if (input_cache_enabled) {
+        return (cached_input_port(CHIP_FROM_GPIO(tca_gpio)) & (1u << (tca_gpio % TCA9555_GPIO_COUNT))) != 0;
+    }
+    #endif
     uint8_t address = ADDRESS_FROM_GPIO(tca_gpio);
 
     uint8_t reg = IS_PORT1(tca_gpio) ? INPUT_PORT1 : INPUT_PORT0;
@@ -152,6 +244,8 @@ void tca_gpio_set_output(uint tca_gpio, bool value) {
         #if TCA9555_LOCAL_MEMORY
         tca9555_output_state[GPIO_BYTE(tca_gpio)] = new_output_state;
         #endif
+    } else {
+        tca9555_skipped[CHIP_FROM_GPIO(tca_gpio)]++;
     }
 }
 
@@ -178,6 +272,8 @@ void tca_gpio_set_config(uint tca_gpio, bool output) {
         #if TCA9555_LOCAL_MEMORY
         tca9555_config_state[GPIO_BYTE(tca_gpio)] = new_config_state;
         #endif
+    } else {
+        tca9555_skipped[CHIP_FROM_GPIO(tca_gpio)]++;
     }
 }
 
@@ -202,26 +298,43 @@ void tca_gpio_set_polarity(uint tca_gpio, bool polarity) {
     if (new_polarity_state != polarity_state) {
         reg_write_uint8(address, reg, new_polarity_state);
         #if TCA9555_LOCAL_MEMORY
-        tca9555_output_state[GPIO_BYTE(tca_gpio)] = new_polarity_state;
+        tca9555_polarity_state[GPIO_BYTE(tca_gpio)] = new_polarity_state;
         #endif
+    } else {
+        tca9555_skipped[CHIP_FROM_GPIO(tca_gpio)]++;
     }
 }
 
 uint16_t tca_get_input_port(uint tca_index) {
     invalid_params_if(TCA9555, tca_index >= TCA9555_CHIP_COUNT);
     configure_i2c();
+    #if TCA9555_INPUT_CACHE
+    if (input_cache_enabled) {
+        return cached_input_port(tca_index);
+    }
+    #endif
     return reg_read_uint16(tca9555_addresses[tca_index], INPUT_PORT0);
 }
 
 uint8_t tca_get_input_port_low(uint tca_index) {
     invalid_params_if(TCA9555, tca_index >= TCA9555_CHIP_COUNT);
     configure_i2c();
+    #if TCA9555_INPUT_CACHE
+    if (input_cache_enabled) {
+        return (uint8_t)(cached_input_port(tca_index) & 0xFF);
+    }
+    #endif
     return reg_read_uint8(tca9555_addresses[tca_index], INPUT_PORT0);
 }
 
 uint8_t tca_get_input_port_high(uint tca_index) {
     invalid_params_if(TCA9555, tca_index >= TCA9555_CHIP_COUNT);
     configure_i2c();
+    #if TCA9555_INPUT_CACHE
+    if (input_cache_enabled) {
+        return (uint8_t)(cached_input_port(tca_index) >> 8);
+    }
+    #endif
     return reg_read_uint8(tca9555_addresses[tca_index], INPUT_PORT1);
 }
 
@@ -420,6 +533,8 @@ void tca_change_output_mask(uint8_t chip, uint16_t mask, uint16_t state) {
         new_output_state |= state; // Set the state bits
         if (new_output_state != output_state) {
             tca_set_output_port(chip, new_output_state);
+        } else {
+            tca9555_skipped[chip]++;
         }
     } else if (low_changed) {
         #if TCA9555_LOCAL_MEMORY
@@ -430,6 +545,8 @@ void tca_change_output_mask(uint8_t chip, uint16_t mask, uint16_t state) {
         uint8_t new_output_state = (output_state & ~low_mask) | low_state;
         if (new_output_state != output_state) {
             tca_set_output_port_low(chip, new_output_state);
+        } else {
+            tca9555_skipped[chip]++;
         }
     } else if (high_changed) {
         #if TCA9555_LOCAL_MEMORY
@@ -440,6 +557,8 @@ void tca_change_output_mask(uint8_t chip, uint16_t mask, uint16_t state) {
         uint8_t new_output_state = (output_state & ~high_mask) | high_state;
         if (new_output_state != output_state) {
             tca_set_output_port_high(chip, new_output_state);
+        } else {
+            tca9555_skipped[chip]++;
         }
     }
 }
@@ -462,6 +581,8 @@ void tca_change_config_mask(uint8_t chip, uint16_t mask, uint16_t state) {
         new_config_state |= state; // Set the state bits
         if (new_config_state != config_state) {
             tca_set_config_port(chip, new_config_state);
+        } else {
+            tca9555_skipped[chip]++;
         }
     } else if (low_changed) {
         #if TCA9555_LOCAL_MEMORY
@@ -472,6 +593,8 @@ void tca_change_config_mask(uint8_t chip, uint16_t mask, uint16_t state) {
         uint8_t new_config_state = (config_state & ~low_mask) | low_state;
         if (new_config_state != config_state) {
             tca_set_config_port_low(chip, new_config_state);
+        } else {
+            tca9555_skipped[chip]++;
         }
     } else if (high_changed) {
         #if TCA9555_LOCAL_MEMORY
@@ -482,6 +605,8 @@ void tca_change_config_mask(uint8_t chip, uint16_t mask, uint16_t state) {
         uint8_t new_config_state = (config_state & ~high_mask) | high_state;
         if (new_config_state != config_state) {
             tca_set_config_port_high(chip, new_config_state);
+        } else {
+            tca9555_skipped[chip]++;
         }
     }
 }
@@ -504,6 +629,8 @@ void tca_change_polarity_mask(uint8_t chip, uint16_t mask, uint16_t state) {
         new_polarity_state |= state; // Set the state bits
         if (new_polarity_state != polarity_state) {
             tca_set_polarity_port(chip, new_polarity_state);
+        } else {
+            tca9555_skipped[chip]++;
         }
     } else if (low_changed) {
         #if TCA9555_LOCAL_MEMORY
@@ -514,6 +641,8 @@ void tca_change_polarity_mask(uint8_t chip, uint16_t mask, uint16_t state) {
         uint8_t new_polarity_state = (polarity_state & ~low_mask) | low_state;
         if (new_polarity_state != polarity_state) {
             tca_set_polarity_port_low(chip, new_polarity_state);
+        } else {
+            tca9555_skipped[chip]++;
         }
     } else if (high_changed) {
         #if TCA9555_LOCAL_MEMORY
@@ -524,7 +653,53 @@ void tca_change_polarity_mask(uint8_t chip, uint16_t mask, uint16_t state) {
         uint8_t new_polarity_state = (polarity_state & ~high_mask) | high_state;
         if (new_polarity_state != polarity_state) {
             tca_set_polarity_port_high(chip, new_polarity_state);
+        } else {
+            tca9555_skipped[chip]++;
+        }
+    }
+}
+
+void tca_apply(uint8_t chip, uint16_t output_mask, uint16_t output_state, uint16_t config_mask, uint16_t config_state) {
+    // The expander only auto-increments between the two ports of a register, so the outputs and config cannot share
+    // a transaction. Outputs are written first, so any pins becoming outputs start at their new level
+    if (output_mask > 0) {
+        tca_change_output_mask(chip, output_mask, output_state & output_mask);
+    }
+    if (config_mask > 0) {
+        tca_change_config_mask(chip, config_mask, config_state & config_mask);
+    }
+}
+
+#if TCA9555_LOCAL_MEMORY
+void tca_change_output_sequence(uint8_t chip, const uint16_t *masks, const uint16_t *states, uint count) {
+    invalid_params_if(TCA9555, chip >= TCA9555_CHIP_COUNT);
+    invalid_params_if(TCA9555, count > TCA9555_SEQUENCE_MAX);
+    configure_i2c();
+
+    // Write each state to both output ports in turn, within a single transaction, skipping any that change nothing
+    uint8_t buffer[1 + (TCA9555_SEQUENCE_MAX * 2)];
+    uint length = 0;
+    buffer[length++] = OUTPUT_PORT0;
+
+    uint16_t output_state = (tca9555_output_state[HIGH_BYTE(chip)] << 8) | tca9555_output_state[LOW_BYTE(chip)];
+    for (uint i = 0; i < count; i++) {
+        uint16_t new_output_state = (output_state & ~masks[i]) | (states[i] & masks[i]);
+        if (new_output_state != output_state) {
+            buffer[length++] = (uint8_t)(new_output_state & 0xFF);
+            buffer[length++] = (uint8_t)(new_output_state >> 8);
+            output_state = new_output_state;
+        } else {
+            tca9555_skipped[chip]++;
         }
     }
+
+    if (length > 1) {
+        uint8_t address = tca9555_addresses[chip];
+        count_issued(address);
+        i2c_write_timeout_us(i2c0, address, buffer, length, false, BUS_TIMEOUT_US);
+        tca9555_output_state[HIGH_BYTE(chip)] = (output_state >> 8);
+        tca9555_output_state[LOW_BYTE(chip)] = (output_state & 0xFF);
+    }
 }
+#endif
 #endif // defined(MICROPY_PY_TCA9555) && defined(MICROPY_HW_PIN_EXT_COUNT)
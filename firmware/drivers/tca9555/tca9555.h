@@ -50,8 +50,24 @@
 #define TCA9555_READ_INTERNALS (0)
 #endif
 
+#ifndef TCA9555_INPUT_CACHE
+#define TCA9555_INPUT_CACHE (0)
+#endif
+
+#if TCA9555_INPUT_CACHE
+#if !TCA9555_LOCAL_MEMORY
+#error "TCA9555_INPUT_CACHE requires TCA9555_LOCAL_MEMORY"
+#endif
+#ifndef TCA9555_INT_PIN
+#error "TCA9555_INPUT_CACHE requires TCA9555_INT_PIN, the GPIO connected to the expanders' interrupt output"
+#endif
+#endif
+
 #define PARAM_ASSERTIONS_ENABLED_TCA9555 (0)
 
+// The most output states that tca_change_output_sequence() can write in one transaction
+#define TCA9555_SEQUENCE_MAX    32
+
 #if TCA9555_LOCAL_MEMORY
 extern uint8_t tca9555_output_state[TCA9555_CHIP_COUNT * 2];
 extern uint8_t tca9555_config_state[TCA9555_CHIP_COUNT * 2];
@@ -59,8 +75,25 @@ extern uint8_t tca9555_polarity_state[TCA9555_CHIP_COUNT * 2];
 #endif
 extern bool i2c_created;
 
+// The number of I2C transactions issued to each expander, and the number of changes skipped for having no effect
+extern uint32_t tca9555_issued[TCA9555_CHIP_COUNT];
+extern uint32_t tca9555_skipped[TCA9555_CHIP_COUNT];
+void tca_reset_counters(void);
+
 void configure_i2c();
 
+// Give one core at a time access to the expanders, so each operation's I2C transactions and read-modify-write of
+// the stored states cannot interleave with those of the other core. May be entered more than once by the same core
+void tca_lock(void);
+void tca_unlock(void);
+
+#if TCA9555_INPUT_CACHE
+// Keep the last read of each expander's input port, only reading them again once the expanders' shared interrupt
+// output signals that an input has changed. Disabled by default, and on soft reset, as it takes over TCA9555_INT_PIN
+void tca_input_cache_enable(bool enable);
+bool tca_input_cache_enabled(void);
+#endif
+
 #define HIGH_BYTE(index) (((index) * 2u) + 1u)
 #define LOW_BYTE(index) (((index) * 2u))
 #define IS_PORT1(gpio) (((gpio) % TCA9555_GPIO_COUNT) >= 8u)
@@ -109,4 +142,11 @@ void tca_set_polarity_port_high(uint tca_index, uint8_t polarity_state);
 void tca_change_output_mask(uint8_t chip, uint16_t mask, uint16_t state);
 void tca_change_config_mask(uint8_t chip, uint16_t mask, uint16_t state);
 void tca_change_polarity_mask(uint8_t chip, uint16_t mask, uint16_t state);
+
+// Change the outputs then config of an expander, with at most one transaction for each
+void tca_apply(uint8_t chip, uint16_t output_mask, uint16_t output_state, uint16_t config_mask, uint16_t config_state);
+#if TCA9555_LOCAL_MEMORY
+// Change the outputs of an expander through several states in turn, up to TCA9555_SEQUENCE_MAX, all within one transaction
+void tca_change_output_sequence(uint8_t chip, const uint16_t *masks, const uint16_t *states, uint count);
+#endif
 #endif
\ No newline at end of file
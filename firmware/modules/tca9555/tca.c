@@ -49,7 +49,9 @@ static mp_obj_t tca_pin_change_output_mask(mp_obj_t chip_obj, mp_obj_t mask_obj,
         mp_raise_ValueError(MP_ERROR_TEXT("state only supports 16 bits"));
     }
 
+    tca_lock();
     tca_change_output_mask(chip, mask, state);
+    tca_unlock();
 
     return mp_const_none;
 }
@@ -69,7 +71,9 @@ static mp_obj_t tca_pin_change_config_mask(mp_obj_t chip_obj, mp_obj_t mask_obj,
         mp_raise_ValueError(MP_ERROR_TEXT("state only supports 16 bits"));
     }
 
+    tca_lock();
     tca_change_config_mask(chip, mask, state);
+    tca_unlock();
 
     return mp_const_none;
 }
@@ -89,12 +93,111 @@ static mp_obj_t tca_pin_change_polarity_mask(mp_obj_t chip_obj, mp_obj_t mask_ob
         mp_raise_ValueError(MP_ERROR_TEXT("state only supports 16 bits"));
     }
 
+    tca_lock();
     tca_change_polarity_mask(chip, mask, state);
+    tca_unlock();
 
     return mp_const_none;
 }
 static MP_DEFINE_CONST_FUN_OBJ_3(tca_pin_change_polarity_mask_obj, tca_pin_change_polarity_mask);
 
+static mp_obj_t tca_pin_apply(size_t n_args, const mp_obj_t *args) {
+    int chip = mp_obj_get_int(args[0]);
+    int output_mask = mp_obj_get_int(args[1]);
+    int output_state = mp_obj_get_int(args[2]);
+    int config_mask = n_args > 3 ? mp_obj_get_int(args[3]) : 0;
+    int config_state = n_args > 4 ? mp_obj_get_int(args[4]) : 0;
+    if (chip < 0 || chip >= TCA9555_CHIP_COUNT) {
+        mp_raise_msg_varg(&mp_type_ValueError, MP_ERROR_TEXT("chip can only be 0 to %d"), TCA9555_CHIP_COUNT - 1);
+    }
+    if (output_mask < 0 || output_mask > UINT16_MAX || config_mask < 0 || config_mask > UINT16_MAX) {
+        mp_raise_ValueError(MP_ERROR_TEXT("mask only supports 16 bits"));
+    }
+    if (output_state < 0 || output_state > UINT16_MAX || config_state < 0 || config_state > UINT16_MAX) {
+        mp_raise_ValueError(MP_ERROR_TEXT("state only supports 16 bits"));
+    }
+
+    tca_lock();
+    tca_apply(chip, output_mask, output_state, config_mask, config_state);
+    tca_unlock();
+
+    return mp_const_none;
+}
+static MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(tca_pin_apply_obj, 3, 5, tca_pin_apply);
+
+#if TCA9555_LOCAL_MEMORY
+static mp_obj_t tca_pin_change_output_sequence(mp_obj_t chip_obj, mp_obj_t steps_obj) {
+    int chip = mp_obj_get_int(chip_obj);
+    if (chip < 0 || chip >= TCA9555_CHIP_COUNT) {
+        mp_raise_msg_varg(&mp_type_ValueError, MP_ERROR_TEXT("chip can only be 0 to %d"), TCA9555_CHIP_COUNT - 1);
+    }
+
+    size_t count;
+    mp_obj_t *steps;
+    mp_obj_get_array(steps_obj, &count, &steps);
+
+    // Check every step before writing any, so a bad step does not leave the sequence part way through
+    uint16_t masks[TCA9555_SEQUENCE_MAX];
+    uint16_t states[TCA9555_SEQUENCE_MAX];
+    for (size_t i = 0; i < count; i++) {
+        mp_obj_t *step;
+        mp_obj_get_array_fixed_n(steps[i], 2, &step);
+        mp_int_t mask = mp_obj_get_int(step[0]);
+        mp_int_t state = mp_obj_get_int(step[1]);
+        if (mask < 0 || mask > UINT16_MAX) {
+            mp_raise_ValueError(MP_ERROR_TEXT("mask only supports 16 bits"));
+        }
+        if (state < 0 || state > UINT16_MAX) {
+            mp_raise_ValueError(MP_ERROR_TEXT("state only supports 16 bits"));
+        }
+    }
+
+    // Write the steps in as few transactions as the expander's sequence limit allows
+    tca_lock();
+    size_t i = 0;
+    while (i < count) {
+        uint chunk = 0;
+        while (i < count && chunk < TCA9555_SEQUENCE_MAX) {
+            mp_obj_t *step;
+            mp_obj_get_array_fixed_n(steps[i], 2, &step);
+            masks[chunk] = mp_obj_get_int(step[0]);
+            states[chunk] = mp_obj_get_int(step[1]);
+            chunk++;
+            i++;
+        }
+        tca_change_output_sequence(chip, masks, states, chunk);
+    }
+    tca_unlock();
+
+    return mp_const_none;
+}
+static MP_DEFINE_CONST_FUN_OBJ_2(tca_pin_change_output_sequence_obj, tca_pin_change_output_sequence);
+#endif
+
+static mp_obj_t tca_counters(mp_obj_t chip_obj) {
+    int chip = mp_obj_get_int(chip_obj);
+    if (chip < 0 || chip >= TCA9555_CHIP_COUNT) {
+        mp_raise_msg_varg(&mp_type_ValueError, MP_ERROR_TEXT("chip can only be 0 to %d"), TCA9555_CHIP_COUNT - 1);
+    }
+
+    tca_lock();
+    mp_obj_t items[2] = {
+        mp_obj_new_int_from_uint(tca9555_issued[chip]),
+        mp_obj_new_int_from_uint(tca9555_skipped[chip]),
+    };
+    tca_unlock();
+    return mp_obj_new_tuple(2, items);
+}
+static MP_DEFINE_CONST_FUN_OBJ_1(tca_counters_obj, tca_counters);
+
+static mp_obj_t tca_reset_counters_fn(void) {
+    tca_lock();
+    tca_reset_counters();
+    tca_unlock();
+    return mp_const_none;
+}
+static MP_DEFINE_CONST_FUN_OBJ_0(tca_reset_counters_obj, tca_reset_counters_fn);
+
 #if TCA9555_READ_INTERNALS
 static mp_obj_t tca_port_read_input_state(mp_obj_t chip_obj) {
     int chip = mp_obj_get_int(chip_obj);
@@ -102,7 +205,10 @@ static mp_obj_t tca_port_read_input_state(mp_obj_t chip_obj) {
         mp_raise_msg_varg(&mp_type_ValueError, MP_ERROR_TEXT("chip can only be 0 to %d"), TCA9555_CHIP_COUNT - 1);
     }
 
-    return mp_obj_new_int(tca_get_input_port(chip));
+    tca_lock();
+    uint16_t state = tca_get_input_port(chip);
+    tca_unlock();
+    return mp_obj_new_int(state);
 }
 static MP_DEFINE_CONST_FUN_OBJ_1(tca_port_read_input_state_obj, tca_port_read_input_state);
 
@@ -112,7 +218,10 @@ static mp_obj_t tca_port_read_output_state(mp_obj_t chip_obj) {
         mp_raise_msg_varg(&mp_type_ValueError, MP_ERROR_TEXT("chip can only be 0 to %d"), TCA9555_CHIP_COUNT - 1);
     }
 
-    return mp_obj_new_int(tca_get_output_port(chip));
+    tca_lock();
+    uint16_t state = tca_get_output_port(chip);
+    tca_unlock();
+    return mp_obj_new_int(state);
 }
 static MP_DEFINE_CONST_FUN_OBJ_1(tca_port_read_output_state_obj, tca_port_read_output_state);
 
@@ -122,7 +231,10 @@ static mp_obj_t tca_port_read_config_state(mp_obj_t chip_obj) {
         mp_raise_msg_varg(&mp_type_ValueError, MP_ERROR_TEXT("chip can only be 0 to %d"), TCA9555_CHIP_COUNT - 1);
     }
 
-    return mp_obj_new_int(tca_get_config_port(chip));
+    tca_lock();
+    uint16_t state = tca_get_config_port(chip);
+    tca_unlock();
+    return mp_obj_new_int(state);
 }
 static MP_DEFINE_CONST_FUN_OBJ_1(tca_port_read_config_state_obj, tca_port_read_config_state);
 
@@ -132,7 +244,10 @@ static mp_obj_t tca_port_read_polarity_state(mp_obj_t chip_obj) {
         mp_raise_msg_varg(&mp_type_ValueError, MP_ERROR_TEXT("chip can only be 0 to %d"), TCA9555_CHIP_COUNT - 1);
     }
 
-    return mp_obj_new_int(tca_get_polarity_port(chip));
+    tca_lock();
+    uint16_t state = tca_get_polarity_port(chip);
+    tca_unlock();
+    return mp_obj_new_int(state);
 }
 static MP_DEFINE_CONST_FUN_OBJ_1(tca_port_read_polarity_state_obj, tca_port_read_polarity_state);
 
@@ -169,6 +284,21 @@ static MP_DEFINE_CONST_FUN_OBJ_1(tca_port_stored_polarity_state_obj, tca_port_st
 #endif
 #endif
 
+#if TCA9555_INPUT_CACHE
+static mp_obj_t tca_input_cache(size_t n_args, const mp_obj_t *args) {
+    if (n_args == 0) {
+        return mp_obj_new_bool(tca_input_cache_enabled());
+    }
+
+    tca_lock();
+    tca_input_cache_enable(mp_obj_is_true(args[0]));
+    tca_unlock();
+
+    return mp_const_none;
+}
+static MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(tca_input_cache_obj, 0, 1, tca_input_cache);
+#endif
+
 // Define all attributes of the module.
 // Table entries are key/value pairs of the attribute name (a string)
 // and the MicroPython object reference.
@@ -181,6 +311,12 @@ static const mp_rom_map_elem_t tca_module_globals_table[] = {
     { MP_ROM_QSTR(MP_QSTR_change_output_mask), &tca_pin_change_output_mask_obj },
     { MP_ROM_QSTR(MP_QSTR_change_config_mask), &tca_pin_change_config_mask_obj },
     { MP_ROM_QSTR(MP_QSTR_change_polarity_mask), &tca_pin_change_polarity_mask_obj },
+    { MP_ROM_QSTR(MP_QSTR_apply), &tca_pin_apply_obj },
+    #if TCA9555_LOCAL_MEMORY
+    { MP_ROM_QSTR(MP_QSTR_change_output_sequence), &tca_pin_change_output_sequence_obj },
+    #endif
+    { MP_ROM_QSTR(MP_QSTR_counters), &tca_counters_obj },
+    { MP_ROM_QSTR(MP_QSTR_reset_counters), &tca_reset_counters_obj },
     #if TCA9555_READ_INTERNALS
     { MP_ROM_QSTR(MP_QSTR_read_input), &tca_port_read_input_state_obj },
     { MP_ROM_QSTR(MP_QSTR_read_output), &tca_port_read_output_state_obj },
@@ -192,6 +328,9 @@ static const mp_rom_map_elem_t tca_module_globals_table[] = {
     { MP_ROM_QSTR(MP_QSTR_stored_polarity), &tca_port_stored_polarity_state_obj },
     #endif
     #endif
+    #if TCA9555_INPUT_CACHE
+    { MP_ROM_QSTR(MP_QSTR_input_cache), &tca_input_cache_obj },
+    #endif
 };
 static MP_DEFINE_CONST_DICT(tca_module_globals, tca_module_globals_table);
 
@@ -0,0 +1,171 @@
+// Include MicroPython API.
+#include "py/runtime.h"
+
+#include "hardware/adc.h"
+#include "tca9555.h"
+
+// The layout of each entry in a sweep table, as ints
+#define ENTRY_ADDRESS   0   // The mux address to read
+#define ENTRY_STATE     1   // The expander outputs that select the address
+#define ENTRY_SAMPLES   2   // The number of ADC samples to average
+#define ENTRY_LOW       3   // The lowest raw reading that passes
+#define ENTRY_HIGH      4   // The highest raw reading that passes
+#define ENTRY_SLOT      5   // The accumulator to add the reading to, or -1 for none
+#define ENTRY_SIZE      6
+
+#define NUM_ADDRESSES   16
+#define NUM_ADC_CHANNELS 5
+#define SUM_SPLIT       (1 << 24)   // Matches pimoroni_yukon.readings, to keep every stored value a small int
+#define PASSED          (-1)
+
+static uint16_t read_u16(uint channel, int32_t samples) {
+    adc_select_input(channel);
+    uint32_t total = 0;
+    for (int32_t i = 0; i < samples; i++) {
+        uint32_t raw = adc_read();
+        total += (raw << 4) | (raw >> 8);   // Scale to 16 bits, as machine.ADC.read_u16() does
+    }
+    return (uint16_t)(total / samples);
+}
+
+static int32_t *get_int_array(mp_obj_t obj, size_t *len) {
+    mp_buffer_info_t info;
+    mp_get_buffer_raise(obj, &info, MP_BUFFER_RW);
+    if (info.typecode != 'i') {
+        mp_raise_TypeError(MP_ERROR_TEXT("expected an array of type 'i'"));
+    }
+    *len = info.len / sizeof(int32_t);
+    return (int32_t *)info.buf;
+}
+
+static mp_obj_t yukon_monitor_sweep(size_t n_args, const mp_obj_t *args) {
+    int chip = mp_obj_get_int(args[0]);
+    int io_mask = mp_obj_get_int(args[1]);
+    int channel = mp_obj_get_int(args[2]);
+    int due = mp_obj_get_int(args[4]);
+    if (chip < 0 || chip >= TCA9555_CHIP_COUNT) {
+        mp_raise_msg_varg(&mp_type_ValueError, MP_ERROR_TEXT("chip can only be 0 to %d"), TCA9555_CHIP_COUNT - 1);
+    }
+    if (io_mask < 0 || io_mask > UINT16_MAX) {
+        mp_raise_ValueError(MP_ERROR_TEXT("mask only supports 16 bits"));
+    }
+    if (channel < 0 || channel >= NUM_ADC_CHANNELS) {
+        mp_raise_msg_varg(&mp_type_ValueError, MP_ERROR_TEXT("channel can only be 0 to %d"), NUM_ADC_CHANNELS - 1);
+    }
+
+    size_t table_len;
+    const int32_t *table = get_int_array(args[3], &table_len);
+    if (table_len % ENTRY_SIZE != 0) {
+        mp_raise_ValueError(MP_ERROR_TEXT("table length must be a multiple of the entry size"));
+    }
+    size_t count = table_len / ENTRY_SIZE;
+
+    mp_buffer_info_t values_info;
+    mp_get_buffer_raise(args[5], &values_info, MP_BUFFER_RW);
+    if (values_info.typecode != 'H' || values_info.len < NUM_ADDRESSES * sizeof(uint16_t)) {
+        mp_raise_TypeError(MP_ERROR_TEXT("values must be an array of type 'H', with an item per address"));
+    }
+    uint16_t *values = (uint16_t *)values_info.buf;
+
+    // The accumulators are a tuple of the max, min, sum_hi and sum_lo arrays, or None to only check the readings
+    int32_t *max = NULL, *min = NULL, *sum_hi = NULL, *sum_lo = NULL;
+    size_t slots = 0;
+    if (args[6] != mp_const_none) {
+        mp_obj_t *accumulators;
+        mp_obj_get_array_fixed_n(args[6], 4, &accumulators);
+        size_t len;
+        max = get_int_array(accumulators[0], &slots);
+        min = get_int_array(accumulators[1], &len);
+        slots = MIN(slots, len);
+        sum_hi = get_int_array(accumulators[2], &len);
+        slots = MIN(slots, len);
+        sum_lo = get_int_array(accumulators[3], &len);
+        slots = MIN(slots, len);
+    }
+
+    // Check every entry before reading any, so a bad table cannot leave the sweep part way through
+    for (size_t i = 0; i < count; i++) {
+        const int32_t *entry = &table[i * ENTRY_SIZE];
+        if (entry[ENTRY_ADDRESS] < 0 || entry[ENTRY_ADDRESS] >= NUM_ADDRESSES) {
+            mp_raise_ValueError(MP_ERROR_TEXT("address out of range"));
+        }
+        if (entry[ENTRY_STATE] < 0 || entry[ENTRY_STATE] > UINT16_MAX) {
+            mp_raise_ValueError(MP_ERROR_TEXT("state only supports 16 bits"));
+        }
+        if (entry[ENTRY_SAMPLES] < 1) {
+            mp_raise_ValueError(MP_ERROR_TEXT("samples must be 1 or greater"));
+        }
+        if (max != NULL && entry[ENTRY_SLOT] >= (int32_t)slots) {
+            mp_raise_ValueError(MP_ERROR_TEXT("slot out of range"));
+        }
+    }
+
+    // Read each address due this tick. Those not due keep their reading from the last time they were
+    for (size_t i = 0; i < count; i++) {
+        const int32_t *entry = &table[i * ENTRY_SIZE];
+        int32_t address = entry[ENTRY_ADDRESS];
+        if (due & (1 << address)) {
+            tca_lock();
+            tca_change_output_mask(chip, io_mask, entry[ENTRY_STATE]);
+            tca_unlock();
+            values[address] = read_u16(channel, entry[ENTRY_SAMPLES]);
+        }
+    }
+
+    // Return the first entry whose reading is outside of its limits, leaving the caller to handle it
+    for (size_t i = 0; i < count; i++) {
+        const int32_t *entry = &table[i * ENTRY_SIZE];
+        int32_t value = values[entry[ENTRY_ADDRESS]];
+        if (value < entry[ENTRY_LOW] || value > entry[ENTRY_HIGH]) {
+            return MP_OBJ_NEW_SMALL_INT(i);
+        }
+    }
+
+    // Every reading passed, so add them to their accumulators
+    if (max != NULL) {
+        for (size_t i = 0; i < count; i++) {
+            const int32_t *entry = &table[i * ENTRY_SIZE];
+            int32_t slot = entry[ENTRY_SLOT];
+            if (slot >= 0) {
+                int32_t value = values[entry[ENTRY_ADDRESS]];
+                if (value > max[slot]) {
+                    max[slot] = value;
+                }
+                if (value < min[slot]) {
+                    min[slot] = value;
+                }
+                int32_t lo = sum_lo[slot] + value;
+                if (lo >= SUM_SPLIT) {
+                    lo -= SUM_SPLIT;
+                    sum_hi[slot] += 1;
+                }
+                sum_lo[slot] = lo;
+            }
+        }
+    }
+
+    return MP_OBJ_NEW_SMALL_INT(PASSED);
+}
+static MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(yukon_monitor_sweep_obj, 7, 7, yukon_monitor_sweep);
+
+// Define all attributes of the module.
+// Table entries are key/value pairs of the attribute name (a string)
+// and the MicroPython object reference.
+// All identifiers and strings are written as MP_QSTR_xxx and will be
+// optimized to word-sized integers by the build system (interned strings).
+static const mp_rom_map_elem_t yukon_monitor_module_globals_table[] = {
+    { MP_ROM_QSTR(MP_QSTR___name__), MP_ROM_QSTR(MP_QSTR_yukon_monitor) },
+    { MP_ROM_QSTR(MP_QSTR_sweep), &yukon_monitor_sweep_obj },
+    { MP_ROM_QSTR(MP_QSTR_ENTRY_SIZE), MP_ROM_INT(ENTRY_SIZE) },
+    { MP_ROM_QSTR(MP_QSTR_PASSED), MP_ROM_INT(PASSED) },
+};
+static MP_DEFINE_CONST_DICT(yukon_monitor_module_globals, yukon_monitor_module_globals_table);
+
+// Define module object.
+const mp_obj_module_t yukon_monitor_cmodule = {
+    .base = { &mp_type_module },
+    .globals = (mp_obj_dict_t *)&yukon_monitor_module_globals,
+};
+
+// Register the module to make it available in Python.
+MP_REGISTER_MODULE(MP_QSTR_yukon_monitor, yukon_monitor_cmodule);
@@ -4,16 +4,45 @@
 
 import sys
 import time
+import json
 import tca
-from machine import ADC, Pin, I2C
-from pimoroni_yukon.modules import KNOWN_MODULES
+import micropython
+from micropython import const
+from math import log
+from array import array
+from machine import ADC, Pin, I2C, Timer
+from pimoroni_yukon.modules import is_known_module, load_module, signature_table, signature_index, describe_signature
 from pimoroni_yukon.modules.common import ADC_FLOAT, ADC_LOW, ADC_HIGH, YukonModule
 import pimoroni_yukon.logging as logging
 from pimoroni_yukon.errors import OverVoltageError, UnderVoltageError, OverCurrentError, OverTemperatureError, FaultError, VerificationError
-from pimoroni_yukon.timing import ticks_ms, ticks_add, ticks_diff
-from pimoroni_yukon.conversion import u16_to_voltage_in, u16_to_voltage_out, u16_to_current, analog_to_temp
+from pimoroni_yukon.timing import ticks_ms, ticks_add, ticks_diff, idle_us, TickScheduler
+from pimoroni_yukon.conversion import u16_to_voltage_in, u16_to_voltage_out, u16_to_current, u16_to_analog, u16_to_temp, find_u16
+from pimoroni_yukon.readings import RawReadings
+from pimoroni_yukon.recorder import FlightRecorder, FLAGS_PER_MODULE
+from pimoroni_yukon.profiling import StageProfile
+from pimoroni_yukon.inputs import ExpanderInput, begin_snapshot, end_snapshot
 from ucollections import OrderedDict, namedtuple
 
+try:
+    import _thread
+except ImportError:
+    _thread = None  # The second core is not available to the background monitor
+
+try:
+    import yukon_monitor
+except ImportError:
+    yukon_monitor = None    # The firmware has no native monitor, so each tick is swept and checked in Python
+
+# Set to const(1) to have Yukon time each stage of its monitor ticks, for reading with get_profile(). Whilst const(0),
+# MicroPython's compiler removes the timing code, so it costs nothing
+_PROFILE = const(0)
+_STAGE_TICK = const(0)
+_STAGE_SELECT = const(1)
+_STAGE_ADC = const(2)
+_STAGE_CALLBACK = const(3)
+_STAGE_SLOT1 = const(4)     # Followed by the remaining slots
+PROFILE_STAGES = ("tick", "select", "adc", "callback", "slot1", "slot2", "slot3", "slot4", "slot5", "slot6")
+
 
 YUKON_VERSION = "1.0.3"
 
@@ -127,21 +156,43 @@ class Yukon:
     UNDERVOLTAGE_COUNT_LIMIT = 3
 
     DETECTION_SAMPLES = 64
+    DETECTION_BATCH = 8
+    DETECTION_MARGIN = 0.05
     DETECTION_ADC_LOW = 0.2
     DETECTION_ADC_HIGH = 3.2
+    DETECTION_CACHE_FILE = "yukon_detection.json"  # Where verify_and_initialise(use_cache=True) records each slot's module
 
     CURRENT_SENSE_ADDR = 12      # 0b1100
     TEMP_SENSE_ADDR = 13         # 0b1101
     VOLTAGE_OUT_SENSE_ADDR = 14  # 0b1110
     VOLTAGE_IN_SENSE_ADDR = 15   # 0b1111
+    SHARED_ADC_CHANNEL = 3       # The RP2040 ADC channel of the shared analog input
+
+    # The order to visit mux addresses in when sweeping the ADC. This is a Gray code with the mux enable bit
+    # changing only once, so each step toggles as few expander pins as possible
+    SWEEP_ORDER = (0, 1, 3, 2, 6, 7, 5, 4, 12, 13, 15, 14, 10, 11, 9, 8)
+    BOARD_SENSE_ADDRS = (CURRENT_SENSE_ADDR, TEMP_SENSE_ADDR, VOLTAGE_OUT_SENSE_ADDR, VOLTAGE_IN_SENSE_ADDR)
+
+    MONITOR_STANDARD = 0
+    MONITOR_ZERO_ALLOC = 1
+    DEADLINE_CATCH_UP = 0
+    DEADLINE_SKIP = 1
+    DEFAULT_MONITOR_PERIOD_MS = 10              # How often monitor_task() and the background monitor check the sensors
+    DEFAULT_TEMPERATURE_INTERVAL = 1            # How many monitor ticks to sample thermistors every
+    DEFAULT_MODULE_INTERVAL = 1                 # How many monitor ticks to monitor a module every
+    DEFAULT_RECORDER_DEPTH = 64                 # How many monitor ticks the flight recorder keeps
+    DEFAULT_ROLLING_TIME_CONSTANT = 16          # How many readings the rolling moving averages take to respond to a change
 
     OUTPUT_STABLISE_TIMEOUT_US = 200 * 1000     # The time to wait for the output voltage to stablise after being enabled
     OUTPUT_STABLISE_TIME_US = 10 * 1000
+    OUTPUT_STABLISE_SAMPLE_US = OUTPUT_STABLISE_TIME_US // 2    # The time between output voltage samples whilst it stablises
     OUTPUT_STABLISE_V_DIFF = 0.1
 
     OUTPUT_DISSIPATE_TIMEOUT_S = 5              # The time to wait for the voltage to dissipate below the level needed for module detection
     OUTPUT_DISSIPATE_TIMEOUT_US = OUTPUT_DISSIPATE_TIMEOUT_S * 1000 * 1000
     OUTPUT_DISSIPATE_TIME_US = 10 * 1000
+    OUTPUT_DISSIPATE_SAMPLE_US = 20 * 1000      # The time between the output voltage samples used to predict when it will dissipate
+    OUTPUT_PREDICT_MAX_SLEEP_US = 500 * 1000    # The longest to sleep on a prediction before checking the output voltage again
     OUTPUT_DISSIPATE_LEVEL = 2.0                # The voltage below which we can reliably obtain the address of attached modules
 
     def __init__(self, voltage_limit=DEFAULT_VOLTAGE_LIMIT, current_limit=DEFAULT_CURRENT_LIMIT, temperature_limit=DEFAULT_TEMPERATURE_LIMIT, logging_level=logging.LOG_INFO):
@@ -150,7 +201,7 @@ class Yukon:
         self.__temperature_limit = temperature_limit
         logging.level = logging_level
 
-        logging.info(f"> Running Yukon {YUKON_VERSION}, {sys.version.split('; ')[1]}")
+        logging.info(f"> Running Yukon {YUKON_VERSION}, {sys.version.split('; ')[-1]}")
 
         self.__slot_assignments = OrderedDict({
             SLOT1: None,
@@ -167,9 +218,10 @@ class Yukon:
         # Main output enable
         self.__main_en = Pin.board.MAIN_EN
         self.__main_en.init(Pin.OUT, value=False)
+        self.__main_output_on = False   # Whether the main output may be on, for the native monitor to know without reading it
 
         # User/Boot switch
-        self.__sw_boot = Pin.board.USER_SW
+        self.__sw_boot = ExpanderInput(Pin.board.USER_SW)
         self.__sw_boot.init(Pin.IN)
 
         # ADC mux enable pins
@@ -194,10 +246,11 @@ class Yukon:
                                    1 << tca.get_number(Pin.board.ADC_ADDR_3))
         self.__adc_io_mask = self.__adc_io_ens_addrs[0] | self.__adc_io_ens_addrs[1] | \
             self.__adc_io_adc_addrs[0] | self.__adc_io_adc_addrs[1] | self.__adc_io_adc_addrs[2]
+        self.__adc_io_states = tuple(self.__address_state(address) for address in range(16))
 
         # User switches
-        self.__switches = (Pin.board.SW_A,
-                           Pin.board.SW_B)
+        self.__switches = (ExpanderInput(Pin.board.SW_A),
+                           ExpanderInput(Pin.board.SW_B))
         self.__switches[0].init(Pin.IN)
         self.__switches[1].init(Pin.IN)
 
@@ -210,6 +263,61 @@ class Yukon:
         # Shared analog input
         self.__shared_adc = ADC(Pin.board.SHARED_ADC)
 
+        # The detection signature table last used, to know when to report any ambiguous signatures
+        self.__signature_table = None
+
+        # How long (in microseconds) the last detection of each slot took, keyed by slot ID
+        self.__detection_times = {}
+
+        # How often (in monitor ticks) to sample thermistors and monitor each module, with countdowns to their next tick
+        self.__temperature_interval = self.DEFAULT_TEMPERATURE_INTERVAL
+        self.__temperature_countdown = 0
+        self.__thermistors_pending = 0  # A bitmask of the thermistor addresses waiting to be sampled
+        self.__slot_intervals = {}
+        self.__modules_due = 0  # A bitmask of the registered modules to monitor this tick
+
+        # An optional recorder of the last few monitor ticks, to be frozen should a safety trip occur
+        self.__recorder = None
+        self.__recorder_file = None
+        self.__flight_record = None
+
+        # The time constant of the rolling stats kept of each reading, or None if they are not being kept
+        self.__rolling_time_constant = None
+
+        # Timings of each stage of the monitor, when profiling is compiled in
+        self.__profile = StageProfile(PROFILE_STAGES) if _PROFILE else None
+
+        # How late monitor_until_ms() returned after its end times, and what to do with end times that have already passed
+        self.__lateness = StageProfile(("late",), unit="ms")
+        self.__deadlines_missed = 0
+        self.__periods_skipped = 0
+        self.__last_lateness_ms = 0
+        self.__deadline_policy = self.DEADLINE_CATCH_UP
+        self.__deadline_period_ms = 0
+
+        # State for monitoring in the background, from a timer or the second core
+        self.__adc_busy = 0     # Non-zero whilst the ADC is in use, to prevent the background monitor interrupting it
+        self.__adc_lock = None  # Created when first monitoring from the second core, to give one core at a time the ADC
+        self.__adc_owner = None  # The identity of the core holding the lock
+        self.__background_timer = None
+        self.__second_core_running = False
+        self.__second_core_done = True
+        self.__background_pending = False
+        self.__background_error = None
+        self.__background_check_func = self.__background_check  # Bound once, so scheduling it does not allocate memory
+
+        # Raw readings from the last sweep, indexed by mux address
+        self.__sweep_u16 = array('H', [0] * 16)
+        self.__swept = 0    # A bitmask of the addresses whose sweep readings are valid to use
+        self.__sweep_reverse = False
+        self.__native_tables = None     # The sweeps described for the native monitor, built when first needed
+        self.__update_assignments()
+
+        # Readings and limits for monitoring with raw values, so readings are only converted when needed
+        self.__monitor_mode = self.MONITOR_STANDARD
+        self.__raw_readings = RawReadings(("Vi", "Vo", "C", "T"), (u16_to_voltage_in, u16_to_voltage_out, u16_to_current, u16_to_temp))
+        self.__update_raw_limits()
+
         self.__clear_counts_and_readings()
 
         self.__monitor_action_callback = None
@@ -217,6 +325,8 @@ class Yukon:
     def reset(self):
         logging.debug("[Yukon] Resetting")
 
+        self.stop_background_monitor()
+
         # Only disable the output if enabled (avoids duplicate messages)
         if self.is_main_output_enabled() is True:
             self.disable_main_output()
@@ -246,6 +356,19 @@ class Yukon:
 
         return slot
 
+    @staticmethod
+    def __predict_settle_us(first, second, interval_us, target, tolerance):
+        # Fit an RC curve heading towards the target through two readings taken an interval apart, and return how long
+        # after the second reading it will be within tolerance of the target. Returns None if it is not heading there
+        first_gap = first - target
+        second_gap = second - target
+        if abs(second_gap) <= tolerance:
+            return 0
+        if first_gap * second_gap <= 0 or abs(second_gap) >= abs(first_gap):
+            return None
+        tau_us = interval_us / log(first_gap / second_gap)
+        return int(tau_us * log(abs(second_gap) / tolerance))
+
     def __check_output_dissipated(self, message):
         logging.info("> Checking output voltage ...")
         voltage = self.read_output_voltage()
@@ -253,22 +376,40 @@ class Yukon:
         if voltage >= self.OUTPUT_DISSIPATE_LEVEL:
             logging.warn("> Waiting for output voltage to dissipate ...")
 
+            # Rather than polling, sleep until the voltage is predicted to be below the level, from the RC discharge curve
+            # through the last two readings, then confirm it stays below for the required time
             start = time.ticks_us()
-            first_below_time = 0
+            old_time = start
+            wait_us = self.OUTPUT_DISSIPATE_SAMPLE_US
             while True:
+                remaining_us = self.OUTPUT_DISSIPATE_TIMEOUT_US - ticks_diff(time.ticks_us(), start)
+                if remaining_us < 0:
+                    raise FaultError(f"[Yukon] Output voltage did not dissipate in an acceptable time. Aborting {message}")
+                time.sleep_us(min(wait_us, self.OUTPUT_PREDICT_MAX_SLEEP_US, remaining_us + 1))
+
                 new_voltage = self.read_output_voltage()
-                logging.debug(f"Output Voltage = {new_voltage} V")
                 new_time = time.ticks_us()
+                logging.debug(f"Output Voltage = {new_voltage} V")
+
                 if new_voltage < self.OUTPUT_DISSIPATE_LEVEL:
-                    if first_below_time == 0:
-                        first_below_time = new_time
-                    elif ticks_diff(new_time, first_below_time) > self.OUTPUT_DISSIPATE_TIME_US:
+                    time.sleep_us(self.OUTPUT_DISSIPATE_TIME_US)
+                    new_voltage = self.read_output_voltage()
+                    logging.debug(f"Output Voltage = {new_voltage} V")
+                    if new_voltage < self.OUTPUT_DISSIPATE_LEVEL:
                         break
+                    new_time = time.ticks_us()
+                    wait_us = self.OUTPUT_DISSIPATE_SAMPLE_US
                 else:
-                    first_below_time = 0
+                    eta_us = self.__predict_settle_us(voltage, new_voltage, ticks_diff(new_time, old_time), 0, self.OUTPUT_DISSIPATE_LEVEL)
+                    if eta_us is None:
+                        wait_us = self.OUTPUT_DISSIPATE_SAMPLE_US
+                        logging.info(f"> Output voltage at {new_voltage}V, and not yet dissipating")
+                    else:
+                        wait_us = max(eta_us, self.OUTPUT_DISSIPATE_SAMPLE_US)
+                        logging.info(f"> Output voltage at {new_voltage}V, expected to dissipate in {eta_us // 1000}ms")
 
-                if ticks_diff(new_time, start) > self.OUTPUT_DISSIPATE_TIMEOUT_US:
-                    raise FaultError(f"[Yukon] Output voltage did not dissipate in an acceptable time. Aborting {message}")
+                voltage = new_voltage
+                old_time = new_time
 
     def find_slots_with(self, module_type):
         if self.is_main_output_enabled():
@@ -293,24 +434,34 @@ class Yukon:
 
         return slots
 
-    def register_with_slot(self, module, slot):
+    def register_with_slot(self, module, slot, interval=DEFAULT_MODULE_INTERVAL):
         if self.is_main_output_enabled():
             raise RuntimeError("Cannot register modules with slots whilst the main output is active")
 
         slot = self.__check_slot(slot)
 
+        if not isinstance(interval, int) or interval < 1:
+            raise ValueError("interval out of range. Expected 1 or greater")
+
         module_type = type(module)
         if module_type is YukonModule:
             raise ValueError("Cannot register YukonModule")
 
-        if module_type not in KNOWN_MODULES:
-            raise ValueError(f"{module_type} is not a known module. If this is custom module, be sure to include it in the KNOWN_MODULES list.")
+        if not is_known_module(module_type):
+            raise ValueError(f"{module_type} is not a known module. If this is custom module, be sure to register it with `pimoroni_yukon.modules.register_module()`.")
 
-        if self.__slot_assignments[slot] is None:
-            self.__slot_assignments[slot] = module
-        else:
+        if self.__slot_assignments[slot] is not None:
             raise ValueError("The selected slot is already populated")
 
+        # Wait for any monitor tick in progress on the second core, so it does not see the modules part way through changing
+        self.__claim_adc()
+        try:
+            self.__slot_assignments[slot] = module
+            self.__slot_intervals[slot] = interval
+            self.__update_assignments()
+        finally:
+            self.__release_adc()
+
     def deregister_slot(self, slot):
         if self.is_main_output_enabled():
             raise RuntimeError("Cannot deregister module slots whilst the main output is active")
@@ -319,18 +470,33 @@ class Yukon:
 
         module = self.__slot_assignments[slot]
         if module is not None:
-            module.deregister()
-            self.__slot_assignments[slot] = None
+            self.__claim_adc()
+            try:
+                module.deregister()
+                self.__slot_assignments[slot] = None
+                del self.__slot_intervals[slot]
+                self.__update_assignments()
+            finally:
+                self.__release_adc()
 
     def __match_module(self, adc1_level, adc2_level, slow1, slow2, slow3):
-        for m in KNOWN_MODULES:
-            if m.is_module(adc1_level, adc2_level, slow1, slow2, slow3):
-                return m
-        if YukonModule.is_module(adc1_level, adc2_level, slow1, slow2, slow3):
-            return YukonModule
-        return None
+        # Look up which module the signature belongs to, only importing that module's driver. The table is built on first
+        # use, and again if a module is registered, so report any ambiguous signatures whenever it changes
+        table, ambiguous = signature_table()
+        if table is not self.__signature_table:
+            self.__signature_table = table
+            for index, names in ambiguous.items():
+                joined = ", ".join(f"'{name}'" for name in names)
+                logging.warn(f"[Yukon] Modules {joined} share the signature {describe_signature(index)}. Only '{names[0]}' will be detected")
+
+        name = table[signature_index(adc1_level, adc2_level, slow1, slow2, slow3)]
+        return None if name is None else load_module(name)
 
     def __detect_module(self, slot):
+        return self.__detect_signature(slot)[0]
+
+    def __detect_signature(self, slot):
+        # Detect the module in the slot, returning it along with the ADC levels it was detected from
         slow1 = slot.SLOW1
         slow1.init(Pin.IN)
 
@@ -340,20 +506,47 @@ class Yukon:
         slow3 = slot.SLOW3
         slow3.init(Pin.IN)
 
-        adc1_val = self.read_slot_adc1(slot, self.DETECTION_SAMPLES)
-        adc2_val = self.read_slot_adc2(slot, self.DETECTION_SAMPLES)
-
-        logging.debug(f"ADC1 = {adc1_val}, ADC2 = {adc2_val}, SLOW1 = {slow1.value()}, SLOW2 = {slow2.value()}, SLOW3 = {slow3.value()}", end=", ")
-
-        # Convert the ADC voltage to a LOW, FLOAT, or HIGH level
-        adc1_level = ADC_LOW if adc1_val <= self.DETECTION_ADC_LOW else ADC_HIGH if adc1_val >= self.DETECTION_ADC_HIGH else ADC_FLOAT
-        adc2_level = ADC_LOW if adc2_val <= self.DETECTION_ADC_LOW else ADC_HIGH if adc2_val >= self.DETECTION_ADC_HIGH else ADC_FLOAT
+        start = time.ticks_us()
+        adc1_level, adc1_val, adc1_samples = self.__detect_level(slot.ADC1_ADDR)
+        adc2_level, adc2_val, adc2_samples = self.__detect_level(slot.ADC2_THERM_ADDR)
 
         detected = self.__match_module(adc1_level, adc2_level, slow1.value() == 1, slow2.value() == 1, slow3.value() == 1)
 
         self.__deselect_address()
+        self.__detection_times[slot.ID] = ticks_diff(time.ticks_us(), start)
+
+        logging.debug(f"ADC1 = {adc1_val} ({adc1_samples} samples), ADC2 = {adc2_val} ({adc2_samples} samples), SLOW1 = {slow1.value()}, SLOW2 = {slow2.value()}, SLOW3 = {slow3.value()}, Time = {self.__detection_times[slot.ID]}us", end=", ")
+
+        return detected, adc1_level, adc2_level
+
+    def __detect_level(self, address):
+        # Sample the address in batches until the average is clearly within a LOW, FLOAT, or HIGH level, only taking the
+        # full number of samples for readings close to the boundary between two levels
+        self.__claim_adc()
+        try:
+            self.__select_address(address)
+            total = 0
+            samples = 0
+            while samples < self.DETECTION_SAMPLES:
+                batch = min(self.DETECTION_BATCH, self.DETECTION_SAMPLES - samples)
+                for _ in range(batch):
+                    total += self.__shared_adc.read_u16()
+                samples += batch
+
+                voltage = u16_to_analog(total / samples)
+                if abs(voltage - self.DETECTION_ADC_LOW) > self.DETECTION_MARGIN and abs(voltage - self.DETECTION_ADC_HIGH) > self.DETECTION_MARGIN:
+                    break
+        finally:
+            self.__release_adc()
 
-        return detected
+        # Convert the ADC voltage to a LOW, FLOAT, or HIGH level
+        level = ADC_LOW if voltage <= self.DETECTION_ADC_LOW else ADC_HIGH if voltage >= self.DETECTION_ADC_HIGH else ADC_FLOAT
+        return level, voltage, samples
+
+    def detection_time_us(self, slot):
+        # Return how long the last detection of the given slot took, or None if it has not been detected
+        slot = self.__check_slot(slot)
+        return self.__detection_times.get(slot.ID)
 
     def detect_in_slot(self, slot):
         if self.is_main_output_enabled():
@@ -380,7 +573,84 @@ class Yukon:
 
         return [self.__check_slot(slot_list)]
 
-    def __verify_modules(self, allow_unregistered, allow_undetected, allow_discrepencies, allow_no_modules):
+    def __slot_signatures(self):
+        # Read the SLOW pin levels of every slot, with a single input port read of each expander, as a cheap
+        # way of telling whether the module in a slot may have changed
+        chips = {}
+        for slot in self.__slot_assignments.keys():
+            for pin in (slot.SLOW1, slot.SLOW2, slot.SLOW3):
+                pin.init(Pin.IN)
+                chips[tca.get_chip(pin)] = None
+
+        for chip in chips:
+            chips[chip] = tca.read_input(chip)
+
+        signatures = {}
+        for slot in self.__slot_assignments.keys():
+            signature = 0
+            for i, pin in enumerate((slot.SLOW1, slot.SLOW2, slot.SLOW3)):
+                signature |= ((chips[tca.get_chip(pin)] >> tca.get_number(pin)) & 1) << i
+            signatures[slot] = signature
+        return signatures
+
+    def __load_detection_cache(self):
+        try:
+            with open(self.DETECTION_CACHE_FILE) as f:
+                cache = json.load(f)
+            if cache.get("version") == YUKON_VERSION:
+                return cache["slots"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+        return {}
+
+    def __save_detection_cache(self, slots):
+        try:
+            with open(self.DETECTION_CACHE_FILE, "w") as f:
+                json.dump({"version": YUKON_VERSION, "slots": slots}, f)
+        except OSError as e:
+            logging.warn(f"> Unable to save the detection cache: {e}")
+
+    def clear_detection_cache(self):
+        import os
+        try:
+            os.remove(self.DETECTION_CACHE_FILE)
+        except OSError:
+            pass
+
+    def __cached_levels_match(self, slot, signature, adc1_level, adc2_level):
+        # Check the ADC levels of a slot against those cached, for SLOW signatures that more than one module shares.
+        # Only the ADCs that tell those modules apart are read, so a swapped module is not mistaken for the cached one
+        table = signature_table()[0]
+        slow1, slow2, slow3 = signature & 1, (signature >> 1) & 1, (signature >> 2) & 1
+        cached = table[signature_index(adc1_level, adc2_level, slow1, slow2, slow3)]
+        check_adc1 = False
+        check_adc2 = False
+        for level in (ADC_LOW, ADC_HIGH, ADC_FLOAT):
+            if table[signature_index(level, adc2_level, slow1, slow2, slow3)] != cached:
+                check_adc1 = True
+            if table[signature_index(adc1_level, level, slow1, slow2, slow3)] != cached:
+                check_adc2 = True
+
+        try:
+            if check_adc1 and self.__detect_level(slot.ADC1_ADDR)[0] != adc1_level:
+                return False
+            if check_adc2 and self.__detect_level(slot.ADC2_THERM_ADDR)[0] != adc2_level:
+                return False
+        finally:
+            if check_adc1 or check_adc2:
+                self.__deselect_address()
+        return True
+
+    def __cached_module(self, name):
+        # Find the module type with the given name, returning False if it is not known
+        if name is None:
+            return None
+        try:
+            return load_module(name)
+        except ValueError:
+            return False
+
+    def __verify_modules(self, allow_unregistered, allow_undetected, allow_discrepencies, allow_no_modules, use_cache):
         # Take the allowed parameters and expand them into slot lists that are easier to compare against
         allow_unregistered = self.__expand_slot_list(allow_unregistered)
         allow_undetected = self.__expand_slot_list(allow_undetected)
@@ -391,9 +661,32 @@ class Yukon:
         raise_discrepency = False
         unregistered_slots = 0
 
+        if use_cache:
+            cache = self.__load_detection_cache()
+            new_cache = {}
+            signatures = self.__slot_signatures()
+
         for slot, module in self.__slot_assignments.items():
             logging.info(f"[Slot{slot.ID}]", end=" ")
-            detected = self.__detect_module(slot)
+            if use_cache:
+                # Only detect the module if the slot's signature has changed since it was cached. Where the SLOW
+                # levels alone could belong to another module, the ADC levels that tell them apart are checked too
+                key = str(slot.ID)
+                entry = cache.get(key)
+                detected = False
+                if isinstance(entry, list) and len(entry) == 4 and entry[0] == signatures[slot]:
+                    adc1_level, adc2_level = entry[2], entry[3]
+                    if self.__cached_levels_match(slot, signatures[slot], adc1_level, adc2_level):
+                        detected = self.__cached_module(entry[1])
+
+                if detected is False:
+                    detected, adc1_level, adc2_level = self.__detect_signature(slot)
+                else:
+                    logging.debug(f"SLOW signature = {signatures[slot]}, using cached detection", end=", ")
+
+                new_cache[key] = [signatures[slot], None if detected is None else detected.__name__, adc1_level, adc2_level]
+            else:
+                detected = self.__detect_module(slot)
 
             if detected is None:
                 if module is not None:
@@ -429,9 +722,12 @@ class Yukon:
         if raise_unregistered:
             raise VerificationError("Detected modules that have not been registered with Yukon, which could behave unexpectedly when connected to power. Please register these modules with Yukon using `.register_with_slot()`, disconnect them from your board, or disable this warning with `allow_unregistered=True`.")
 
+        if use_cache and new_cache != cache:
+            self.__save_detection_cache(new_cache)
+
         logging.info()  # New line
 
-    def verify_and_initialise(self, allow_unregistered=False, allow_undetected=False, allow_discrepencies=False, allow_no_modules=False):
+    def verify_and_initialise(self, allow_unregistered=False, allow_undetected=False, allow_discrepencies=False, allow_no_modules=False, use_cache=False):
         if self.is_main_output_enabled():
             raise RuntimeError("Cannot verify modules whilst the main output is active")
 
@@ -439,13 +735,14 @@ class Yukon:
 
         logging.info("> Verifying modules")
 
-        self.__verify_modules(allow_unregistered, allow_undetected, allow_discrepencies, allow_no_modules)
+        self.__verify_modules(allow_unregistered, allow_undetected, allow_discrepencies, allow_no_modules, use_cache)
 
         logging.info("> Initialising modules")
 
         for slot, module in self.__slot_assignments.items():
             if module is not None:
                 logging.info(f"[Slot{slot.ID} '{module.NAME}'] Initialising ... ", end="")
+                module.assign_raw_adc_funcs(self.read_slot_adc1_u16, self.read_slot_adc2_u16)
                 module.initialise(slot, self.read_slot_adc1, self.read_slot_adc2)
                 logging.info("done")
 
@@ -502,13 +799,15 @@ class Yukon:
 
             start = time.ticks_us()
 
+            # The last three output voltage readings, taken OUTPUT_STABLISE_SAMPLE_US apart
+            oldest_voltage = None
             old_voltage = self.read_output_voltage()
-            first_stable_time = 0
             new_voltage = 0
 
             logging.info("> Enabling output ...")
             self.__enable_main_output()
             while True:
+                time.sleep_us(self.OUTPUT_STABLISE_SAMPLE_US)
                 new_voltage = self.read_output_voltage()
                 if new_voltage > self.__voltage_limit:  # User limit cannot be beyond the absolute max, so this check is fine
                     self.disable_main_output()
@@ -517,19 +816,31 @@ class Yukon:
                     else:
                         raise OverVoltageError(f"[Yukon] Output voltage of {new_voltage}V exceeded the user set limit of {self.__voltage_limit}V! Turning off output")
 
-                new_time = time.ticks_us()
-                if abs(new_voltage - old_voltage) < self.OUTPUT_STABLISE_V_DIFF:
-                    if first_stable_time == 0:
-                        first_stable_time = new_time
-                    elif ticks_diff(new_time, first_stable_time) > self.OUTPUT_STABLISE_TIME_US:
-                        break
-                else:
-                    first_stable_time = 0
-
-                if ticks_diff(new_time, start) > self.OUTPUT_STABLISE_TIMEOUT_US:
+                if ticks_diff(time.ticks_us(), start) > self.OUTPUT_STABLISE_TIMEOUT_US:
                     self.disable_main_output()
                     raise FaultError("[Yukon] Output voltage did not stablise in an acceptable time. Turning off output")
 
+                if oldest_voltage is not None:
+                    # Work out where the voltage is heading from the slope of the last three readings, as an RC curve
+                    # slows by the same ratio each interval. Sleep until it is predicted to be within OUTPUT_STABLISE_V_DIFF
+                    # of there, then start a new set of readings to confirm it
+                    old_diff = old_voltage - oldest_voltage
+                    new_diff = new_voltage - old_voltage
+                    if abs(old_diff) < self.OUTPUT_STABLISE_V_DIFF and abs(new_diff) < self.OUTPUT_STABLISE_V_DIFF:
+                        break
+
+                    ratio = new_diff / old_diff if old_diff != 0 else 0
+                    if 0 < ratio < 1:
+                        target = new_voltage + (new_diff * ratio) / (1 - ratio)
+                        wait_us = self.__predict_settle_us(old_voltage, new_voltage, self.OUTPUT_STABLISE_SAMPLE_US, target, self.OUTPUT_STABLISE_V_DIFF)
+                        if wait_us is not None and wait_us > self.OUTPUT_STABLISE_SAMPLE_US:
+                            remaining_us = self.OUTPUT_STABLISE_TIMEOUT_US - ticks_diff(time.ticks_us(), start)
+                            time.sleep_us(max(min(wait_us - self.OUTPUT_STABLISE_SAMPLE_US, remaining_us), 0))
+                            oldest_voltage = None
+                            old_voltage = None
+                            continue
+
+                oldest_voltage = old_voltage
                 old_voltage = new_voltage
 
             # Short Circuit
@@ -547,10 +858,13 @@ class Yukon:
             logging.info("> Output enabled")
 
     def __enable_main_output(self):
+        # Have the native monitor check for a short circuit before the output turns on, and only stop once it is off
+        self.__main_output_on = True
         self.__main_en.value(True)
 
     def disable_main_output(self):
         self.__main_en.value(False)
+        self.__main_output_on = False
         logging.info("> Output disabled")
 
     def is_main_output_enabled(self):
@@ -561,62 +875,394 @@ class Yukon:
         state = self.__adc_io_ens_addrs[0] | self.__adc_io_ens_addrs[1]
         tca.change_output_mask(self.__adc_io_chip, self.__adc_io_mask, state)
 
+    def __claim_adc(self):
+        # Mark the ADC as in use. Whilst monitoring from the second core, this also waits for the other core to finish with it
+        lock = self.__adc_lock
+        if lock is not None and self.__adc_owner != _thread.get_ident():
+            lock.acquire()
+            self.__adc_owner = _thread.get_ident()
+        self.__adc_busy += 1
+
+    def __release_adc(self):
+        self.__adc_busy -= 1
+        if self.__adc_busy == 0 and self.__adc_owner is not None:
+            self.__adc_owner = None
+            self.__adc_lock.release()
+
+    def __address_state(self, address):
+        # The expander outputs that select the given address on the muxes
+        state = 0x0000
+
+        if address & 0b0001 > 0:
+            state |= self.__adc_io_adc_addrs[0]
+
+        if address & 0b0010 > 0:
+            state |= self.__adc_io_adc_addrs[1]
+
+        if address & 0b0100 > 0:
+            state |= self.__adc_io_adc_addrs[2]
+
+        if address & 0b1000 > 0:
+            state |= self.__adc_io_ens_addrs[0]
+        else:
+            state |= self.__adc_io_ens_addrs[1]
+
+        return state
+
     def __select_address(self, address):
         if address < 0:
             raise ValueError("address is less than zero")
         elif address > 0b1111:
             raise ValueError("address is greater than number of available addresses")
         else:
-            state = 0x0000
-
-            if address & 0b0001 > 0:
-                state |= self.__adc_io_adc_addrs[0]
-
-            if address & 0b0010 > 0:
-                state |= self.__adc_io_adc_addrs[1]
-
-            if address & 0b0100 > 0:
-                state |= self.__adc_io_adc_addrs[2]
-
-            if address & 0b1000 > 0:
-                state |= self.__adc_io_ens_addrs[0]
-            else:
-                state |= self.__adc_io_ens_addrs[1]
-
-            tca.change_output_mask(self.__adc_io_chip, self.__adc_io_mask, state)
+            if _PROFILE:
+                start = time.ticks_us()
+            tca.change_output_mask(self.__adc_io_chip, self.__adc_io_mask, self.__adc_io_states[address])
+            if _PROFILE:
+                self.__profile.add(_STAGE_SELECT, ticks_diff(time.ticks_us(), start))
 
+    @micropython.native
     def __shared_adc_u16(self, samples=1):
         val = 0
         for _ in range(samples):
             val += self.__shared_adc.read_u16()
         return val / samples
 
-    def __shared_adc_voltage(self, samples=1):
-        return (self.__shared_adc_u16(samples) * 3.3) / 65535  # This has been checked to be correct
+    def __address_u16(self, address, samples=1):
+        # Prevent the background monitor from changing the address between it being selected and read. This is claimed
+        # before the sweep is checked, as the sweep is only valid during the tick of whichever core holds the ADC. The
+        # other core waits here for that tick to end, by which time the sweep has been invalidated, so reads afresh
+        self.__claim_adc()
+        try:
+            # Use the reading from this monitor tick's sweep if there is one, otherwise read the address directly
+            if samples == 1 and self.__swept & (1 << address):
+                return self.__sweep_u16[address]
+
+            self.__select_address(address)
+            if _PROFILE:
+                start = time.ticks_us()
+                value = self.__shared_adc.read_u16() if samples == 1 else self.__shared_adc_u16(samples)
+                self.__profile.add(_STAGE_ADC, ticks_diff(time.ticks_us(), start))
+                return value
+            if samples == 1:
+                return self.__shared_adc.read_u16()
+            return self.__shared_adc_u16(samples)
+        finally:
+            self.__release_adc()
+
+    def __update_assignments(self):
+        # Record the registered modules, and work out which addresses the monitor needs from them and the board's sensors
+        mask = 0
+        for address in self.BOARD_SENSE_ADDRS:
+            mask |= 1 << address
+        thermistor_mask = 1 << self.TEMP_SENSE_ADDR
+
+        modules = []
+        slot_ids = []
+        intervals = []
+        module_masks = []
+        for slot, module in self.__slot_assignments.items():
+            if module is not None:
+                module_mask = 0
+                if module.MONITOR_ADC1:
+                    module_mask |= 1 << slot.ADC1_ADDR
+                if module.MONITOR_ADC2:
+                    module_mask |= 1 << slot.ADC2_THERM_ADDR
+                    if module.ADC2_THERMISTOR:
+                        thermistor_mask |= 1 << slot.ADC2_THERM_ADDR
+
+                modules.append(module)
+                slot_ids.append(slot.ID)
+                intervals.append(self.__slot_intervals[slot])
+                module_masks.append(module_mask)
+                mask |= module_mask
+
+        self.__registered_modules = tuple(modules)
+        self.__module_slot_ids = tuple(slot_ids)
+        self.__module_intervals = tuple(intervals)
+        self.__module_masks = tuple(module_masks)
+        self.__module_countdowns = array('H', [0] * len(modules))
+        self.__thermistor_mask = thermistor_mask
+        self.__sweep_mask = mask
+        self.__sweep_order = tuple(address for address in self.SWEEP_ORDER if mask & (1 << address))
+        self.__sweep_order_reversed = tuple(reversed(self.__sweep_order))
+        self.__native_tables = None
+        self.__restart_intervals()
+        self.__configure_recorder()
+        self.__configure_rolling()
+
+    def __configure_recorder(self):
+        # Have the recorder store Yukon's sensors, the sensors each module monitors, and each module's flags
+        if self.__recorder is None:
+            return
+
+        channels = [("Vi", self.VOLTAGE_IN_SENSE_ADDR, u16_to_voltage_in),
+                    ("Vo", self.VOLTAGE_OUT_SENSE_ADDR, u16_to_voltage_out),
+                    ("C", self.CURRENT_SENSE_ADDR, u16_to_current),
+                    ("T", self.TEMP_SENSE_ADDR, u16_to_temp)]
+        flag_names = []
+        for slot, module in self.__slot_assignments.items():
+            if module is not None:
+                if module.MONITOR_ADC1:
+                    channels.append((f"S{slot.ID}_ADC1", slot.ADC1_ADDR, u16_to_analog))
+                if module.MONITOR_ADC2:
+                    channels.append((f"S{slot.ID}_ADC2", slot.ADC2_THERM_ADDR, u16_to_temp if module.ADC2_THERMISTOR else u16_to_analog))
+
+                names = [None] * FLAGS_PER_MODULE
+                view = module.get_readings_view()
+                if view is not None:
+                    for i in range(min(len(view.flags), FLAGS_PER_MODULE)):
+                        names[i] = f"S{slot.ID}_{view.keys()[i]}"
+                flag_names.extend(names)
+
+        self.__recorder.configure(channels, flag_names)
+
+    def enable_flight_recorder(self, depth=DEFAULT_RECORDER_DEPTH, dump_file=None):
+        # Record the readings of the last few monitor ticks, to be attached to the error of any safety trip,
+        # and optionally saved to a file. The recorder's memory is allocated here, so recording does not allocate
+        recorder = FlightRecorder(depth)
+        self.__claim_adc()
+        try:
+            self.__recorder = recorder
+            self.__recorder_file = dump_file
+            self.__configure_recorder()
+        finally:
+            self.__release_adc()
+
+    def disable_flight_recorder(self):
+        self.__claim_adc()
+        try:
+            self.__recorder = None
+            self.__recorder_file = None
+        finally:
+            self.__release_adc()
+
+    def is_flight_recording(self):
+        return self.__recorder is not None
+
+    def last_flight_record(self):
+        return self.__flight_record
+
+    def __record_flags(self):
+        # Gather the latest flags of each module into the recorder's newest tick
+        bits = 0
+        shift = 0
+        for module in self.__registered_modules:
+            view = module.get_readings_view()
+            if view is not None:
+                latest = view.latest
+                for i in range(min(len(latest), FLAGS_PER_MODULE)):
+                    if latest[i]:
+                        bits |= 1 << (shift + i)
+            shift += FLAGS_PER_MODULE
+        self.__recorder.set_flags(bits)
+
+    def __freeze_flight_record(self, error):
+        # Keep what led up to a safety trip, attaching it to the error and saving it if a file was given
+        record = self.__recorder.freeze()
+        self.__flight_record = record
+        try:
+            error.flight_record = record
+        except AttributeError:
+            pass    # Not all errors accept new attributes, but the record is still available from last_flight_record()
+
+        if self.__recorder_file is not None:
+            try:
+                record.save(self.__recorder_file)
+                logging.warn(f"> Flight record saved to '{self.__recorder_file}'")
+            except OSError as e:
+                logging.warn(f"> Could not save the flight record: {e}")
+
+    def __configure_rolling(self):
+        # Have each registered module keep rolling stats if Yukon is, so modules registered later also keep them
+        if self.__rolling_time_constant is None:
+            return
+
+        for module in self.__registered_modules:
+            view = module.get_readings_view()
+            if view is not None:
+                view.enable_rolling(self.__rolling_time_constant)
+
+    def enable_rolling_stats(self, time_constant=DEFAULT_ROLLING_TIME_CONSTANT):
+        # Keep a moving average, standard deviation and percentiles of each reading, that are not cleared along with
+        # the other readings, for Yukon and its registered modules. The time constant is in readings (normally monitor ticks),
+        # and is rounded to the nearest power of two
+        self.__claim_adc()
+        try:
+            self.__rolling_time_constant = time_constant
+            self.__raw_readings.enable_rolling(time_constant)
+            self.__configure_rolling()
+        finally:
+            self.__release_adc()
+
+    def disable_rolling_stats(self):
+        self.__claim_adc()
+        try:
+            self.__rolling_time_constant = None
+            self.__raw_readings.disable_rolling()
+            for module in self.__registered_modules:
+                view = module.get_readings_view()
+                if view is not None:
+                    view.disable_rolling()
+        finally:
+            self.__release_adc()
+
+    def is_keeping_rolling_stats(self):
+        return self.__rolling_time_constant is not None
+
+    def reset_rolling_stats(self):
+        self.__claim_adc()
+        try:
+            self.__raw_readings.reset_rolling()
+            for module in self.__registered_modules:
+                view = module.get_readings_view()
+                if view is not None:
+                    view.reset_rolling()
+        finally:
+            self.__release_adc()
+
+    def get_profile(self):
+        # Return the timings of each stage of the monitor since profiling was last cleared, keyed by stage name
+        if not _PROFILE:
+            raise RuntimeError("Profiling is not compiled in. Set `_PROFILE = const(1)` at the top of pimoroni_yukon/__init__.py, in a copy of the library on Yukon's filesystem, to enable it")
+        return self.__profile.report()
+
+    def clear_profile(self):
+        if _PROFILE:
+            self.__profile.clear()
+
+    def sweep_adcs(self):
+        return self.__sweep(self.__sweep_mask)
+
+    def __sweep(self, due):
+        # Alternate the direction of each sweep, so it starts at the address the last one finished on
+        order = self.__sweep_order_reversed if self.__sweep_reverse else self.__sweep_order
+        self.__sweep_reverse = not self.__sweep_reverse
+
+        self.__claim_adc()
+        try:
+            for address in order:
+                if due & (1 << address):
+                    self.__select_address(address)
+                    if _PROFILE:
+                        start = time.ticks_us()
+                    self.__sweep_u16[address] = self.__shared_adc.read_u16()
+                    if _PROFILE:
+                        self.__profile.add(_STAGE_ADC, ticks_diff(time.ticks_us(), start))
+        finally:
+            self.__release_adc()
+
+        return self.__sweep_u16
+
+    def __build_native_tables(self):
+        # Describe the sweep in each direction as a table for the native monitor. Each entry is the address, the expander
+        # outputs that select it, the samples to average, the lowest and highest raw readings that pass, and the
+        # accumulator to add the reading to (or -1 for none). The board's sensors get the limits checked by __monitor(),
+        # whilst module readings always pass, as the modules check those themselves. The output voltage is only checked
+        # whilst the main output is on, as it is below the short circuit level whilst off, so tables are built for both
+        tables = []
+        for output_on in (False, True):
+            limits = {
+                self.VOLTAGE_IN_SENSE_ADDR: (self.__raw_voltage_lower_limit, self.__raw_voltage_limit - 1, 0),
+                self.VOLTAGE_OUT_SENSE_ADDR: (self.__raw_voltage_out_short_level if output_on else 0, 0xFFFF, 1),
+                self.CURRENT_SENSE_ADDR: (0, self.__raw_current_limit - 1, 2),
+                self.TEMP_SENSE_ADDR: (self.__raw_temperature_limit, 0xFFFF, 3)  # Higher readings are cooler
+            }
+            for order in (self.__sweep_order, self.__sweep_order_reversed):
+                entries = []
+                for address in order:
+                    low, high, slot = limits.get(address, (0, 0xFFFF, -1))
+                    entries.extend((address, self.__adc_io_states[address], 1, low, high, slot))
+                tables.append(array('i', entries))
+        self.__native_tables = tuple(tables)
+
+    def __native_sweep(self, due):
+        # Have the native monitor sweep the addresses due this tick, in alternating directions like __sweep(), and check
+        # the board's sensors. Returns True if they all passed, or False for __monitor() to check them (and raise) in Python
+        if self.__native_tables is None:
+            self.__build_native_tables()
+        index = 2 if self.__main_output_on else 0
+        if self.__sweep_reverse:
+            index += 1
+        table = self.__native_tables[index]
+        self.__sweep_reverse = not self.__sweep_reverse
+
+        result = yukon_monitor.sweep(self.__adc_io_chip, self.__adc_io_mask, self.SHARED_ADC_CHANNEL, table, due,
+                                     self.__sweep_u16, self.__raw_readings.accumulators())
+        return result == yukon_monitor.PASSED
+
+    def __schedule_tick(self):
+        # Work out which addresses to sweep and which modules to monitor this tick, returning the former.
+        # Addresses not swept keep their reading from the last tick they were
+        due = self.__sweep_mask
+
+        # Every temperature interval, have each thermistor sampled the next time its module is monitored
+        if self.__temperature_countdown == 0:
+            self.__temperature_countdown = self.__temperature_interval - 1
+            self.__thermistors_pending = self.__thermistor_mask
+        else:
+            self.__temperature_countdown -= 1
+
+        modules_due = 0
+        countdowns = self.__module_countdowns
+        for i in range(len(countdowns)):
+            if countdowns[i] == 0:
+                countdowns[i] = self.__module_intervals[i] - 1
+                modules_due |= 1 << i
+            else:
+                countdowns[i] -= 1
+                due &= ~self.__module_masks[i]
+
+        due &= ~(self.__thermistor_mask & ~self.__thermistors_pending)
+        self.__thermistors_pending &= ~due
+
+        self.__modules_due = modules_due
+        return due
+
+    def __restart_intervals(self):
+        # Have the next tick sample every sensor and monitor every module
+        self.__temperature_countdown = 0
+        countdowns = self.__module_countdowns
+        for i in range(len(countdowns)):
+            countdowns[i] = 0
+
+    def set_temperature_interval(self, interval):
+        if not isinstance(interval, int) or interval < 1:
+            raise ValueError("interval out of range. Expected 1 or greater")
+
+        self.__claim_adc()
+        try:
+            self.__temperature_interval = interval
+            self.__restart_intervals()
+        finally:
+            self.__release_adc()
+
+    def get_temperature_interval(self):
+        return self.__temperature_interval
 
     def read_input_voltage(self, samples=1):
-        self.__select_address(self.VOLTAGE_IN_SENSE_ADDR)
-        return u16_to_voltage_in(self.__shared_adc_u16(samples))
+        return u16_to_voltage_in(self.__address_u16(self.VOLTAGE_IN_SENSE_ADDR, samples))
 
     def read_output_voltage(self, samples=1):
-        self.__select_address(self.VOLTAGE_OUT_SENSE_ADDR)
-        return u16_to_voltage_out(self.__shared_adc_u16(samples))
+        return u16_to_voltage_out(self.__address_u16(self.VOLTAGE_OUT_SENSE_ADDR, samples))
 
     def read_current(self, samples=1):
-        self.__select_address(self.CURRENT_SENSE_ADDR)
-        return u16_to_current(self.__shared_adc_u16(samples))
+        return u16_to_current(self.__address_u16(self.CURRENT_SENSE_ADDR, samples))
 
     def read_temperature(self, samples=1):
-        self.__select_address(self.TEMP_SENSE_ADDR)
-        return analog_to_temp(self.__shared_adc_voltage(samples))
+        return u16_to_temp(self.__address_u16(self.TEMP_SENSE_ADDR, samples))
 
     def read_slot_adc1(self, slot, samples=1):
-        self.__select_address(slot.ADC1_ADDR)
-        return self.__shared_adc_voltage(samples)
+        return u16_to_analog(self.__address_u16(slot.ADC1_ADDR, samples))
 
     def read_slot_adc2(self, slot, samples=1):
-        self.__select_address(slot.ADC2_THERM_ADDR)
-        return self.__shared_adc_voltage(samples)
+        return u16_to_analog(self.__address_u16(slot.ADC2_THERM_ADDR, samples))
+
+    def read_slot_adc1_u16(self, slot, samples=1):
+        return int(self.__address_u16(slot.ADC1_ADDR, samples))
+
+    def read_slot_adc2_u16(self, slot, samples=1):
+        return int(self.__address_u16(slot.ADC2_THERM_ADDR, samples))
 
     def assign_monitor_action(self, callback_function):
         if not None and not callable(callback_function):
@@ -624,110 +1270,452 @@ class Yukon:
 
         self.__monitor_action_callback = callback_function
 
-    def monitor(self, under_voltage_counter=UNDERVOLTAGE_COUNT_LIMIT):
-        voltage_in = self.read_input_voltage()
+    def change_monitor_mode(self, mode):
+        if mode != self.MONITOR_STANDARD and mode != self.MONITOR_ZERO_ALLOC:
+            raise ValueError("mode out of range. Expected MONITOR_STANDARD (0) or MONITOR_ZERO_ALLOC (1)")
 
-        # Over Voltage
-        if voltage_in > self.__voltage_limit:  # User limit cannot be beyond the absolute max, so this check is fine
-            self.disable_main_output()
-            if voltage_in > self.ABSOLUTE_MAX_VOLTAGE_LIMIT:
-                raise OverVoltageError(f"[Yukon] Input voltage of {voltage_in}V exceeded the maximum of {self.ABSOLUTE_MAX_VOLTAGE_LIMIT}V! Turning off output")
-            else:
-                raise OverVoltageError(f"[Yukon] Input voltage of {voltage_in}V exceeded the user set limit of {self.__voltage_limit}V! Turning off output")
+        self.__claim_adc()
+        try:
+            self.__monitor_mode = mode
+            self.clear_readings()
+        finally:
+            self.__release_adc()
+
+    def get_monitor_mode(self):
+        return self.__monitor_mode
+
+    def voltage_limit(self):
+        return self.__voltage_limit
+
+    def set_voltage_limit(self, volts):
+        self.__voltage_limit = min(volts, self.ABSOLUTE_MAX_VOLTAGE_LIMIT)
+        self.__update_raw_limits()
+
+    def current_limit(self):
+        return self.__current_limit
+
+    def set_current_limit(self, amps):
+        self.__current_limit = amps
+        self.__update_raw_limits()
+
+    def temperature_limit(self):
+        return self.__temperature_limit
+
+    def set_temperature_limit(self, degrees):
+        self.__temperature_limit = degrees
+        self.__update_raw_limits()
+
+    def __update_raw_limits(self):
+        # Convert each limit into the raw reading at which it is crossed, so monitor() can check readings without converting them.
+        # Any monitor tick in progress on the second core is waited for, so it does not check against a mix of old and new limits
+        self.__claim_adc()
+        try:
+            self.__raw_voltage_limit = find_u16(lambda u16: u16_to_voltage_in(u16) > self.__voltage_limit)
+            self.__raw_voltage_lower_limit = find_u16(lambda u16: u16_to_voltage_in(u16) >= self.VOLTAGE_LOWER_LIMIT)
+            self.__raw_voltage_in_short_level = find_u16(lambda u16: u16_to_voltage_in(u16) >= self.VOLTAGE_SHORT_LEVEL)
+            self.__raw_voltage_out_short_level = find_u16(lambda u16: u16_to_voltage_out(u16) >= self.VOLTAGE_SHORT_LEVEL)
+            self.__raw_current_limit = find_u16(lambda u16: u16_to_current(u16) > self.__current_limit)
+            self.__raw_temperature_limit = find_u16(lambda u16: u16_to_temp(u16) <= self.__temperature_limit)  # Higher readings are cooler
+            self.__native_tables = None
+        finally:
+            self.__release_adc()
 
-        # Under Voltage
-        if voltage_in < self.VOLTAGE_LOWER_LIMIT:
-            self.__undervoltage_count += 1
-            if self.__undervoltage_count > under_voltage_counter or voltage_in < self.VOLTAGE_SHORT_LEVEL:
-                self.disable_main_output()
-                raise UnderVoltageError(f"[Yukon] Input voltage of {voltage_in}V below minimum operating level of {self.VOLTAGE_LOWER_LIMIT}V. Turning off output")
-        else:
+    def monitor(self, under_voltage_counter=UNDERVOLTAGE_COUNT_LIMIT):
+        # Raise any error that stopped the background monitor, so a program that monitors is told of it straight away,
+        # rather than only once it calls check_background_monitor()
+        if self.__background_error is not None:
+            self.check_background_monitor()
+
+        # Read every sensor needed by this tick in a single pass, for the checks below to use
+        if _PROFILE:
+            tick_start = time.ticks_us()
+        self.__claim_adc()
+        try:
+            # Sweep natively if the firmware supports it, unless profiling, which needs each stage of the sweep timed
+            if yukon_monitor is not None and not _PROFILE:
+                checked = self.__native_sweep(self.__schedule_tick())
+            else:
+                self.__sweep(self.__schedule_tick())
+                checked = False
+            self.__swept = self.__sweep_mask
+            begin_snapshot(self.__adc_owner)    # Have the module checks share a single read of each expander's inputs
+            if self.__recorder is None:
+                self.__monitor(under_voltage_counter, checked)
+            else:
+                self.__recorder.record(self.__sweep_u16)
+                try:
+                    self.__monitor(under_voltage_counter, checked)
+                except (OverVoltageError, UnderVoltageError, OverCurrentError, OverTemperatureError, FaultError) as e:
+                    self.__record_flags()   # Include the flags read during this tick, such as the fault that tripped it
+                    self.__freeze_flight_record(e)
+                    raise
+                self.__record_flags()
+        finally:
+            end_snapshot(self.__adc_owner)
+            self.__swept = 0
+            self.__release_adc()
+            if _PROFILE:
+                self.__profile.add(_STAGE_TICK, ticks_diff(time.ticks_us(), tick_start))
+
+    def __monitor(self, under_voltage_counter, checked=False):
+        # The checks compare the raw readings against limits converted ahead of time by __update_raw_limits(),
+        # so readings are only converted into physical units if a limit is exceeded or the monitor action needs them
+        values = self.__sweep_u16
+        voltage_in = values[self.VOLTAGE_IN_SENSE_ADDR]
+        voltage_out = values[self.VOLTAGE_OUT_SENSE_ADDR]
+        current = values[self.CURRENT_SENSE_ADDR]
+        temperature = values[self.TEMP_SENSE_ADDR]
+
+        if checked:
+            # The native monitor found all of the board's sensors within their limits, so none of the checks below would trip
             self.__undervoltage_count = 0
+        else:
+            # Over Voltage
+            if voltage_in >= self.__raw_voltage_limit:  # User limit cannot be beyond the absolute max, so this check is fine
+                self.disable_main_output()
+                voltage_in = u16_to_voltage_in(voltage_in)
+                if voltage_in > self.ABSOLUTE_MAX_VOLTAGE_LIMIT:
+                    raise OverVoltageError(f"[Yukon] Input voltage of {voltage_in}V exceeded the maximum of {self.ABSOLUTE_MAX_VOLTAGE_LIMIT}V! Turning off output")
+                else:
+                    raise OverVoltageError(f"[Yukon] Input voltage of {voltage_in}V exceeded the user set limit of {self.__voltage_limit}V! Turning off output")
 
-        voltage_out = self.read_output_voltage()
+            # Under Voltage
+            if voltage_in < self.__raw_voltage_lower_limit:
+                self.__undervoltage_count += 1
+                if self.__undervoltage_count > under_voltage_counter or voltage_in < self.__raw_voltage_in_short_level:
+                    self.disable_main_output()
+                    raise UnderVoltageError(f"[Yukon] Input voltage of {u16_to_voltage_in(voltage_in)}V below minimum operating level of {self.VOLTAGE_LOWER_LIMIT}V. Turning off output")
+            else:
+                self.__undervoltage_count = 0
 
-        # Only check the output voltage if the main output is enabled
-        if self.is_main_output_enabled():
-            # Short Circuit
-            if voltage_out < self.VOLTAGE_SHORT_LEVEL and voltage_in >= self.VOLTAGE_LOWER_LIMIT:
+            # Short Circuit. Only checked if the main output is enabled, which is read last as it costs an I2C transaction
+            if voltage_out < self.__raw_voltage_out_short_level and voltage_in >= self.__raw_voltage_lower_limit and self.is_main_output_enabled():
                 self.disable_main_output()
-                raise FaultError(f"[Yukon] Possible short circuit! Output voltage was {voltage_out}V whilst the input voltage was {voltage_in}V. Turning off output")
+                raise FaultError(f"[Yukon] Possible short circuit! Output voltage was {u16_to_voltage_out(voltage_out)}V whilst the input voltage was {u16_to_voltage_in(voltage_in)}V. Turning off output")
 
-        # Over Current
-        current = self.read_current()
-        if current > self.__current_limit:
-            self.disable_main_output()
-            raise OverCurrentError(f"[Yukon] Current of {current}A exceeded the user set limit of {self.__current_limit}A! Turning off output")
+            # Over Current
+            if current >= self.__raw_current_limit:
+                self.disable_main_output()
+                raise OverCurrentError(f"[Yukon] Current of {u16_to_current(current)}A exceeded the user set limit of {self.__current_limit}A! Turning off output")
 
-        # Over Temperature
-        temperature = self.read_temperature()
-        if temperature > self.__temperature_limit:
-            self.disable_main_output()
-            raise OverTemperatureError(f"[Yukon] Temperature of {temperature}°C exceeded the user set limit of {self.__temperature_limit}°C! Turning off output")
+            # Over Temperature
+            if temperature < self.__raw_temperature_limit:  # Higher readings are cooler
+                self.disable_main_output()
+                raise OverTemperatureError(f"[Yukon] Temperature of {u16_to_temp(temperature)}°C exceeded the user set limit of {self.__temperature_limit}°C! Turning off output")
 
-        # Run some user action based on the latest readings
+        # Run some user action based on the latest readings. Note that this will allocate memory
         if self.__monitor_action_callback is not None:
-            self.__monitor_action_callback(voltage_in, voltage_out, current, temperature)
-
-        for module in self.__slot_assignments.values():
-            if module is not None:
+            if _PROFILE:
+                start = time.ticks_us()
+            self.__monitor_action_callback(u16_to_voltage_in(voltage_in), u16_to_voltage_out(voltage_out), u16_to_current(current), u16_to_temp(temperature))
+            if _PROFILE:
+                self.__profile.add(_STAGE_CALLBACK, ticks_diff(time.ticks_us(), start))
+
+        # Monitor the modules due this tick, with their zero allocation checks if in that mode
+        fast = self.__monitor_mode == self.MONITOR_ZERO_ALLOC
+        bit = 1
+        for i in range(len(self.__registered_modules)):
+            if self.__modules_due & bit:
+                module = self.__registered_modules[i]
+                if _PROFILE:
+                    start = time.ticks_us()
                 try:
-                    module.monitor()
+                    if fast:
+                        module.fast_monitor()
+                    else:
+                        module.monitor()
                 except Exception:
                     self.disable_main_output()
                     raise  # Now the output is off, let the exception continue into user code
+                if _PROFILE:
+                    self.__profile.add(_STAGE_SLOT1 + self.__module_slot_ids[i] - 1, ticks_diff(time.ticks_us(), start))
+            bit <<= 1
+
+        # Add the board's readings, unless the native monitor already has
+        readings = self.__raw_readings
+        if not checked or readings.accumulators() is None:
+            readings.add(0, voltage_in)
+            readings.add(1, voltage_out)
+            readings.add(2, current)
+            readings.add(3, temperature)
+        readings.tick()
+
+    def monitored_sleep(self, seconds, allowed=None, excluded=None, include_modules=True, rate_hz=None):
+        # Convert and handle the sleep as milliseconds
+        self.monitored_sleep_ms(1000.0 * seconds + 0.5, allowed, excluded, include_modules, rate_hz)
 
-        self.__max_voltage_in = max(voltage_in, self.__max_voltage_in)
-        self.__min_voltage_in = min(voltage_in, self.__min_voltage_in)
-        self.__avg_voltage_in += voltage_in
+    def monitored_sleep_ms(self, ms, allowed=None, excluded=None, include_modules=True, rate_hz=None):
+        if ms < 0:
+            raise ValueError("sleep length must be non-negative")
 
-        self.__max_voltage_out = max(voltage_out, self.__max_voltage_out)
-        self.__min_voltage_out = min(voltage_out, self.__min_voltage_out)
-        self.__avg_voltage_out += voltage_out
+        # Calculate the time this sleep should end at, and monitor until then
+        self.monitor_until_ms(ticks_add(ticks_ms(), int(ms)), allowed, excluded, include_modules, rate_hz)
 
-        self.__max_current = max(current, self.__max_current)
-        self.__min_current = min(current, self.__min_current)
-        self.__avg_current += current
+    def monitor_until_ms(self, end_ms, allowed=None, excluded=None, include_modules=True, rate_hz=None):
+        if end_ms < 0:
+            raise ValueError("end_ms out or range. Must be a value obtained from time.ticks_ms()")
 
-        self.__max_temperature = max(temperature, self.__max_temperature)
-        self.__min_temperature = min(temperature, self.__min_temperature)
-        self.__avg_temperature += temperature
+        end_ms = self.__start_deadline(end_ms)
+        scheduler = None if rate_hz is None else TickScheduler(rate_hz, end_ms)
 
-        self.__count_avg += 1
+        # Clear any readings from previous monitoring attempts
+        self.clear_readings()
+
+        if scheduler is None:
+            # Ensure that at least one monitor check is performed
+            self.monitor()
+            remaining_ms = ticks_diff(end_ms, ticks_ms())
+
+            # Perform any subsequent monitors until the end time is reached
+            while remaining_ms > 0:
+                self.monitor()
+                remaining_ms = ticks_diff(end_ms, ticks_ms())
+        else:
+            # Perform monitors at the given rate, idling between them, until there is not time for another before the end time
+            while True:
+                scheduler.tick_started()
+                self.monitor()
+                scheduler.tick_finished()
+
+                wait_us = scheduler.wait_us()
+                if wait_us < 0:
+                    break
+                idle_us(wait_us)
+
+            self.__report_rate(scheduler)
 
-    def monitored_sleep(self, seconds, allowed=None, excluded=None, include_modules=True):
+        # Process any readings that need it (e.g. averages)
+        self.process_readings()
+
+        if logging.level >= logging.LOG_DEBUG:
+            self.print_readings(allowed, excluded, include_modules)
+
+        self.__end_deadline(end_ms)
+        return end_ms
+
+    async def monitored_sleep_async(self, seconds, allowed=None, excluded=None, include_modules=True, rate_hz=None):
         # Convert and handle the sleep as milliseconds
-        self.monitored_sleep_ms(1000.0 * seconds + 0.5, allowed, excluded, include_modules)
+        await self.monitored_sleep_ms_async(1000.0 * seconds + 0.5, allowed, excluded, include_modules, rate_hz)
 
-    def monitored_sleep_ms(self, ms, allowed=None, excluded=None, include_modules=True):
+    async def monitored_sleep_ms_async(self, ms, allowed=None, excluded=None, include_modules=True, rate_hz=None):
         if ms < 0:
             raise ValueError("sleep length must be non-negative")
 
         # Calculate the time this sleep should end at, and monitor until then
-        self.monitor_until_ms(ticks_add(ticks_ms(), int(ms)), allowed, excluded, include_modules)
+        await self.monitor_until_ms_async(ticks_add(ticks_ms(), int(ms)), allowed, excluded, include_modules, rate_hz)
+
+    async def monitor_until_ms_async(self, end_ms, allowed=None, excluded=None, include_modules=True, rate_hz=None):
+        import asyncio
 
-    def monitor_until_ms(self, end_ms, allowed=None, excluded=None, include_modules=True):
         if end_ms < 0:
             raise ValueError("end_ms out or range. Must be a value obtained from time.ticks_ms()")
 
+        end_ms = self.__start_deadline(end_ms)
+        scheduler = None if rate_hz is None else TickScheduler(rate_hz, end_ms)
+
         # Clear any readings from previous monitoring attempts
         self.clear_readings()
 
-        # Ensure that at least one monitor check is performed
-        self.monitor()
-        remaining_ms = ticks_diff(end_ms, ticks_ms())
-
-        # Perform any subsequent monitors until the end time is reached
-        while remaining_ms > 0:
+        if scheduler is None:
+            # Ensure that at least one monitor check is performed
             self.monitor()
             remaining_ms = ticks_diff(end_ms, ticks_ms())
 
+            # Perform any subsequent monitors until the end time is reached, letting other tasks run between each
+            while remaining_ms > 0:
+                await asyncio.sleep_ms(0)
+                self.monitor()
+                remaining_ms = ticks_diff(end_ms, ticks_ms())
+        else:
+            # Perform monitors at the given rate, letting other tasks run between them, until there is not time for another
+            # before the end time. Waits are rounded to the nearest millisecond, as that is the resolution of asyncio
+            while True:
+                scheduler.tick_started()
+                self.monitor()
+                scheduler.tick_finished()
+
+                wait_us = scheduler.wait_us()
+                if wait_us < 0:
+                    break
+                await asyncio.sleep_ms((wait_us + 500) // 1000)
+
+            self.__report_rate(scheduler)
+
         # Process any readings that need it (e.g. averages)
         self.process_readings()
 
         if logging.level >= logging.LOG_DEBUG:
             self.print_readings(allowed, excluded, include_modules)
 
+        self.__end_deadline(end_ms)
+        return end_ms
+
+    def __report_rate(self, scheduler):
+        # Warn if monitoring could not keep up with the rate asked of it
+        if scheduler.overruns > 0:
+            logging.warn(f"[Yukon] {scheduler.overruns} of {scheduler.ticks} monitor ticks took longer than the {scheduler.period_us}us period of {scheduler.rate_hz}Hz. Achieved {scheduler.achieved_hz():.0f}Hz")
+
+    def __start_deadline(self, end_ms):
+        # Check whether the end time has already passed, such as from the calling loop taking longer than its period,
+        # and if skipping missed deadlines, move the end time on by whole periods so it is back in the future
+        late_ms = ticks_diff(ticks_ms(), end_ms)
+        if late_ms > 0:
+            self.__deadlines_missed += 1
+            if self.__deadline_policy == self.DEADLINE_SKIP:
+                periods = (late_ms // self.__deadline_period_ms) + 1
+                self.__periods_skipped += periods
+                end_ms = ticks_add(end_ms, periods * self.__deadline_period_ms)
+        return end_ms
+
+    def __end_deadline(self, end_ms):
+        # Record how late monitoring finished after its end time
+        late_ms = max(ticks_diff(ticks_ms(), end_ms), 0)
+        self.__last_lateness_ms = late_ms
+        self.__lateness.add(0, late_ms)
+
+    def set_deadline_policy(self, policy, period_ms=None):
+        if policy == self.DEADLINE_SKIP:
+            if not isinstance(period_ms, int) or period_ms <= 0:
+                raise ValueError("period_ms must be an integer greater than zero, to skip missed deadlines by")
+            self.__deadline_period_ms = period_ms
+        elif policy != self.DEADLINE_CATCH_UP:
+            raise ValueError("policy out of range. Expected DEADLINE_CATCH_UP (0) or DEADLINE_SKIP (1)")
+
+        self.__deadline_policy = policy
+
+    def get_deadline_policy(self):
+        return self.__deadline_policy
+
+    def get_deadline_stats(self):
+        # Return how many end times monitoring has been given since the stats were last cleared, how many had already
+        # passed, how many periods were skipped because of that, and how late monitoring finished after each end time
+        late = self.__lateness.report().get("late")
+        stats = OrderedDict({
+            "calls": 0 if late is None else late["count"],
+            "missed": self.__deadlines_missed,
+            "skipped": self.__periods_skipped,
+            "last_late_ms": self.__last_lateness_ms
+        })
+        if late is not None:
+            for key in ("min_ms", "max_ms", "avg_ms", "histogram"):
+                stats["late_" + key] = late[key]
+        return stats
+
+    def clear_deadline_stats(self):
+        self.__lateness.clear()
+        self.__deadlines_missed = 0
+        self.__periods_skipped = 0
+        self.__last_lateness_ms = 0
+
+    async def monitor_task(self, period_ms=DEFAULT_MONITOR_PERIOD_MS):
+        # Monitor the sensors every period until cancelled. Should a limit be exceeded the output is turned off
+        # and the error is raised out of this task, to be caught by whatever is awaiting it (e.g. asyncio.gather)
+        import asyncio
+
+        if period_ms < 0:
+            raise ValueError("period_ms must be non-negative")
+
+        # Clear any readings from previous monitoring attempts
+        self.clear_readings()
+
+        while True:
+            self.monitor()
+            await asyncio.sleep_ms(period_ms)
+
+    def start_background_monitor(self, period_ms=DEFAULT_MONITOR_PERIOD_MS, second_core=False):
+        if period_ms <= 0:
+            raise ValueError("period_ms must be greater than zero")
+
+        if second_core and _thread is None:
+            raise RuntimeError("Cannot monitor from the second core, as this firmware does not support _thread")
+
+        self.stop_background_monitor()
+        self.__background_error = None
+
+        # Allow errors that occur within the timer's interrupt to be reported
+        micropython.alloc_emergency_exception_buf(100)
+
+        # Clear any readings from previous monitoring attempts
+        self.clear_readings()
+
+        if second_core:
+            if self.__adc_lock is None:
+                self.__adc_lock = _thread.allocate_lock()
+            self.__second_core_running = True
+            self.__second_core_done = False
+            _thread.start_new_thread(self.__second_core_monitor, (int(period_ms),))
+        else:
+            self.__background_pending = False
+            self.__background_timer = Timer(mode=Timer.PERIODIC, period=int(period_ms), callback=self.__background_irq)
+
+    def stop_background_monitor(self):
+        if self.__background_timer is not None:
+            self.__background_timer.deinit()
+            self.__background_timer = None
+
+        # Wait for the second core to finish its current tick and stop
+        self.__second_core_running = False
+        while not self.__second_core_done:
+            time.sleep_ms(1)
+
+    def is_background_monitoring(self):
+        return self.__background_timer is not None or self.__second_core_running
+
+    def check_background_monitor(self):
+        # Raise the error that stopped the background monitor, if there was one
+        error = self.__background_error
+        if error is not None:
+            self.__background_error = None
+            raise error
+
+    def __background_irq(self, timer):
+        # Called from the timer's interrupt, so only schedule the checks to be run afterwards, as this does not allocate memory
+        if not self.__background_pending:
+            self.__background_pending = True
+            micropython.schedule(self.__background_check_func, None)
+
+    def __second_core_monitor(self, period_ms):
+        # Runs on the second core, monitoring every period until stopped. The first core waits for any tick in progress
+        # whenever it needs the ADC, but is otherwise left free to run the program
+        next_ms = ticks_ms()
+        try:
+            while self.__second_core_running:
+                try:
+                    self.monitor()
+                except Exception as e:
+                    # The output will already have been turned off, so stop monitoring and record the error for the program
+                    # to raise with check_background_monitor()
+                    self.__second_core_running = False
+                    self.__background_error = e
+                    logging.warn(f"> Background monitoring stopped: {e}")
+                    break
+
+                next_ms = ticks_add(next_ms, period_ms)
+                remaining_ms = ticks_diff(next_ms, ticks_ms())
+                if remaining_ms > 0:
+                    time.sleep_ms(remaining_ms)
+                else:
+                    next_ms = ticks_ms()    # The tick overran its period, so start the next period from now rather than catching up
+        finally:
+            self.__second_core_done = True
+
+    def __background_check(self, _):
+        self.__background_pending = False
+
+        # Skip this check if monitoring was stopped since it was scheduled, or if code using the ADC was interrupted.
+        # In the latter case the next check will happen a period later
+        if self.__background_timer is None or self.__adc_busy > 0:
+            return
+
+        try:
+            self.monitor()
+        except Exception as e:
+            # The output will already have been turned off, so stop monitoring and record the error for the program
+            # to raise with check_background_monitor(), as raising it here could interrupt any part of the program
+            self.stop_background_monitor()
+            self.__background_error = e
+            logging.warn(f"> Background monitoring stopped: {e}")
+
     def monitor_once(self, allowed=None, excluded=None, include_modules=True):
         # Clear any readings from previous monitoring attempts
         self.clear_readings()
@@ -742,7 +1730,7 @@ class Yukon:
             self.print_readings(allowed, excluded, include_modules)
 
     def get_readings(self):
-        return OrderedDict({
+        readings = OrderedDict({
             "Vi_max": self.__max_voltage_in,
             "Vi_min": self.__min_voltage_in,
             "Vi_avg": self.__avg_voltage_in,
@@ -756,6 +1744,8 @@ class Yukon:
             "T_min": self.__min_temperature,
             "T_avg": self.__avg_temperature
         })
+        readings.update(self.__raw_readings.rolling_readings())
+        return readings
 
     def get_formatted_readings(self, allowed=None, excluded=None, include_modules=True):
         text = logging.format_dict("[Yukon]", self.get_readings(), allowed, excluded)
@@ -769,17 +1759,25 @@ class Yukon:
     def print_readings(self, allowed=None, excluded=None, include_modules=True):
         print(self.get_formatted_readings(allowed, excluded, include_modules))
 
+    def get_readings_view(self):
+        return self.__raw_readings
+
     def process_readings(self):
-        if self.__count_avg > 0:
-            self.__avg_voltage_in /= self.__count_avg
-            self.__avg_voltage_out /= self.__count_avg
-            self.__avg_current /= self.__count_avg
-            self.__avg_temperature /= self.__count_avg
-            self.__count_avg = 0    # Clear the count to prevent process readings acting more than once
+        # Convert the raw readings into physical units. This only acts once per set of readings.
+        # The ADC is claimed so that monitoring from the second core cannot add readings part way through
+        self.__claim_adc()
+        try:
+            if self.__raw_readings.process():
+                self.__max_voltage_in, self.__min_voltage_in, self.__avg_voltage_in = self.__raw_readings.stats(0)
+                self.__max_voltage_out, self.__min_voltage_out, self.__avg_voltage_out = self.__raw_readings.stats(1)
+                self.__max_current, self.__min_current, self.__avg_current = self.__raw_readings.stats(2)
+                self.__max_temperature, self.__min_temperature, self.__avg_temperature = self.__raw_readings.stats(3)
 
-        for module in self.__slot_assignments.values():
-            if module is not None:
-                module.process_readings()
+            for module in self.__slot_assignments.values():
+                if module is not None:
+                    module.process_readings()
+        finally:
+            self.__release_adc()
 
     def __clear_counts_and_readings(self):
         self.__undervoltage_count = 0
@@ -800,10 +1798,17 @@ class Yukon:
         self.__min_temperature = float('inf')
         self.__avg_temperature = 0
 
-        self.__count_avg = 0
+        self.__raw_readings.clear()
 
     def clear_readings(self):
-        self.__clear_counts_and_readings()
-        for module in self.__slot_assignments.values():
-            if module is not None:
-                module.clear_readings()
+        # Start each set of readings with a fresh sample of every sensor
+        self.__claim_adc()
+        try:
+            self.__restart_intervals()
+
+            self.__clear_counts_and_readings()
+            for module in self.__slot_assignments.values():
+                if module is not None:
+                    module.clear_readings()
+        finally:
+            self.__release_adc()
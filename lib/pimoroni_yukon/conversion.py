@@ -2,7 +2,9 @@
 #
 # SPDX-License-Identifier: MIT
 
+import micropython
 from math import log
+from array import array
 
 # -----------------------------------------------------
 # Input Voltage Conversion
@@ -19,6 +21,7 @@ MEASURED_TO_VOLTAGE_IN_MAX_MIN = (VOLTAGE_IN_MAX - VOLTAGE_IN_MIN) / (MEASURED_A
 MEASURED_TO_VOLTAGE_IN_MIN_ZERO = VOLTAGE_IN_MIN / (MEASURED_AT_VOLTAGE_IN_MIN - MEASURED_AT_VOLTAGE_IN_ZERO)
 
 
+@micropython.native
 def u16_to_voltage_in(u16):
     # return (((u16 * 3.3) / 65535) * (100 + 16)) / 16  # Ideal equation, kept for reference
     if u16 >= MEASURED_AT_VOLTAGE_IN_MIN:
@@ -42,6 +45,7 @@ MEASURED_TO_VOLTAGE_OUT_MAX_MIN = (VOLTAGE_OUT_MAX - VOLTAGE_OUT_MIN) / (MEASURE
 MEASURED_TO_VOLTAGE_OUT_MIN_ZERO = VOLTAGE_OUT_MIN / (MEASURED_AT_VOLTAGE_OUT_MIN - MEASURED_AT_VOLTAGE_OUT_ZERO)
 
 
+@micropython.native
 def u16_to_voltage_out(u16):
     # return (((u16 * 3.3) / 65535) * (100 + 16)) / 16  # Ideal equation, kept for reference
     if u16 >= MEASURED_AT_VOLTAGE_OUT_MIN:
@@ -66,6 +70,7 @@ MEASURED_TO_CURRENT_MAX_MID = (CURRENT_MAX - CURRENT_MID) / (MEASURED_AT_CURRENT
 MEASURED_TO_CURRENT_MID_MIN = (CURRENT_MID - CURRENT_MIN) / (MEASURED_AT_CURRENT_MID - MEASURED_AT_CURRENT_MIN)
 
 
+@micropython.native
 def u16_to_current(u16):
     # return (((u16 * 3.3) / 65535) * ( 1 / (2.99 * 4020 * 0.0005 / 120)))  # Ideal equation, kept for reference
 
@@ -89,9 +94,63 @@ RESISTANCE_AT_ROOM_TEMP = 10000.0
 BETA = 3435
 
 
-def analog_to_temp(sense):
+# The thermistor equation is replaced by a table of temperatures at evenly spaced raw readings, interpolated between.
+# A step of 512 keeps the table within 0.04°C of the equation from -20°C to 120°C. Readings outside of the table,
+# which only occur beyond around 240°C or -70°C, fall back to using the equation
+TEMP_TABLE_STEP = 512
+TEMP_TABLE_START = TEMP_TABLE_STEP
+TEMP_TABLE_END = 65536 - TEMP_TABLE_STEP
+
+
+@micropython.native
+def beta_to_temp(sense):
     r_thermistor = sense / ((ADC_REF - sense) / PULLUP_RESISTANCE)
     t_kelvin = (BETA * ROOM_TEMP) / (BETA + (ROOM_TEMP * log(r_thermistor / RESISTANCE_AT_ROOM_TEMP)))
     t_celsius = t_kelvin - ZERO_TEMP
     # https://www.allaboutcircuits.com/projects/measuring-temperature-with-an-ntc-thermistor/
     return t_celsius
+
+
+@micropython.native
+def u16_to_analog(u16):
+    return (u16 * ADC_REF) / 65535
+
+
+# Built once at import, so each conversion is a lookup rather than a log()
+TEMP_TABLE = array('f', (beta_to_temp(u16_to_analog(u16)) for u16 in range(TEMP_TABLE_START, TEMP_TABLE_END + 1, TEMP_TABLE_STEP)))
+
+
+@micropython.native
+def u16_to_temp(u16):
+    if TEMP_TABLE_START <= u16 < TEMP_TABLE_END:
+        position = (u16 - TEMP_TABLE_START) / TEMP_TABLE_STEP
+        index = int(position)
+        lower = TEMP_TABLE[index]
+        return lower + ((TEMP_TABLE[index + 1] - lower) * (position - index))
+    return beta_to_temp(u16_to_analog(u16))
+
+
+@micropython.native
+def analog_to_temp(sense):
+    return u16_to_temp((sense * 65535) / ADC_REF)
+
+
+# -----------------------------------------------------
+# Raw Limits
+# -----------------------------------------------------
+U16_LIMIT = 65536
+
+
+def find_u16(condition):
+    # Find the lowest raw reading for which a condition holds, where the condition does not hold for any reading below
+    # that point and does for all above it. This lets limits be converted to raw values once, rather than converting
+    # every reading to compare against them. Returns U16_LIMIT if the condition never holds
+    low = 0
+    high = U16_LIMIT
+    while low < high:
+        mid = (low + high) // 2
+        if condition(mid):
+            high = mid
+        else:
+            low = mid + 1
+    return low
@@ -4,6 +4,7 @@
 
 import time
 import struct
+import micropython
 from machine import Pin
 from pimoroni_yukon.timing import ticks_add, ticks_diff, ticks_ms
 from pimoroni_yukon.errors import TimeoutError
@@ -55,6 +56,7 @@ SERVO_LED_ERROR_WRITE = Command(35, 4)
 SERVO_LED_ERROR_READ = Command(36, 3)
 
 
+@micropython.native
 def checksum(buffer):
     # [From the LX protocol datasheet]
     # The calculation method is as follows:
@@ -107,6 +109,7 @@ def wait_for_send(uart):
     time.sleep_us(1500000 // BAUD_RATE)
 
 
+@micropython.native
 def handle_receive(uart):
     # Variables for handling received bytes
     frame_started = False
@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: MIT
 
 import math
+import micropython
 from machine import Timer, Pin
 
 """
@@ -50,6 +51,7 @@ class OkayStepper:
                         0 - math.sin(angle) * current_scale)
         return table
 
+    @micropython.native
     def __set_duties(self, table):
         stepper_entry = table[self.__current_microstep % self.__total_microsteps]
         self.__motor_a.duty(stepper_entry[0])
@@ -78,6 +80,7 @@ class OkayStepper:
         while self.__moving:
             pass
 
+    @micropython.native
     def __increase_microstep(self, timer):
         if self.__debug_pin is not None:
             self.__debug_pin.on()
@@ -93,6 +96,7 @@ class OkayStepper:
         if self.__debug_pin is not None:
             self.__debug_pin.off()
 
+    @micropython.native
     def __decrease_microstep(self, timer):
         if self.__debug_pin is not None:
             self.__debug_pin.on()
@@ -108,6 +112,7 @@ class OkayStepper:
         if self.__debug_pin is not None:
             self.__debug_pin.off()
 
+    @micropython.native
     def __hold_microstep(self, timer):
         if self.__debug_pin is not None:
             self.__debug_pin.on()
@@ -0,0 +1,64 @@
+# SPDX-FileCopyrightText: 2025 Christopher Parrott for Pimoroni Ltd
+#
+# SPDX-License-Identifier: MIT
+
+import tca
+from array import array
+
+try:
+    from _thread import get_ident
+except ImportError:
+    get_ident = None    # Only one thread can take snapshots
+
+CHIP_COUNT = 2          # The number of IO expanders on Yukon
+
+# The input ports of each expander, as read during the current snapshot
+_ports = array('H', [0] * CHIP_COUNT)
+
+# Whether a snapshot is in progress, followed by a bitmask of the expanders whose ports have been read during it
+_state = array('B', [0, 0])
+
+# The identity of the thread that began the snapshot, or None if any thread may use it. When monitoring from the second
+# core, this stops the first core from reading inputs from the second core's snapshot, or from ending it
+_owner = [None]
+
+
+def begin_snapshot(owner=None):
+    # Have reads of expander inputs share a single read of each expander's input port, until the snapshot ends
+    _owner[0] = owner
+    _state[1] = 0
+    _state[0] = 1
+
+
+def end_snapshot(owner=None):
+    if _owner[0] == owner:
+        _state[0] = 0
+        _state[1] = 0
+        _owner[0] = None
+
+
+class ExpanderInput:
+    """An input pin on one of Yukon's IO expanders. Outside of a snapshot this reads the pin like normal, but during
+    one (such as a monitor tick) the first read of any pin on an expander reads its whole input port, with every
+    other read from that expander using the stored port rather than costing another I2C transaction. Only the thread
+    that began a snapshot uses it, with any other reading the pin like normal"""
+
+    def __init__(self, pin):
+        self.__pin = pin
+        self.__chip = tca.get_chip(pin)
+        self.__chip_bit = 1 << self.__chip
+        self.__number = tca.get_number(pin)
+
+    def init(self, *args, **kwargs):
+        self.__pin.init(*args, **kwargs)
+
+    def pin(self):
+        return self.__pin
+
+    def value(self):
+        if _state[0] and (_owner[0] is None or _owner[0] == get_ident()):
+            if not _state[1] & self.__chip_bit:
+                _ports[self.__chip] = tca.read_input(self.__chip)
+                _state[1] |= self.__chip_bit
+            return (_ports[self.__chip] >> self.__number) & 1
+        return self.__pin.value()
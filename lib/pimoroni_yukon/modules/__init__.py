@@ -2,28 +2,145 @@
 #
 # SPDX-License-Identifier: MIT
 
-from .audio_amp import AudioAmpModule
-from .bench_power import BenchPowerModule
-from .big_motor import BigMotorModule
-from .dual_motor import DualMotorModule
-from .dual_output import DualOutputModule
-from .led_strip import LEDStripModule
-from .proto import ProtoPotModule
-from .quad_servo_direct import QuadServoDirectModule
-from .quad_servo_reg import QuadServoRegModule
-from .rm2_wireless import RM2WirelessModule
-from .serial_servo import SerialServoModule
-
-
-KNOWN_MODULES = (
-    AudioAmpModule,
-    BenchPowerModule,
-    BigMotorModule,
-    DualMotorModule,
-    DualOutputModule,
-    LEDStripModule,
-    ProtoPotModule,
-    QuadServoDirectModule,
-    QuadServoRegModule,
-    RM2WirelessModule,
-    SerialServoModule)
+from .common import YukonModule
+
+
+# Every module driver Yukon knows of, in the order they are matched during detection. Each entry is the file the driver
+# is in, its class name, and a bitmask of the signatures (see signature_index()) its is_module() returns True for. This
+# lets modules be detected without importing every driver, with a driver only imported once it is used, detected, or
+# registered. The bitmasks and the comments describing them are generated from each driver's is_module() by running
+# tools/module_signatures.py --update, so add new entries with a bitmask of 0 and run it, rather than editing them by hand
+# --- generated registry start ---
+MODULE_REGISTRY = [
+    # ADC1 FLOAT, ADC2 ALL, SLOW 0/1/1
+    ["audio_amp", "AudioAmpModule", 0x80808000000000000],
+    # ADC1 LOW or FLOAT, ADC2 ALL, SLOW 1/0/0
+    ["bench_power", "BenchPowerModule", 0x101010000000101010],
+    # ADC1 LOW, ADC2 ALL, SLOW 0/0/1; ADC1 LOW, ADC2 ALL, SLOW 0/1/1
+    ["big_motor", "BigMotorModule", 0xa0a0a],
+    # ADC1 HIGH, ADC2 ALL, SLOW 0/0/1
+    ["dual_motor", "DualMotorModule", 0x20202000000],
+    # ADC1 FLOAT, ADC2 ALL, SLOW 1/0/1
+    ["dual_output", "DualOutputModule", 0x202020000000000000],
+    # ADC1 LOW, ADC2 ALL, SLOW 1/1/1
+    ["led_strip", "LEDStripModule", 0x808080],
+    # ADC1 ALL, ADC2 HIGH, SLOW 1/1/0
+    ["proto", "ProtoPotModule", 0x4000004000004000],
+    # ADC1 ALL, ADC2 ALL, SLOW 0/0/0
+    ["quad_servo_direct", "QuadServoDirectModule", 0x10101010101010101],
+    # ADC1 HIGH, ADC2 ALL, SLOW 0/1/0; ADC1 HIGH, ADC2 ALL, SLOW 0/1/1
+    ["quad_servo_reg", "QuadServoRegModule", 0xc0c0c000000],
+    # ADC1 LOW, ADC2 FLOAT, SLOW 1/0/1
+    ["rm2_wireless", "RM2WirelessModule", 0x200000],
+    # ADC1 HIGH, ADC2 HIGH, SLOW 1/0/0
+    ["serial_servo", "SerialServoModule", 0x1000000000],
+]
+# --- generated registry end ---
+
+__loaded = {YukonModule.__name__: YukonModule}  # The driver classes imported so far, keyed by class name
+__signature_table = None
+
+
+# The names of the ADC levels, indexed by ADC_LOW, ADC_HIGH, and ADC_FLOAT
+ADC_LEVEL_NAMES = ("LOW", "HIGH", "FLOAT")
+
+# The number of distinct signatures a slot can have: three ADC1 levels, three ADC2 levels, and two levels for each SLOW pin
+SIGNATURE_COUNT = 3 * 3 * 2 * 2 * 2
+
+
+def signature_index(adc1_level, adc2_level, slow1, slow2, slow3):
+    # Combine the levels read from a slot into a single index
+    return (((adc1_level * 3) + adc2_level) << 3) | (slow1 << 2) | (slow2 << 1) | slow3
+
+
+def signature_levels(index):
+    # Split an index back into the levels read from a slot
+    adcs = index >> 3
+    return adcs // 3, adcs % 3, (index & 0b100) != 0, (index & 0b010) != 0, (index & 0b001) != 0
+
+
+def describe_signature(index):
+    adc1_level, adc2_level, slow1, slow2, slow3 = signature_levels(index)
+    return f"ADC1 = {ADC_LEVEL_NAMES[adc1_level]}, ADC2 = {ADC_LEVEL_NAMES[adc2_level]}, SLOW1 = {int(slow1)}, SLOW2 = {int(slow2)}, SLOW3 = {int(slow3)}"
+
+
+def signature_mask(module_type):
+    # Work out which signatures a module's is_module() returns True for, as a bitmask
+    mask = 0
+    for index in range(SIGNATURE_COUNT):
+        if module_type.is_module(*signature_levels(index)):
+            mask |= 1 << index
+    return mask
+
+
+def register_module(module_type):
+    # Add a custom module to the end of the registry, so Yukon can detect it and have it registered with slots
+    if not isinstance(module_type, type) or not issubclass(module_type, YukonModule) or module_type is YukonModule:
+        raise TypeError("module_type is not a subclass of YukonModule")
+
+    name = module_type.__name__
+    for entry in MODULE_REGISTRY:
+        if entry[1] == name:
+            if load_module(name) is module_type:
+                return
+            raise ValueError(f"A different module called '{name}' is already registered")
+
+    MODULE_REGISTRY.append([None, name, signature_mask(module_type)])
+    __loaded[name] = module_type
+
+    global __signature_table
+    __signature_table = None
+
+
+def load_module(name):
+    # Return the driver class with the given name, importing it if this is the first time it has been needed
+    module_type = __loaded.get(name)
+    if module_type is None:
+        for file, class_name, _ in MODULE_REGISTRY:
+            if class_name == name:
+                module_type = getattr(__import__("pimoroni_yukon.modules." + file, None, None, (name,)), name)
+                __loaded[name] = module_type
+                break
+        else:
+            raise ValueError(f"'{name}' is not a known module")
+    return module_type
+
+
+def is_known_module(module_type):
+    try:
+        return load_module(module_type.__name__) is module_type and module_type is not YukonModule
+    except ValueError:
+        return False
+
+
+def signature_table():
+    # Return which module each signature belongs to (as class names), building it from the registry the first time.
+    # Where more than one module claims a signature, the first in the registry is used, and the signature is recorded
+    # as ambiguous along with the names of all the modules that claim it
+    global __signature_table
+    if __signature_table is None:
+        table = [None] * SIGNATURE_COUNT
+        ambiguous = {}
+        for index in range(SIGNATURE_COUNT):
+            bit = 1 << index
+            matches = [entry[1] for entry in MODULE_REGISTRY if entry[2] & bit]
+            if len(matches) > 0:
+                table[index] = matches[0]
+                if len(matches) > 1:
+                    ambiguous[index] = tuple(matches)
+            elif YukonModule.is_module(*signature_levels(index)):
+                table[index] = YukonModule.__name__
+        __signature_table = (tuple(table), ambiguous)
+    return __signature_table
+
+
+def __getattr__(name):
+    # Import drivers when they are first accessed, such as by `from pimoroni_yukon.modules import DualOutputModule`.
+    # MicroPython's `import *` only copies the names already defined here, and never calls this, so drivers are
+    # deliberately not exported by it. Each must be imported by name instead (or all of them, through KNOWN_MODULES)
+    if name == "KNOWN_MODULES":
+        return tuple(load_module(entry[1]) for entry in MODULE_REGISTRY)
+    try:
+        return load_module(name)
+    except ValueError:
+        raise AttributeError(f"module 'pimoroni_yukon.modules' has no attribute '{name}'")
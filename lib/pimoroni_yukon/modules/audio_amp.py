@@ -7,6 +7,8 @@ from machine import Pin
 from ucollections import OrderedDict
 from .common import YukonModule, ADC_FLOAT, IO_LOW, IO_HIGH
 from pimoroni_yukon.errors import OverTemperatureError
+from pimoroni_yukon.conversion import u16_to_temp
+from pimoroni_yukon.readings import RawReadings
 from pimoroni_yukon.devices.audio import WavPlayer
 
 # PAGE 0 Regs
@@ -128,6 +130,8 @@ class AudioAmpModule(YukonModule):
     NAME = "Audio Amp"
     AMP_I2C_ADDRESS = 0x38
     TEMPERATURE_THRESHOLD = 50.0
+    MONITOR_ADC2 = True
+    ADC2_THERMISTOR = True
 
     # | ADC1  | ADC2  | SLOW1 | SLOW2 | SLOW3 | Module               | Condition (if any)          |
     # |-------|-------|-------|-------|-------|----------------------|-----------------------------|
@@ -137,10 +141,13 @@ class AudioAmpModule(YukonModule):
         return adc1_level == ADC_FLOAT and slow1 is IO_LOW and slow2 is IO_HIGH and slow3 is IO_HIGH
 
     def __init__(self, i2s_id):
+        self.__raw_readings = RawReadings(("T",), (u16_to_temp,))  # Created before the parent, as that clears the readings
         super().__init__()
         self.__i2s_id = i2s_id
         self.player = None
 
+        self.__raw_temperature_limit = self.__temperature_u16_limit(self.TEMPERATURE_THRESHOLD)  # For fast_monitor()
+
     def initialise(self, slot, adc1_func, adc2_func):
         # Create the enable pin object
         self.__amp_en = slot.SLOW1
@@ -277,45 +284,77 @@ class AudioAmpModule(YukonModule):
         self.__avg_temperature += temperature
         self.__count_avg += 1
 
+        # Keep the rolling statistics from the raw readings, as fast_monitor() does
+        readings = self.__raw_readings
+        if readings.is_rolling():
+            readings.add_rolling(0, self.__read_adc2_u16())
+
+    def fast_monitor(self):
+        temperature = self.__read_adc2_u16()
+
+        # Let monitor() raise the error should anything be wrong
+        if temperature < self.__raw_temperature_limit:
+            self.monitor()
+            return
+
+        # Run some user action based on the latest readings. Note that this will allocate memory
+        if self.__monitor_action_callback is not None:
+            self.__monitor_action_callback(u16_to_temp(temperature))
+
+        self.__raw_readings.add(0, temperature)
+        self.__raw_readings.tick()
+
     def get_readings(self):
-        return OrderedDict({
+        readings = OrderedDict({
             "T_max": self.__max_temperature,
             "T_min": self.__min_temperature,
             "T_avg": self.__avg_temperature
         })
+        readings.update(self.__raw_readings.rolling_readings())
+        return readings
+
+    def get_readings_view(self):
+        return self.__raw_readings
 
     def process_readings(self):
         if self.__count_avg > 0:
             self.__avg_temperature /= self.__count_avg
             self.__count_avg = 0    # Clear the count to prevent process readings acting more than once
 
+        if self.__raw_readings.process():
+            self.__max_temperature, self.__min_temperature, self.__avg_temperature = self.__raw_readings.stats(0)
+
     def clear_readings(self):
         self.__max_temperature = float('-inf')
         self.__min_temperature = float('inf')
         self.__avg_temperature = 0
         self.__count_avg = 0
+        self.__raw_readings.clear()
 
     def __start_i2c(self):
-        tca.change_output_mask(self.__chip, self.__sda_bit, 0)  # Data to low
-        tca.change_output_mask(self.__chip, self.__scl_bit, 0)  # Clock to low
+        tca.change_output_sequence(self.__chip, ((self.__sda_bit, 0),     # Data to low
+                                                 (self.__scl_bit, 0)))    # Clock to low
 
     def __end_i2c(self):
-        tca.change_output_mask(self.__chip, self.__scl_bit, self.__scl_bit)  # Clock to high
-        tca.change_output_mask(self.__chip, self.__sda_bit, self.__sda_bit)  # Data to high
+        tca.change_output_sequence(self.__chip, ((self.__scl_bit, self.__scl_bit),    # Clock to high
+                                                 (self.__sda_bit, self.__sda_bit)))   # Data to high
 
     def __write_i2c_byte(self, number):
+        # Clock out the bits of the byte as a sequence of output changes, so the expander receives them all in one transaction
+        steps = []
         bit = 128
         mask = self.__scl_bit | self.__sda_bit  # Set the mask for both SDA and SCL pins
         while bit > 0:
             # New data and clock to low
-            tca.change_output_mask(self.__chip, mask, self.__sda_bit if number & bit else 0)
+            steps.append((mask, self.__sda_bit if number & bit else 0))
 
             # Clock to high
-            tca.change_output_mask(self.__chip, self.__scl_bit, self.__scl_bit)
+            steps.append((self.__scl_bit, self.__scl_bit))
             bit >>= 1
 
         # Clock to low
-        tca.change_output_mask(self.__chip, self.__scl_bit, 0)
+        steps.append((self.__scl_bit, 0))
+        tca.change_output_sequence(self.__chip, steps)
 
         """
         # Do real ACK, with checking ACK value
@@ -328,10 +367,10 @@ class AudioAmpModule(YukonModule):
         """
 
         # Do real ACK, without checking value
-        self.__slow_sda.init(Pin.IN)
-        tca.change_output_mask(self.__chip, self.__scl_bit, self.__scl_bit)  # Clock to high
-        tca.change_output_mask(self.__chip, self.__scl_bit, 0)        # Clock to low
-        self.__slow_sda.init(Pin.OUT)
+        tca.change_config_mask(self.__chip, self.__sda_bit, self.__sda_bit)       # Data to input
+        tca.change_output_sequence(self.__chip, ((self.__scl_bit, self.__scl_bit),    # Clock to high
+                                                 (self.__scl_bit, 0)))                # Clock to low
+        tca.apply(self.__chip, self.__sda_bit, self.__sda_bit, self.__sda_bit, 0)  # Data to high, then to output
 
         """
         # Do fake ACK
@@ -6,6 +6,8 @@ from .common import YukonModule, ADC_HIGH, IO_LOW, IO_HIGH
 from machine import Pin, PWM
 from ucollections import OrderedDict
 from pimoroni_yukon.errors import FaultError, OverTemperatureError
+from pimoroni_yukon.conversion import u16_to_analog, u16_to_temp
+from pimoroni_yukon.readings import RawReadings
 import pimoroni_yukon.logging as logging
 
 
@@ -22,6 +24,9 @@ class BenchPowerModule(YukonModule):
     MEASURED_AT_PWM_MAX = 2.4976    # (2.5145, 2.4823,  2.4964,  2.4915,  2.4893,  2.5106,  2.4879,  2.5083)
 
     TEMPERATURE_THRESHOLD = 80.0
+    MONITOR_ADC1 = True
+    MONITOR_ADC2 = True
+    ADC2_THERMISTOR = True
 
     # | ADC1  | ADC2  | SLOW1 | SLOW2 | SLOW3 | Module               | Condition (if any)          |
     # |-------|-------|-------|-------|-------|----------------------|-----------------------------|
@@ -32,12 +37,18 @@ class BenchPowerModule(YukonModule):
         return adc1_level is not ADC_HIGH and slow1 is IO_HIGH and slow2 is IO_LOW and slow3 is IO_LOW
 
     def __init__(self, halt_on_not_pgood=False):
+        # Created before the parent, as that clears the readings
+        self.__raw_readings = RawReadings(("Vo", "T"),
+                                          (lambda u16: self.__analog_to_voltage(u16_to_analog(u16)), u16_to_temp),
+                                          ("PGood",), (True,))
         super().__init__()
 
         self.halt_on_not_pgood = halt_on_not_pgood
 
         self.__last_pgood = False
 
+        self.__raw_temperature_limit = self.__temperature_u16_limit(self.TEMPERATURE_THRESHOLD)  # For fast_monitor()
+
     def initialise(self, slot, adc1_func, adc2_func):
         # Create the voltage pwm object
         self.__voltage_pwm = PWM(slot.FAST2, freq=250000, duty_u16=0)
@@ -86,7 +97,9 @@ class BenchPowerModule(YukonModule):
 
     def read_voltage(self, samples=1):
         # return (self.__read_adc1(samples) * (39 + 10)) / 10   # Ideal equation, kept for reference
-        voltage = self.__read_adc1(samples)
+        return self.__analog_to_voltage(self.__read_adc1(samples))
+
+    def __analog_to_voltage(self, voltage):
         if voltage >= self.MEASURED_AT_PWM_MID:
             return ((voltage - self.MEASURED_AT_PWM_MID) * (self.VOLTAGE_AT_PWM_MAX - self.VOLTAGE_AT_PWM_MID)) / (self.MEASURED_AT_PWM_MAX - self.MEASURED_AT_PWM_MID) + self.VOLTAGE_AT_PWM_MID
         else:
@@ -100,6 +113,7 @@ class BenchPowerModule(YukonModule):
 
     def monitor(self):
         pgood = self.read_power_good()
+        self.__raw_readings.set_flag(0, pgood)  # Recorded before any error is raised, so a flight record shows what tripped
         if pgood is not True:
             if self.halt_on_not_pgood:
                 raise FaultError(self.__message_header() + "Power is not good! Turning off output")
@@ -132,8 +146,42 @@ class BenchPowerModule(YukonModule):
 
         self.__count_avg += 1
 
+        # Keep the rolling statistics from the raw readings, as fast_monitor() does
+        readings = self.__raw_readings
+        if readings.is_rolling():
+            readings.add_rolling(0, self.__read_adc1_u16())
+            readings.add_rolling(1, self.__read_adc2_u16())
+
+    def fast_monitor(self):
+        pgood = self.read_power_good()
+        temperature = self.__read_adc2_u16()
+
+        # Let monitor() raise the error should anything be wrong
+        if (pgood is not True and self.halt_on_not_pgood) or temperature < self.__raw_temperature_limit:
+            self.monitor()
+            return
+
+        voltage_out = self.__read_adc1_u16()
+
+        if self.__last_pgood is True and pgood is not True:
+            logging.warn(self.__message_header() + "Power is not good")
+        elif self.__last_pgood is not True and pgood is True:
+            logging.warn(self.__message_header() + "Power is good")
+
+        # Run some user action based on the latest readings. Note that this will allocate memory
+        if self.__monitor_action_callback is not None:
+            self.__monitor_action_callback(pgood, u16_to_temp(temperature), self.__analog_to_voltage(u16_to_analog(voltage_out)))
+
+        self.__last_pgood = pgood
+
+        readings = self.__raw_readings
+        readings.set_flag(0, pgood)
+        readings.add(0, voltage_out)
+        readings.add(1, temperature)
+        readings.tick()
+
     def get_readings(self):
-        return OrderedDict({
+        readings = OrderedDict({
             "PGood": self.__power_good_throughout,
             "Vo_max": self.__max_voltage_out,
             "Vo_min": self.__min_voltage_out,
@@ -142,6 +190,11 @@ class BenchPowerModule(YukonModule):
             "T_min": self.__min_temperature,
             "T_avg": self.__avg_temperature
         })
+        readings.update(self.__raw_readings.rolling_readings())
+        return readings
+
+    def get_readings_view(self):
+        return self.__raw_readings
 
     def process_readings(self):
         if self.__count_avg > 0:
@@ -149,6 +202,11 @@ class BenchPowerModule(YukonModule):
             self.__avg_temperature /= self.__count_avg
             self.__count_avg = 0    # Clear the count to prevent process readings acting more than once
 
+        if self.__raw_readings.process():
+            self.__power_good_throughout = self.__raw_readings.flags[0] == 1
+            self.__max_voltage_out, self.__min_voltage_out, self.__avg_voltage_out = self.__raw_readings.stats(0)
+            self.__max_temperature, self.__min_temperature, self.__avg_temperature = self.__raw_readings.stats(1)
+
     def clear_readings(self):
         self.__power_good_throughout = True
         self.__max_voltage_out = float('-inf')
@@ -160,3 +218,5 @@ class BenchPowerModule(YukonModule):
         self.__avg_temperature = 0
 
         self.__count_avg = 0
+
+        self.__raw_readings.clear()
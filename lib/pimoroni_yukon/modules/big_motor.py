@@ -8,6 +8,9 @@ from motor import Motor, SLOW_DECAY
 from encoder import Encoder, MMME_CPR
 from ucollections import OrderedDict
 from pimoroni_yukon.errors import FaultError, OverCurrentError, OverTemperatureError
+from pimoroni_yukon.conversion import u16_to_analog, u16_to_temp, find_u16
+from pimoroni_yukon.readings import RawReadings
+from pimoroni_yukon.inputs import ExpanderInput
 
 
 class BigMotorModule(YukonModule):
@@ -19,6 +22,9 @@ class BigMotorModule(YukonModule):
     CURRENT_THRESHOLD = 25.0
     SHUNT_RESISTOR = 0.001
     GAIN = 80
+    MONITOR_ADC1 = True
+    MONITOR_ADC2 = True
+    ADC2_THERMISTOR = True
 
     # | ADC1  | ADC2  | SLOW1 | SLOW2 | SLOW3 | Module               | Condition (if any)          |
     # |-------|-------|-------|-------|-------|----------------------|-----------------------------|
@@ -31,6 +37,11 @@ class BigMotorModule(YukonModule):
     def __init__(self, frequency=DEFAULT_FREQUENCY,
                  encoder_pio=0, encoder_sm=0, counts_per_rev=DEFAULT_COUNTS_PER_REV,
                  init_motor=True, init_encoder=True):
+        # Created before the parent, as that clears the readings. Currents are recorded as twice the raw reading,
+        # offset so that zero current is zero, allowing disabled motor readings to be recorded exactly
+        self.__raw_readings = RawReadings(("C", "T"),
+                                          (lambda u16: self.__voltage_to_current(u16_to_analog(u16) / 2), u16_to_temp),
+                                          ("Fault",), (False,))
         super().__init__()
 
         if init_encoder:
@@ -48,6 +59,11 @@ class BigMotorModule(YukonModule):
         self.__init_motor = init_motor
         self.__init_encoder = init_encoder
 
+        # Convert the thresholds to raw readings, for fast_monitor()
+        self.__raw_current_high = find_u16(lambda u16: self.__voltage_to_current(u16_to_analog(u16) - (3.3 / 2)) > self.CURRENT_THRESHOLD)
+        self.__raw_current_low = find_u16(lambda u16: self.__voltage_to_current(u16_to_analog(u16) - (3.3 / 2)) >= -self.CURRENT_THRESHOLD)
+        self.__raw_temperature_limit = self.__temperature_u16_limit(self.TEMPERATURE_THRESHOLD)
+
     def initialise(self, slot, adc1_func, adc2_func):
         # Store the pwm pins
         pwm_p = slot.FAST4
@@ -61,7 +77,7 @@ class BigMotorModule(YukonModule):
 
         # Create motor control pin objects
         self.__motor_en = slot.SLOW3
-        self.__motor_nfault = slot.SLOW2
+        self.__motor_nfault = ExpanderInput(slot.SLOW2)  # Read from the monitor tick's snapshot of the expander, when there is one
 
         # Store the encoder pins
         enc_a = slot.FAST1
@@ -96,10 +112,13 @@ class BigMotorModule(YukonModule):
     def read_fault(self):
         return self.__motor_nfault.value() != 1
 
+    def __voltage_to_current(self, voltage):
+        return voltage / (self.SHUNT_RESISTOR * self.GAIN)
+
     def read_current(self, samples=1):
         if self.is_enabled():
             # This gives a full range close to +-20A
-            return (self.__read_adc1(samples) - (3.3 / 2)) / (self.SHUNT_RESISTOR * self.GAIN)
+            return self.__voltage_to_current(self.__read_adc1(samples) - (3.3 / 2))
         else:
             return 0.0
 
@@ -108,6 +127,7 @@ class BigMotorModule(YukonModule):
 
     def monitor(self):
         fault = self.read_fault()
+        self.__raw_readings.set_flag(0, fault)  # Recorded before any error is raised, so a flight record shows what tripped
         if fault is True:
             raise FaultError(self.__message_header() + "Fault detected on motor driver! Turning off output")
 
@@ -135,8 +155,41 @@ class BigMotorModule(YukonModule):
 
         self.__count_avg += 1
 
+        # Keep the rolling statistics from the raw readings, as fast_monitor() does
+        readings = self.__raw_readings
+        if readings.is_rolling():
+            readings.add_rolling(0, (self.__read_adc1_u16() * 2) - 65535 if self.is_enabled() else 0)
+            readings.add_rolling(1, self.__read_adc2_u16())
+
+    def fast_monitor(self):
+        fault = self.read_fault()
+
+        current = 0
+        current_exceeded = False
+        if self.is_enabled():
+            current = self.__read_adc1_u16()
+            current_exceeded = current >= self.__raw_current_high or current < self.__raw_current_low
+            current = (current * 2) - 65535
+
+        temperature = self.__read_adc2_u16()
+
+        # Let monitor() raise the error should anything be wrong
+        if fault is True or current_exceeded or temperature < self.__raw_temperature_limit:
+            self.monitor()
+            return
+
+        # Run some user action based on the latest readings. Note that this will allocate memory
+        if self.__monitor_action_callback is not None:
+            self.__monitor_action_callback(fault, self.__voltage_to_current(u16_to_analog(current) / 2), u16_to_temp(temperature))
+
+        readings = self.__raw_readings
+        readings.set_flag(0, fault)
+        readings.add(0, current)
+        readings.add(1, temperature)
+        readings.tick()
+
     def get_readings(self):
-        return OrderedDict({
+        readings = OrderedDict({
             "Fault": self.__fault_triggered,
             "C_max": self.__max_current,
             "C_min": self.__min_current,
@@ -145,6 +198,11 @@ class BigMotorModule(YukonModule):
             "T_min": self.__min_temperature,
             "T_avg": self.__avg_temperature
         })
+        readings.update(self.__raw_readings.rolling_readings())
+        return readings
+
+    def get_readings_view(self):
+        return self.__raw_readings
 
     def process_readings(self):
         if self.__count_avg > 0:
@@ -152,6 +210,11 @@ class BigMotorModule(YukonModule):
             self.__avg_temperature /= self.__count_avg
             self.__count_avg = 0    # Clear the count to prevent process readings acting more than once
 
+        if self.__raw_readings.process():
+            self.__fault_triggered = self.__raw_readings.flags[0] == 1
+            self.__max_current, self.__min_current, self.__avg_current = self.__raw_readings.stats(0)
+            self.__max_temperature, self.__min_temperature, self.__avg_temperature = self.__raw_readings.stats(1)
+
     def clear_readings(self):
         self.__fault_triggered = False
 
@@ -164,3 +227,5 @@ class BigMotorModule(YukonModule):
         self.__avg_temperature = 0
 
         self.__count_avg = 0
+
+        self.__raw_readings.clear()
@@ -3,7 +3,7 @@
 # SPDX-License-Identifier: MIT
 
 from collections import OrderedDict
-from pimoroni_yukon.conversion import analog_to_temp
+from pimoroni_yukon.conversion import analog_to_temp, u16_to_temp, find_u16
 import pimoroni_yukon.logging as logging
 
 ADC_LOW = 0
@@ -15,6 +15,9 @@ IO_HIGH = True
 
 class YukonModule:
     NAME = "Unknown"
+    MONITOR_ADC1 = False        # Whether monitor() reads ADC1, so Yukon can sample it ahead of time
+    MONITOR_ADC2 = False        # Whether monitor() reads ADC2, so Yukon can sample it ahead of time
+    ADC2_THERMISTOR = False     # Whether ADC2 is a thermistor, so Yukon can sample it less often
 
     # | ADC1  | ADC2  | SLOW1 | SLOW2 | SLOW3 | Module               | Condition (if any)          |
     # |-------|-------|-------|-------|-------|----------------------|-----------------------------|
@@ -28,6 +31,8 @@ class YukonModule:
         self.slot = None
         self.__adc1_func = None
         self.__adc2_func = None
+        self.__adc1_u16_func = None
+        self.__adc2_u16_func = None
 
         self.clear_readings()
 
@@ -42,6 +47,11 @@ class YukonModule:
         # Put any objects created during initialisation into a known state
         self.reset()
 
+    def assign_raw_adc_funcs(self, adc1_u16_func, adc2_u16_func):
+        # Record the functions to call for raw ADC readings, as used by fast_monitor()
+        self.__adc1_u16_func = adc1_u16_func
+        self.__adc2_u16_func = adc2_u16_func
+
     def is_initialised(self):
         return self.slot is not None
 
@@ -49,6 +59,8 @@ class YukonModule:
         self.slot = None
         self.__adc1_func = None
         self.__adc2_func = None
+        self.__adc1_u16_func = None
+        self.__adc2_u16_func = None
 
     def reset(self):
         # Override this to reset the module back into a default state post-initialisation
@@ -63,6 +75,16 @@ class YukonModule:
     def __read_adc2_as_temp(self, samples=1):
         return analog_to_temp(self.__adc2_func(self.slot, samples))
 
+    def __read_adc1_u16(self):
+        return self.__adc1_u16_func(self.slot)
+
+    def __read_adc2_u16(self):
+        return self.__adc2_u16_func(self.slot)
+
+    def __temperature_u16_limit(self, threshold):
+        # The raw ADC2 reading below which the module's temperature exceeds the threshold (as higher readings are cooler)
+        return find_u16(lambda u16: u16_to_temp(u16) <= threshold)
+
     def assign_monitor_action(self, callback_function):
         if not None and not callable(callback_function):
             raise TypeError("callback is not callable or None")
@@ -73,10 +95,18 @@ class YukonModule:
         # Override this to perform any module specific monitoring
         pass
 
+    def fast_monitor(self):
+        # Override this to perform the same monitoring as monitor(), but without allocating memory
+        self.monitor()
+
     def get_readings(self):
         # Override this to return any readings obtained during monitoring
         return OrderedDict()
 
+    def get_readings_view(self):
+        # Override this to return a RawReadings object of the readings obtained during fast_monitor()
+        return None
+
     def get_formatted_readings(self, allowed=None, excluded=None):
         return logging.format_dict(f"[Slot{self.slot.ID}]", self.get_readings(), allowed, excluded)
 
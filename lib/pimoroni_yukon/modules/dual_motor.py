@@ -6,6 +6,8 @@ from .common import YukonModule, ADC_HIGH, IO_LOW, IO_HIGH
 from machine import Pin
 from ucollections import OrderedDict
 from pimoroni_yukon.errors import FaultError, OverTemperatureError
+from pimoroni_yukon.conversion import u16_to_analog, u16_to_temp, find_u16
+from pimoroni_yukon.readings import RawReadings
 import pimoroni_yukon.logging as logging
 
 
@@ -17,6 +19,9 @@ class DualMotorModule(YukonModule):
     FAULT_THRESHOLD = 0.1
     DEFAULT_FREQUENCY = 25000
     TEMPERATURE_THRESHOLD = 70.0
+    MONITOR_ADC1 = True
+    MONITOR_ADC2 = True
+    ADC2_THERMISTOR = True
 
     # The current (in amps) associated with each limit (Do Not Modify!)
     CURRENT_LIMIT_1 = 0.161
@@ -40,11 +45,16 @@ class DualMotorModule(YukonModule):
         return adc1_level == ADC_HIGH and slow1 is IO_LOW and slow2 is IO_LOW and slow3 is IO_HIGH
 
     def __init__(self, frequency=DEFAULT_FREQUENCY, current_limit=DEFAULT_CURRENT_LIMIT, init_motors=True):
+        self.__raw_readings = RawReadings(("T",), (u16_to_temp,), ("Fault",), (False,))  # Created before the parent, as that clears the readings
         super().__init__()
         self.__frequency = frequency
         self.__current_limit = current_limit
         self.__init_motors = init_motors
 
+        # Convert the thresholds to raw readings, for fast_monitor()
+        self.__raw_fault_threshold = find_u16(lambda u16: u16_to_analog(u16) > self.FAULT_THRESHOLD)
+        self.__raw_temperature_limit = self.__temperature_u16_limit(self.TEMPERATURE_THRESHOLD)
+
         # An ascending order list of current limits with the pin states to achieve them
         self.__current_limit_states = OrderedDict({
             self.CURRENT_LIMIT_1: (0, 0),
@@ -153,6 +163,7 @@ class DualMotorModule(YukonModule):
 
     def monitor(self):
         fault = self.read_fault()
+        self.__raw_readings.set_flag(0, fault)  # Recorded before any error is raised, so a flight record shows what tripped
         if fault is True:
             raise FaultError(self.__message_header() + "Fault detected on motor driver! Turning off output")
 
@@ -170,22 +181,55 @@ class DualMotorModule(YukonModule):
         self.__avg_temperature += temperature
         self.__count_avg += 1
 
+        # Keep the rolling statistics from the raw readings, as fast_monitor() does
+        readings = self.__raw_readings
+        if readings.is_rolling():
+            readings.add_rolling(0, self.__read_adc2_u16())
+
+    def fast_monitor(self):
+        fault = self.__read_adc1_u16() < self.__raw_fault_threshold
+        temperature = self.__read_adc2_u16()
+
+        # Let monitor() raise the error should anything be wrong
+        if fault is True or temperature < self.__raw_temperature_limit:
+            self.monitor()
+            return
+
+        # Run some user action based on the latest readings. Note that this will allocate memory
+        if self.__monitor_action_callback is not None:
+            self.__monitor_action_callback(fault, u16_to_temp(temperature))
+
+        readings = self.__raw_readings
+        readings.set_flag(0, fault)
+        readings.add(0, temperature)
+        readings.tick()
+
     def get_readings(self):
-        return OrderedDict({
+        readings = OrderedDict({
             "Fault": self.__fault_triggered,
             "T_max": self.__max_temperature,
             "T_min": self.__min_temperature,
             "T_avg": self.__avg_temperature,
         })
+        readings.update(self.__raw_readings.rolling_readings())
+        return readings
+
+    def get_readings_view(self):
+        return self.__raw_readings
 
     def process_readings(self):
         if self.__count_avg > 0:
             self.__avg_temperature /= self.__count_avg
             self.__count_avg = 0    # Clear the count to prevent process readings acting more than once
 
+        if self.__raw_readings.process():
+            self.__fault_triggered = self.__raw_readings.flags[0] == 1
+            self.__max_temperature, self.__min_temperature, self.__avg_temperature = self.__raw_readings.stats(0)
+
     def clear_readings(self):
         self.__fault_triggered = False
         self.__max_temperature = float('-inf')
         self.__min_temperature = float('inf')
         self.__avg_temperature = 0
         self.__count_avg = 0
+        self.__raw_readings.clear()
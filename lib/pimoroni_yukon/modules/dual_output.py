@@ -6,6 +6,9 @@ from .common import YukonModule, ADC_FLOAT, IO_LOW, IO_HIGH
 from machine import Pin
 from ucollections import OrderedDict
 from pimoroni_yukon.errors import FaultError, OverTemperatureError
+from pimoroni_yukon.conversion import u16_to_temp
+from pimoroni_yukon.readings import RawReadings
+from pimoroni_yukon.inputs import ExpanderInput
 import pimoroni_yukon.logging as logging
 
 
@@ -15,6 +18,8 @@ class DualOutputModule(YukonModule):
     OUTPUT_2 = 1
     NUM_OUTPUTS = 2
     TEMPERATURE_THRESHOLD = 70.0
+    MONITOR_ADC2 = True
+    ADC2_THERMISTOR = True
 
     # | ADC1  | ADC2  | SLOW1 | SLOW2 | SLOW3 | Module               | Condition (if any)          |
     # |-------|-------|-------|-------|-------|----------------------|-----------------------------|
@@ -24,12 +29,15 @@ class DualOutputModule(YukonModule):
         return adc1_level == ADC_FLOAT and slow1 is IO_HIGH and slow2 is IO_LOW and slow3 is IO_HIGH
 
     def __init__(self, halt_on_not_pgood=False):
+        self.__raw_readings = RawReadings(("T",), (u16_to_temp,), ("PGood1", "PGood2"), (True, True))  # Created before the parent, as that clears the readings
         super().__init__()
         self.halt_on_not_pgood = halt_on_not_pgood
 
         self.__last_pgood1 = False
         self.__last_pgood2 = False
 
+        self.__raw_temperature_limit = self.__temperature_u16_limit(self.TEMPERATURE_THRESHOLD)  # For fast_monitor()
+
     def initialise(self, slot, adc1_func, adc2_func):
         # Create the switch and power control pin objects
         self.outputs = [slot.FAST1,
@@ -38,8 +46,8 @@ class DualOutputModule(YukonModule):
         self.__sw_enable = (slot.FAST2,
                             slot.FAST4)
 
-        self.__power_good = (slot.SLOW3,
-                             slot.SLOW1)
+        self.__power_good = (ExpanderInput(slot.SLOW3),   # Read from the monitor tick's snapshot of the expander, when there is one
+                             ExpanderInput(slot.SLOW1))
 
         # Pass the slot and adc functions up to the parent now that module specific initialisation has finished
         super().initialise(slot, adc1_func, adc2_func)
@@ -99,10 +107,12 @@ class DualOutputModule(YukonModule):
 
     def monitor(self):
         pgood1 = self.read_power_good1()
+        self.__raw_readings.set_flag(0, pgood1)  # Recorded before any error is raised, so a flight record shows what tripped
         if pgood1 is not True:
             if self.halt_on_not_pgood:
                 raise FaultError(self.__message_header() + "Power1 is not good! Turning off output")
         pgood2 = self.read_power_good2()
+        self.__raw_readings.set_flag(1, pgood2)
         if pgood2 is not True:
             if self.halt_on_not_pgood:
                 raise FaultError(self.__message_header() + "Power2 is not good! Turning off output")
@@ -135,20 +145,68 @@ class DualOutputModule(YukonModule):
         self.__avg_temperature += temperature
         self.__count_avg += 1
 
+        # Keep the rolling statistics from the raw readings, as fast_monitor() does
+        readings = self.__raw_readings
+        if readings.is_rolling():
+            readings.add_rolling(0, self.__read_adc2_u16())
+
+    def fast_monitor(self):
+        pgood1 = self.read_power_good1()
+        pgood2 = self.read_power_good2()
+        temperature = self.__read_adc2_u16()
+
+        # Let monitor() raise the error should anything be wrong
+        if ((pgood1 is not True or pgood2 is not True) and self.halt_on_not_pgood) or temperature < self.__raw_temperature_limit:
+            self.monitor()
+            return
+
+        if self.__last_pgood1 is True and pgood1 is not True:
+            logging.warn(self.__message_header() + "Power1 is not good")
+        elif self.__last_pgood1 is not True and pgood1 is True:
+            logging.warn(self.__message_header() + "Power1 is good")
+
+        if self.__last_pgood2 is True and pgood2 is not True:
+            logging.warn(self.__message_header() + "Power2 is not good")
+        elif self.__last_pgood2 is not True and pgood2 is True:
+            logging.warn(self.__message_header() + "Power2 is good")
+
+        # Run some user action based on the latest readings. Note that this will allocate memory
+        if self.__monitor_action_callback is not None:
+            self.__monitor_action_callback(pgood1, pgood2, u16_to_temp(temperature))
+
+        self.__last_pgood1 = pgood1
+        self.__last_pgood2 = pgood2
+
+        readings = self.__raw_readings
+        readings.set_flag(0, pgood1)
+        readings.set_flag(1, pgood2)
+        readings.add(0, temperature)
+        readings.tick()
+
     def get_readings(self):
-        return OrderedDict({
+        readings = OrderedDict({
             "PGood1": self.__power_good_throughout1,
             "PGood2": self.__power_good_throughout2,
             "T_max": self.__max_temperature,
             "T_min": self.__min_temperature,
             "T_avg": self.__avg_temperature
         })
+        readings.update(self.__raw_readings.rolling_readings())
+        return readings
+
+    def get_readings_view(self):
+        return self.__raw_readings
 
     def process_readings(self):
         if self.__count_avg > 0:
             self.__avg_temperature /= self.__count_avg
             self.__count_avg = 0    # Clear the count to prevent process readings acting more than once
 
+        if self.__raw_readings.process():
+            self.__power_good_throughout1 = self.__raw_readings.flags[0] == 1
+            self.__power_good_throughout2 = self.__raw_readings.flags[1] == 1
+            self.__max_temperature, self.__min_temperature, self.__avg_temperature = self.__raw_readings.stats(0)
+
     def clear_readings(self):
         self.__power_good_throughout1 = True
         self.__power_good_throughout2 = True
@@ -156,3 +214,4 @@ class DualOutputModule(YukonModule):
         self.__min_temperature = float('inf')
         self.__avg_temperature = 0
         self.__count_avg = 0
+        self.__raw_readings.clear()
@@ -6,6 +6,8 @@ from .common import YukonModule, ADC_LOW, IO_HIGH
 from machine import Pin
 from ucollections import OrderedDict
 from pimoroni_yukon.errors import FaultError, OverTemperatureError
+from pimoroni_yukon.conversion import u16_to_temp
+from pimoroni_yukon.readings import RawReadings
 import pimoroni_yukon.logging as logging
 
 
@@ -18,6 +20,8 @@ class LEDStripModule(YukonModule):
     STRIP_2 = 1       # Only for DUAL_NEOPIXEL strip_type
     NUM_STRIPS = 1    # Becomes 2 with the DUAL_NEOPIXEL strip_type
     TEMPERATURE_THRESHOLD = 80.0
+    MONITOR_ADC2 = True
+    ADC2_THERMISTOR = True
 
     # | ADC1  | ADC2  | SLOW1 | SLOW2 | SLOW3 | Module               | Condition (if any)          |
     # |-------|-------|-------|-------|-------|----------------------|-----------------------------|
@@ -27,6 +31,7 @@ class LEDStripModule(YukonModule):
         return adc1_level == ADC_LOW and slow1 is IO_HIGH and slow2 is IO_HIGH and slow3 is IO_HIGH
 
     def __init__(self, strip_type, pio, sm, num_leds, brightness=1.0, halt_on_not_pgood=False):
+        self.__raw_readings = RawReadings(("T",), (u16_to_temp,), ("PGood",), (True,))  # Created before the parent, as that clears the readings
         super().__init__()
 
         if strip_type < 0 or strip_type > 2:
@@ -71,6 +76,8 @@ class LEDStripModule(YukonModule):
 
         self.__last_pgood = False
 
+        self.__raw_temperature_limit = self.__temperature_u16_limit(self.TEMPERATURE_THRESHOLD)  # For fast_monitor()
+
     def initialise(self, slot, adc1_func, adc2_func):
         # Create the strip driver object
         if self.__strip_type == self.NEOPIXEL or self.__strip_type == self.DUAL_NEOPIXEL:
@@ -129,6 +136,7 @@ class LEDStripModule(YukonModule):
 
     def monitor(self):
         pgood = self.read_power_good()
+        self.__raw_readings.set_flag(0, pgood)  # Recorded before any error is raised, so a flight record shows what tripped
         if pgood is not True:
             if self.halt_on_not_pgood:
                 raise FaultError(self.__message_header() + "Power is not good! Turning off output")
@@ -154,22 +162,62 @@ class LEDStripModule(YukonModule):
         self.__avg_temperature += temperature
         self.__count_avg += 1
 
+        # Keep the rolling statistics from the raw readings, as fast_monitor() does
+        readings = self.__raw_readings
+        if readings.is_rolling():
+            readings.add_rolling(0, self.__read_adc2_u16())
+
+    def fast_monitor(self):
+        pgood = self.read_power_good()
+        temperature = self.__read_adc2_u16()
+
+        # Let monitor() raise the error should anything be wrong
+        if (pgood is not True and self.halt_on_not_pgood) or temperature < self.__raw_temperature_limit:
+            self.monitor()
+            return
+
+        if self.__last_pgood is True and pgood is not True:
+            logging.warn(self.__message_header() + "Power is not good")
+        elif self.__last_pgood is not True and pgood is True:
+            logging.warn(self.__message_header() + "Power is good")
+
+        # Run some user action based on the latest readings. Note that this will allocate memory
+        if self.__monitor_action_callback is not None:
+            self.__monitor_action_callback(pgood, u16_to_temp(temperature))
+
+        self.__last_pgood = pgood
+
+        readings = self.__raw_readings
+        readings.set_flag(0, pgood)
+        readings.add(0, temperature)
+        readings.tick()
+
     def get_readings(self):
-        return OrderedDict({
+        readings = OrderedDict({
             "PGood": self.__power_good_throughout,
             "T_max": self.__max_temperature,
             "T_min": self.__min_temperature,
             "T_avg": self.__avg_temperature
         })
+        readings.update(self.__raw_readings.rolling_readings())
+        return readings
+
+    def get_readings_view(self):
+        return self.__raw_readings
 
     def process_readings(self):
         if self.__count_avg > 0:
             self.__avg_temperature /= self.__count_avg
             self.__count_avg = 0    # Clear the count to prevent process readings acting more than once
 
+        if self.__raw_readings.process():
+            self.__power_good_throughout = self.__raw_readings.flags[0] == 1
+            self.__max_temperature, self.__min_temperature, self.__avg_temperature = self.__raw_readings.stats(0)
+
     def clear_readings(self):
         self.__power_good_throughout = True
         self.__max_temperature = float('-inf')
         self.__min_temperature = float('inf')
         self.__avg_temperature = 0
         self.__count_avg = 0
+        self.__raw_readings.clear()
@@ -0,0 +1,80 @@
+# SPDX-FileCopyrightText: 2025 Christopher Parrott for Pimoroni Ltd
+#
+# SPDX-License-Identifier: MIT
+
+from array import array
+from ucollections import OrderedDict
+from pimoroni_yukon.readings import SUM_SPLIT
+
+NUM_BUCKETS = 16    # The number of histogram buckets. Bucket N holds durations of 2^(N-1) up to 2^N units, with the last holding all longer ones
+
+
+class StageProfile:
+    """Records how many times each stage of a process ran, and the total, min, max and a power of two
+    histogram of how long each took (in microseconds by default), without allocating memory"""
+
+    def __init__(self, names, unit="us"):
+        self.__names = tuple(names)
+        self.__unit = unit
+        num_stages = len(self.__names)
+
+        self.__count = array('i', [0] * num_stages)
+        self.__total_hi = array('i', [0] * num_stages)
+        self.__total_lo = array('i', [0] * num_stages)
+        self.__min = array('i', [0] * num_stages)
+        self.__max = array('i', [0] * num_stages)
+        self.__buckets = array('i', [0] * (num_stages * NUM_BUCKETS))
+
+        self.clear()
+
+    def clear(self):
+        for i in range(len(self.__names)):
+            self.__count[i] = 0
+            self.__total_hi[i] = 0
+            self.__total_lo[i] = 0
+            self.__min[i] = SUM_SPLIT
+            self.__max[i] = 0
+
+        for i in range(len(self.__buckets)):
+            self.__buckets[i] = 0
+
+    def add(self, stage, us):
+        self.__count[stage] += 1
+        if us < self.__min[stage]:
+            self.__min[stage] = us
+        if us > self.__max[stage]:
+            self.__max[stage] = us
+
+        # Split the total across two values, so it can grow without becoming a heap allocated int
+        lo = self.__total_lo[stage] + us
+        if lo >= SUM_SPLIT:
+            lo -= SUM_SPLIT
+            self.__total_hi[stage] += 1
+        self.__total_lo[stage] = lo
+
+        bucket = 0
+        while us > 0 and bucket < NUM_BUCKETS - 1:
+            us >>= 1
+            bucket += 1
+        self.__buckets[stage * NUM_BUCKETS + bucket] += 1
+
+    def names(self):
+        return self.__names
+
+    def report(self):
+        # Return the recorded stats of every stage that has run, keyed by stage name. Note that this allocates memory
+        report = OrderedDict()
+        for i in range(len(self.__names)):
+            count = self.__count[i]
+            if count > 0:
+                total = (self.__total_hi[i] * SUM_SPLIT) + self.__total_lo[i]
+                unit = self.__unit
+                report[self.__names[i]] = OrderedDict({
+                    "count": count,
+                    "total_" + unit: total,
+                    "min_" + unit: self.__min[i],
+                    "max_" + unit: self.__max[i],
+                    "avg_" + unit: total / count,
+                    "histogram": tuple(self.__buckets[i * NUM_BUCKETS + b] for b in range(NUM_BUCKETS))
+                })
+        return report
@@ -0,0 +1,343 @@
+# SPDX-FileCopyrightText: 2025 Christopher Parrott for Pimoroni Ltd
+#
+# SPDX-License-Identifier: MIT
+
+from array import array
+from ucollections import OrderedDict
+
+SUM_SPLIT = 1 << 24     # The point at which sums carry over, to keep every stored value a small int
+HISTOGRAM_BUCKETS = 64  # The number of buckets in the histogram of each reading
+HISTOGRAM_SHIFT = 4     # How far to shift raw readings to find their histogram bucket to begin with, giving buckets one ADC count wide
+HISTOGRAM_MAX_SHIFT = 12    # The widest buckets, at which the histogram can extend to any signed 16-bit reading from where it began
+VARIANCE_SHIFT = 4      # How far raw readings are above ADC counts. The ADC is 12-bit, so the mean and variance are kept in counts
+MEAN_SHIFT = 8          # The number of fractional bits of ADC counts to hold the means with
+SMALL_DELTA = 1 << 15   # The largest difference from the mean that can be squared at full precision whilst remaining a small int
+EWMA_SHIFT = 4          # The number of fractional bits to hold the moving averages with
+PERCENTILES = (95, 99)  # The percentiles to report
+
+
+class RollingStats:
+    """Keeps statistics of raw (integer) sensor readings that carry on across sets of readings, without allocating
+    memory as readings are added: an exponentially weighted moving average, the variance, and a histogram from which
+    percentiles are estimated. Only the moving average forgets old readings, with the others covering every reading
+    since the stats were reset"""
+
+    def __init__(self, num_stats, time_constant):
+        self.__num_stats = num_stats
+        self.__count = array('i', [0] * num_stats)
+        self.__ewma = array('i', [0] * num_stats)
+        self.__max = array('i', [0] * num_stats)
+        self.__min = array('i', [0] * num_stats)
+
+        # Welford's running mean and sum of squared differences from it (M2). The mean is in fixed point, with the
+        # remainder of each division by the count carried to the next, so it never drifts. M2 is in 1/256ths of an ADC
+        # count squared, split across two values (as with the sums of RawReadings) so it can grow without becoming a
+        # heap allocated int
+        self.__mean = array('i', [0] * num_stats)
+        self.__mean_rem = array('i', [0] * num_stats)
+        self.__m2_hi = array('i', [0] * num_stats)
+        self.__m2_lo = array('i', [0] * num_stats)
+
+        # The histogram of each reading, covering HISTOGRAM_BUCKETS buckets from its base, each 1 << shift readings wide.
+        # It starts narrow around the first reading, and doubles the width of its buckets whenever a reading falls outside
+        self.__histogram = array('i', [0] * (num_stats * HISTOGRAM_BUCKETS))
+        self.__histogram_base = array('i', [0] * num_stats)
+        self.__histogram_shift = array('B', [0] * num_stats)
+
+        self.set_time_constant(time_constant)
+        self.reset()
+
+    def set_time_constant(self, time_constant):
+        # The moving average is updated by shifting, so the time constant (in readings) is rounded to a power of two
+        if time_constant < 1:
+            raise ValueError("time_constant out of range. Expected 1 or greater")
+
+        shift = 0
+        while (1 << (shift + 1)) <= time_constant * 1.414:   # Round to the nearest power of two, on a log scale
+            shift += 1
+        self.__shift = shift
+
+    def time_constant(self):
+        return 1 << self.__shift
+
+    def reset(self):
+        for i in range(self.__num_stats):
+            self.__count[i] = 0
+            self.__ewma[i] = 0
+            self.__max[i] = -SUM_SPLIT
+            self.__min[i] = SUM_SPLIT
+            self.__mean[i] = 0
+            self.__mean_rem[i] = 0
+            self.__m2_hi[i] = 0
+            self.__m2_lo[i] = 0
+            self.__histogram_base[i] = 0
+            self.__histogram_shift[i] = HISTOGRAM_SHIFT
+
+        for i in range(len(self.__histogram)):
+            self.__histogram[i] = 0
+
+    def add(self, index, raw):
+        count = self.__count[index] + 1
+        self.__count[index] = count
+        if count == 1:
+            self.__ewma[index] = raw << EWMA_SHIFT
+            self.__histogram_base[index] = raw - ((HISTOGRAM_BUCKETS // 2) << HISTOGRAM_SHIFT)
+        else:
+            self.__ewma[index] += ((raw << EWMA_SHIFT) - self.__ewma[index]) >> self.__shift
+
+        if raw > self.__max[index]:
+            self.__max[index] = raw
+        if raw < self.__min[index]:
+            self.__min[index] = raw
+
+        # Update the mean and M2 with Welford's method, which avoids the loss of precision of subtracting large sums
+        value = raw << (MEAN_SHIFT - VARIANCE_SHIFT)
+        delta = value - self.__mean[index]
+        carried = delta + self.__mean_rem[index]
+        step = carried // count
+        self.__mean[index] += step
+        self.__mean_rem[index] = carried - (step * count)
+        new_delta = value - self.__mean[index]
+
+        lo = self.__m2_lo[index]
+        if -SMALL_DELTA < delta < SMALL_DELTA:
+            lo += (delta * new_delta) >> MEAN_SHIFT
+        else:
+            # Too large to square at full precision, so square whole ADC counts, and add them to both halves of M2
+            squared = ((delta + 128) >> MEAN_SHIFT) * ((new_delta + 128) >> MEAN_SHIFT)
+            self.__m2_hi[index] += squared >> 16
+            lo += (squared & 0xFFFF) << 8
+        if lo >= SUM_SPLIT:
+            self.__m2_hi[index] += lo >> 24
+            lo &= SUM_SPLIT - 1
+        self.__m2_lo[index] = lo
+
+        # Widen the histogram's buckets until the reading falls within it, or it covers every reading it can
+        shift = self.__histogram_shift[index]
+        bucket = (raw - self.__histogram_base[index]) >> shift
+        while (bucket < 0 or bucket >= HISTOGRAM_BUCKETS) and shift < HISTOGRAM_MAX_SHIFT:
+            self.__widen_histogram(index, bucket < 0)
+            shift += 1
+            bucket = (raw - self.__histogram_base[index]) >> shift
+
+        if bucket < 0:
+            bucket = 0
+        elif bucket >= HISTOGRAM_BUCKETS:
+            bucket = HISTOGRAM_BUCKETS - 1
+        self.__histogram[index * HISTOGRAM_BUCKETS + bucket] += 1
+
+    def __widen_histogram(self, index, downwards):
+        # Merge each pair of buckets, doubling their width. The merged buckets fill the lower half of the histogram to
+        # extend its range upwards, or the upper half to extend it downwards
+        histogram = self.__histogram
+        offset = index * HISTOGRAM_BUCKETS
+        half = HISTOGRAM_BUCKETS // 2
+        shift = self.__histogram_shift[index] + 1
+        if downwards:
+            for i in range(half - 1, -1, -1):
+                histogram[offset + half + i] = histogram[offset + (2 * i)] + histogram[offset + (2 * i) + 1]
+            for i in range(half):
+                histogram[offset + i] = 0
+            self.__histogram_base[index] -= half << shift
+        else:
+            for i in range(half):
+                histogram[offset + i] = histogram[offset + (2 * i)] + histogram[offset + (2 * i) + 1]
+            for i in range(half, HISTOGRAM_BUCKETS):
+                histogram[offset + i] = 0
+        self.__histogram_shift[index] = shift
+
+    def count(self, index):
+        return self.__count[index]
+
+    def ewma(self, index):
+        return self.__ewma[index] / (1 << EWMA_SHIFT)
+
+    def mean_and_deviation(self, index):
+        # The mean and standard deviation of the raw readings. Note that this allocates memory
+        count = self.__count[index]
+        mean = (self.__mean[index] + (self.__mean_rem[index] / count)) / (1 << MEAN_SHIFT)
+        m2 = (self.__m2_hi[index] * 65536.0) + (self.__m2_lo[index] / 256.0)
+        variance = 0 if count < 2 else m2 / (count - 1)
+        return mean * (1 << VARIANCE_SHIFT), (variance ** 0.5) * (1 << VARIANCE_SHIFT)
+
+    def percentile(self, index, percent):
+        # Estimate the raw reading below which the given percentage of readings fall, interpolating within its bucket.
+        # The estimate is kept within the readings seen, as a bucket may be wider than the spread of its readings
+        target = self.__count[index] * percent / 100
+        offset = index * HISTOGRAM_BUCKETS
+        below = 0
+        for bucket in range(HISTOGRAM_BUCKETS):
+            in_bucket = self.__histogram[offset + bucket]
+            if in_bucket > 0 and below + in_bucket >= target:
+                estimate = self.__histogram_base[index] + (bucket + (target - below) / in_bucket) * (1 << self.__histogram_shift[index])
+                return min(max(estimate, self.__min[index]), self.__max[index])
+            below += in_bucket
+        return self.__max[index]
+
+
+class RawReadings:
+    """Records the max, min and average of raw (integer) sensor readings without allocating memory,
+    and converts them to real units only when processed. Also acts as a read-only view of the
+    processed readings, accessed by name like the dictionary returned by get_readings()"""
+
+    def __init__(self, names, conversions, flags=(), flag_defaults=()):
+        if len(names) != len(conversions):
+            raise ValueError("names and conversions must be the same length")
+
+        if len(flags) != len(flag_defaults):
+            raise ValueError("flags and flag_defaults must be the same length")
+
+        self.__names = tuple(names)
+        self.__conversions = conversions
+        self.__flag_defaults = flag_defaults
+        self.__num_stats = len(names)
+        self.__rolling = None
+
+        # Raw accumulators for each reading
+        self.__max = array('i', [0] * self.__num_stats)
+        self.__min = array('i', [0] * self.__num_stats)
+        self.__sum_hi = array('i', [0] * self.__num_stats)
+        self.__sum_lo = array('i', [0] * self.__num_stats)
+        self.__accumulators = (self.__max, self.__min, self.__sum_hi, self.__sum_lo)
+        self.__count = 0
+
+        # Boolean readings, such as faults, that hold their default until a reading differs from it, along with their latest values
+        self.flags = array('B', [0] * len(flags))
+        self.latest = array('B', [0] * len(flags))
+
+        # The converted readings, as max, min and avg for each
+        self.values = array('f', [0.0] * (self.__num_stats * 3))
+
+        names = [f"{name}_{stat}" for name in names for stat in ("max", "min", "avg")]
+        self.__keys = tuple(flags) + tuple(names)
+
+        self.clear()
+
+    def clear(self):
+        for i in range(self.__num_stats):
+            self.__max[i] = -SUM_SPLIT
+            self.__min[i] = SUM_SPLIT
+            self.__sum_hi[i] = 0
+            self.__sum_lo[i] = 0
+
+        for i in range(len(self.flags)):
+            self.flags[i] = self.__flag_defaults[i]
+            self.latest[i] = self.__flag_defaults[i]
+
+        self.__count = 0
+
+    def add(self, index, raw):
+        if raw > self.__max[index]:
+            self.__max[index] = raw
+        if raw < self.__min[index]:
+            self.__min[index] = raw
+
+        # Split the sum across two values, so it can grow without becoming a heap allocated int
+        lo = self.__sum_lo[index] + raw
+        if lo >= SUM_SPLIT:
+            lo -= SUM_SPLIT
+            self.__sum_hi[index] += 1
+        elif lo <= -SUM_SPLIT:
+            lo += SUM_SPLIT
+            self.__sum_hi[index] -= 1
+        self.__sum_lo[index] = lo
+
+        if self.__rolling is not None:
+            self.__rolling.add(index, raw)
+
+    def accumulators(self):
+        # The raw accumulators of each reading, for native code to add non-negative readings to directly, in the same
+        # way as add(). None whilst rolling statistics are kept, as those need every reading to pass through add()
+        return self.__accumulators if self.__rolling is None else None
+
+    def enable_rolling(self, time_constant):
+        # Also keep rolling statistics of each reading, that are not cleared along with the other readings
+        if self.__rolling is None:
+            self.__rolling = RollingStats(self.__num_stats, time_constant)
+        else:
+            self.__rolling.set_time_constant(time_constant)
+
+    def disable_rolling(self):
+        self.__rolling = None
+
+    def is_rolling(self):
+        return self.__rolling is not None
+
+    def add_rolling(self, index, raw):
+        # Add a reading to the rolling statistics alone, for checks that keep their own max, min and avg (such as monitor())
+        if self.__rolling is not None:
+            self.__rolling.add(index, raw)
+
+    def reset_rolling(self):
+        if self.__rolling is not None:
+            self.__rolling.reset()
+
+    def rolling_readings(self):
+        # Convert the rolling statistics of each reading into real units, as the moving average, standard deviation,
+        # and percentiles. Note that this allocates memory
+        readings = OrderedDict()
+        rolling = self.__rolling
+        if rolling is None:
+            return readings
+
+        for i in range(self.__num_stats):
+            if rolling.count(i) == 0:
+                continue
+
+            name = self.__names[i]
+            convert = self.__conversions[i]
+            mean, deviation = rolling.mean_and_deviation(i)
+            readings[name + "_ewma"] = convert(rolling.ewma(i))
+            readings[name + "_std"] = abs(convert(mean + deviation) - convert(mean - deviation)) / 2
+
+            # Conversions may map higher readings to lower values (e.g. temperature), so take percentiles from the other end
+            descending = convert(49152) < convert(16384)
+            for percent in PERCENTILES:
+                readings[name + "_p" + str(percent)] = convert(rolling.percentile(i, 100 - percent if descending else percent))
+        return readings
+
+    def set_flag(self, index, value):
+        self.latest[index] = value
+        if value != self.__flag_defaults[index]:
+            self.flags[index] = value
+
+    def tick(self):
+        self.__count += 1
+
+    def count(self):
+        return self.__count
+
+    def process(self):
+        # Convert the raw readings into real units. Returns False if there was nothing to process
+        if self.__count == 0:
+            return False
+
+        for i in range(self.__num_stats):
+            convert = self.__conversions[i]
+            first = convert(self.__max[i])
+            second = convert(self.__min[i])
+
+            # Conversions may map higher readings to lower values (e.g. temperature), so order the results
+            self.values[i * 3] = max(first, second)
+            self.values[i * 3 + 1] = min(first, second)
+            self.values[i * 3 + 2] = convert(((self.__sum_hi[i] * SUM_SPLIT) + self.__sum_lo[i]) / self.__count)
+
+        self.__count = 0    # Clear the count to prevent process readings acting more than once
+        return True
+
+    def stats(self, index):
+        # The processed max, min and avg of a reading, for assigning to a module's own variables
+        return self.values[index * 3], self.values[index * 3 + 1], self.values[index * 3 + 2]
+
+    def keys(self):
+        return self.__keys
+
+    def __len__(self):
+        return len(self.__keys)
+
+    def __getitem__(self, key):
+        index = self.__keys.index(key)
+        num_flags = len(self.flags)
+        if index < num_flags:
+            return self.flags[index] == 1
+        return self.values[index - num_flags]
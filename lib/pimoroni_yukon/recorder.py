@@ -0,0 +1,140 @@
+# SPDX-FileCopyrightText: 2025 Christopher Parrott for Pimoroni Ltd
+#
+# SPDX-License-Identifier: MIT
+
+from array import array
+from time import ticks_us, ticks_diff
+
+NUM_ADDRESSES = 16      # The number of mux addresses a sweep reads, and so the number of readings stored per tick
+FLAGS_PER_MODULE = 4    # The number of flag bits stored per registered module each tick
+
+
+class FlightRecorder:
+    """Records the raw readings of the last few monitor ticks into preallocated arrays, overwriting the oldest,
+    so that the moments leading up to a safety trip can be inspected afterwards. Recording does not allocate
+    memory, with readings only converted into real units once the recorder is frozen into a FlightRecord"""
+
+    def __init__(self, depth):
+        if not isinstance(depth, int) or depth < 1:
+            raise ValueError("depth out of range. Expected 1 or greater")
+
+        self.__depth = depth
+        self.__times = array('I', [0] * depth)
+        self.__samples = array('H', [0] * (depth * NUM_ADDRESSES))
+        self.__flags = array('I', [0] * depth)
+        self.__addresses = ()
+        self.__channels = ()
+        self.__flag_names = ()
+        self.clear()
+
+    def depth(self):
+        return self.__depth
+
+    def configure(self, channels, flag_names):
+        # Set the readings to record, as tuples of name, mux address and conversion, and the names of each flag bit (None for unused bits)
+        self.__channels = tuple(channels)
+        self.__addresses = tuple(channel[1] for channel in self.__channels)
+        self.__flag_names = tuple(flag_names)
+        self.clear()
+
+    def clear(self):
+        self.__next = 0
+        self.__count = 0
+
+    def record(self, values):
+        # Store the given sweep readings as the newest tick, carrying the last tick's flags forward until they are set
+        index = self.__next
+        previous = index - 1 if index > 0 else self.__depth - 1
+        self.__times[index] = ticks_us()
+        self.__flags[index] = self.__flags[previous] if self.__count > 0 else 0
+
+        samples = self.__samples
+        offset = index * NUM_ADDRESSES
+        for address in self.__addresses:
+            samples[offset + address] = values[address]
+
+        index += 1
+        self.__next = index if index < self.__depth else 0
+        if self.__count < self.__depth:
+            self.__count += 1
+
+    def set_flags(self, bits):
+        # Replace the flags of the newest tick
+        if self.__count > 0:
+            index = self.__next - 1 if self.__next > 0 else self.__depth - 1
+            self.__flags[index] = bits
+
+    def freeze(self):
+        # Copy the recorded ticks, oldest first, into a FlightRecord, with their times relative to the newest
+        count = self.__count
+        first = self.__next - count
+        if first < 0:
+            first += self.__depth
+
+        last_time = self.__times[self.__next - 1 if self.__next > 0 else self.__depth - 1]
+        times = []
+        samples = []
+        flags = []
+        for i in range(count):
+            index = (first + i) % self.__depth
+            times.append(ticks_diff(self.__times[index], last_time))
+            offset = index * NUM_ADDRESSES
+            samples.append(tuple(self.__samples[offset + address] for address in self.__addresses))
+            flags.append(self.__flags[index])
+
+        return FlightRecord(self.__channels, self.__flag_names, times, samples, flags)
+
+
+class FlightRecord:
+    """The readings of the monitor ticks leading up to a safety trip, oldest first, as frozen from a FlightRecorder.
+    Times are in microseconds relative to the tick of the trip, so are zero or negative"""
+
+    def __init__(self, channels, flag_names, times, samples, flags):
+        self.__channels = channels
+        self.__names = tuple(channel[0] for channel in channels)
+        self.__flag_names = flag_names
+        self.times = times
+        self.samples = samples
+        self.flags = flags
+
+    def __len__(self):
+        return len(self.times)
+
+    def names(self):
+        return self.__names
+
+    def flag_names(self):
+        return tuple(name for name in self.__flag_names if name is not None)
+
+    def raw(self, index, name):
+        return self.samples[index][self.__names.index(name)]
+
+    def reading(self, index, name):
+        channel = self.__names.index(name)
+        return self.__channels[channel][2](self.samples[index][channel])
+
+    def flag(self, index, name):
+        return (self.flags[index] & (1 << self.__flag_names.index(name))) != 0
+
+    def rows(self):
+        # Yield each tick as a tuple of its time, converted readings, then flags
+        flag_bits = tuple(bit for bit in range(len(self.__flag_names)) if self.__flag_names[bit] is not None)
+        for i in range(len(self.times)):
+            readings = tuple(self.__channels[c][2](self.samples[i][c]) for c in range(len(self.__channels)))
+            bits = tuple(int((self.flags[i] & (1 << bit)) != 0) for bit in flag_bits)
+            yield (self.times[i],) + readings + bits
+
+    def header(self):
+        return ("T_us",) + self.__names + self.flag_names()
+
+    def save(self, path):
+        # Write the record to a file as comma separated values, with a header row
+        with open(path, "w") as f:
+            f.write(",".join(self.header()) + "\n")
+            for row in self.rows():
+                f.write(",".join(str(value) if isinstance(value, int) else f"{value:.3f}" for value in row) + "\n")
+
+    def print(self):
+        print(", ".join(self.header()))
+        for row in self.rows():
+            print(", ".join(str(value) if isinstance(value, int) else f"{value:.3f}" for value in row))
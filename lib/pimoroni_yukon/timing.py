@@ -2,7 +2,7 @@
 #
 # SPDX-License-Identifier: MIT
 
-from time import ticks_ms, ticks_add, ticks_diff
+from time import ticks_ms, ticks_us, ticks_add, ticks_diff, sleep_ms, sleep_us
 
 
 # Handy class for performing consistent time intervals
@@ -61,3 +61,65 @@ class TimeChecker:
             # without catchup would be: self.ticks = ticks_add(self.ticks, self.interval)
             return True
         return False
+
+
+def idle_us(us):
+    # Sleep for whole milliseconds where possible, as this lets the processor idle, then wait out the remainder precisely
+    if us >= 1000:
+        sleep_ms(us // 1000)
+        us %= 1000
+    if us > 0:
+        sleep_us(us)
+
+
+# Spaces out repeated ticks (such as of Yukon's monitor) at a fixed rate until an end time, predicting how long each
+# tick takes so that the last one finishes by the end time rather than running past it
+class TickScheduler:
+    def __init__(self, rate_hz, end_ms):
+        if rate_hz <= 0:
+            raise ValueError("rate_hz must be greater than zero")
+
+        self.rate_hz = rate_hz
+        self.period_us = max(int(1000000 / rate_hz), 1)
+        now = ticks_us()
+        self.__end_us = ticks_add(now, max(ticks_diff(end_ms, ticks_ms()), 0) * 1000)
+        self.__start_us = now
+        self.__next_us = now
+        self.__tick_us = now
+        self.__predicted_us = -1
+        self.ticks = 0
+        self.overruns = 0   # How many ticks took longer than the period, and so could not keep up with the rate
+
+    def tick_started(self):
+        self.__tick_us = ticks_us()
+
+    def tick_finished(self):
+        duration = ticks_diff(ticks_us(), self.__tick_us)
+        if self.__predicted_us < 0:
+            self.__predicted_us = duration
+        else:
+            self.__predicted_us += (duration - self.__predicted_us) >> 2   # Average out the duration of recent ticks
+
+        self.ticks += 1
+        if duration > self.period_us:
+            self.overruns += 1
+
+    def wait_us(self):
+        # Return how long to wait until the next tick should start, or -1 if there is not enough time left for it
+        now = ticks_us()
+        self.__next_us = ticks_add(self.__next_us, self.period_us)
+        if ticks_diff(self.__next_us, now) < 0:
+            self.__next_us = now    # Behind schedule, so start the next tick now rather than trying to catch up
+
+        # Bring the last tick forward so it finishes by the end time, or skip it if that moment has already passed
+        latest_us = ticks_add(self.__end_us, -self.__predicted_us)
+        if ticks_diff(self.__next_us, latest_us) > 0:
+            if ticks_diff(latest_us, now) < 0:
+                return -1
+            self.__next_us = latest_us
+
+        return ticks_diff(self.__next_us, now)
+
+    def achieved_hz(self):
+        elapsed_us = ticks_diff(ticks_us(), self.__start_us)
+        return 0 if elapsed_us <= 0 else self.ticks * 1000000 / elapsed_us
@@ -0,0 +1,60 @@
+import os
+import sys
+
+import pytest
+
+"""
+Fixtures for testing the pimoroni_yukon library against the simulator in tools/yukon_sim.
+Each test gets a freshly installed simulator, with the library imported afresh, so that
+whether the native monitor is present is decided per test. Tests run from a temporary
+directory, so that files the library writes (such as its detection cache) do not persist.
+"""
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tools"))
+
+import yukon_sim   # noqa: E402
+
+
+def install(native_monitor=False):
+    # Remove any previously imported copy of the library, so it imports the stand-in modules of this install
+    for name in [name for name in sys.modules if name == "pimoroni_yukon" or name.startswith("pimoroni_yukon.")]:
+        del sys.modules[name]
+    return yukon_sim.install(native_monitor=native_monitor)
+
+
+@pytest.fixture
+def board(tmp_path, monkeypatch):
+    # A simulated board, with the library sweeping and checking each monitor tick in Python
+    monkeypatch.chdir(tmp_path)
+    return install()
+
+
+@pytest.fixture(params=("standard", "zero_alloc", "native"))
+def monitor_mode(request, tmp_path, monkeypatch):
+    # Run a test in each way Yukon can monitor: the standard and zero allocation modes in Python, and with the native
+    # monitor. Returns the simulated board, the monitor mode to change to once a Yukon is created, and whether it is native
+    monkeypatch.chdir(tmp_path)
+    native = request.param == "native"
+    board = install(native_monitor=native)
+
+    from pimoroni_yukon import Yukon
+    return board, Yukon.MONITOR_ZERO_ALLOC if request.param == "zero_alloc" else Yukon.MONITOR_STANDARD, native
+
+
+@pytest.fixture
+def make_yukon():
+    # Create Yukons that log nothing, resetting each at the end of the test
+    created = []
+
+    def make(**kwargs):
+        from pimoroni_yukon import Yukon
+        from pimoroni_yukon.logging import LOG_NONE
+
+        kwargs.setdefault("logging_level", LOG_NONE)
+        yukon = Yukon(**kwargs)
+        created.append(yukon)
+        return yukon
+
+    yield make
+    for yukon in created:
+        yukon.reset()
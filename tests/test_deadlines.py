@@ -0,0 +1,69 @@
+import pytest
+
+"""
+Tests how monitor_until_ms() handles being given an end time that has already passed,
+either catching up by returning at once, or skipping whole periods to return to schedule.
+"""
+
+PERIOD_MS = 10      # The period of the calling loop
+LATE_MS = 25        # How far in the past each end time is given, between two and three periods
+
+
+@pytest.fixture
+def yukon(board, make_yukon):
+    board.attach(1, "BigMotorModule")
+
+    from pimoroni_yukon.modules import BigMotorModule
+    yukon = make_yukon()
+    yukon.register_with_slot(BigMotorModule(), 1)
+    yukon.verify_and_initialise()
+    yukon.enable_main_output()
+    return yukon
+
+
+def test_catch_up(yukon):
+    from pimoroni_yukon.timing import ticks_ms, ticks_add, ticks_diff
+
+    yukon.clear_deadline_stats()
+    end_ms = ticks_add(ticks_ms(), -LATE_MS)
+    assert yukon.monitor_until_ms(end_ms) == end_ms
+
+    stats = yukon.get_deadline_stats()
+    assert stats["calls"] == 1
+    assert stats["missed"] == 1
+    assert stats["skipped"] == 0
+    assert stats["last_late_ms"] >= LATE_MS
+
+    # An end time in the future is not missed
+    end_ms = ticks_add(ticks_ms(), PERIOD_MS)
+    assert yukon.monitor_until_ms(end_ms) == end_ms
+    assert ticks_diff(ticks_ms(), end_ms) >= 0
+    assert yukon.get_deadline_stats()["missed"] == 1
+
+
+def test_skip(yukon):
+    from pimoroni_yukon import Yukon
+    from pimoroni_yukon.timing import ticks_ms, ticks_add, ticks_diff
+
+    yukon.set_deadline_policy(Yukon.DEADLINE_SKIP, PERIOD_MS)
+    yukon.clear_deadline_stats()
+    end_ms = ticks_add(ticks_ms(), -LATE_MS)
+    new_end_ms = yukon.monitor_until_ms(end_ms)
+
+    # The end time moves on by whole periods, just enough to be back in the future
+    stats = yukon.get_deadline_stats()
+    assert stats["missed"] == 1
+    assert stats["skipped"] >= 3
+    assert new_end_ms == ticks_add(end_ms, stats["skipped"] * PERIOD_MS)
+    assert stats["last_late_ms"] < PERIOD_MS
+    assert ticks_diff(ticks_ms(), new_end_ms) >= 0
+
+
+def test_skip_needs_period(yukon):
+    from pimoroni_yukon import Yukon
+
+    with pytest.raises(ValueError):
+        yukon.set_deadline_policy(Yukon.DEADLINE_SKIP)
+    with pytest.raises(ValueError):
+        yukon.set_deadline_policy(Yukon.DEADLINE_SKIP, 0)
+    assert yukon.get_deadline_policy() == Yukon.DEADLINE_CATCH_UP
@@ -0,0 +1,67 @@
+import json
+
+import pytest
+
+"""
+Tests that verify_and_initialise(use_cache=True) reuses the modules it detected last time,
+and detects them again whenever what is attached has changed.
+"""
+
+
+@pytest.fixture
+def verify(board, make_yukon):
+    # Verify a Big Motor in slot 1 using the cache, returning the number of ADC reads it took
+    from pimoroni_yukon.modules import BigMotorModule
+
+    def verify():
+        yukon = make_yukon()
+        yukon.register_with_slot(BigMotorModule(), 1)
+        board.reset_counters()
+        yukon.verify_and_initialise(allow_unregistered=True, use_cache=True)
+        return board.adc_reads
+
+    make_yukon().clear_detection_cache()
+    return verify
+
+
+def cached_names(yukon_class):
+    with open(yukon_class.DETECTION_CACHE_FILE) as file:
+        return {slot: entry[1] for slot, entry in json.load(file)["slots"].items()}
+
+
+def test_cache_hit(board, verify):
+    from pimoroni_yukon import Yukon
+    board.attach(1, "BigMotorModule")
+    board.attach(2, "LEDStripModule")
+
+    detect_reads = verify()
+    assert cached_names(Yukon) == {"1": "BigMotorModule", "2": "LEDStripModule", "3": None, "4": None, "5": None, "6": None}
+
+    # Nothing has changed, so fewer readings are needed to confirm the same modules are attached
+    assert verify() < detect_reads
+
+
+def test_cache_miss_same_signature(board, verify):
+    # A Dual Motor shares the Big Motor's SLOW levels, so only its ADC levels reveal the swap
+    from pimoroni_yukon.errors import VerificationError
+    board.attach(1, "BigMotorModule")
+    verify()
+
+    board.detach(1)
+    board.attach(1, "DualMotorModule")
+    with pytest.raises(VerificationError):
+        verify()
+
+
+def test_cache_miss_new_signature(board, verify):
+    from pimoroni_yukon import Yukon
+    board.attach(1, "BigMotorModule")
+    verify()
+
+    board.attach(2, "LEDStripModule")
+    verify()
+    assert cached_names(Yukon)["2"] == "LEDStripModule"
+
+    board.detach(2)
+    verify()
+    assert cached_names(Yukon)["2"] is None
@@ -0,0 +1,66 @@
+import pytest
+
+"""
+Tests that the error raised by a safety trip carries a flight record of the ticks leading up
+to it, holding the readings and module flags that caused the trip.
+"""
+
+DEPTH = 8           # The number of ticks the recorder is asked to keep
+TICKS_BEFORE = 4    # The number of ticks monitored before each trip, fewer than the recorder's depth
+
+
+@pytest.fixture
+def yukon(monitor_mode, make_yukon):
+    board, mode, _ = monitor_mode
+    board.attach(1, "BigMotorModule")
+    board.attach(4, "DualOutputModule")
+
+    from pimoroni_yukon.modules import BigMotorModule, DualOutputModule
+    yukon = make_yukon()
+    yukon.register_with_slot(BigMotorModule(), 1)
+    yukon.register_with_slot(DualOutputModule(), 4)
+    yukon.verify_and_initialise()
+    yukon.change_monitor_mode(mode)
+    yukon.enable_flight_recorder(DEPTH)
+    yukon.enable_main_output()
+    return yukon
+
+
+def test_record_of_fault(monitor_mode, yukon):
+    from pimoroni_yukon.errors import FaultError
+    board, _, _ = monitor_mode
+
+    for _ in range(TICKS_BEFORE):
+        yukon.monitor()
+    board.press("SLOT1_SLOW2")  # The Big Motor's fault output, which is active low
+    with pytest.raises(FaultError) as info:
+        yukon.monitor()
+
+    record = info.value.flight_record
+    assert record is yukon.last_flight_record()
+    assert len(record) == TICKS_BEFORE + 1
+    assert "S1_Fault" in record.flag_names()
+    for name in ("Vi", "C", "S1_ADC1"):
+        assert name in record.names()
+
+    # Only the tick that tripped saw the fault
+    assert [record.flag(i, "S1_Fault") for i in range(len(record))] == [False] * TICKS_BEFORE + [True]
+
+
+def test_record_of_over_current(monitor_mode, yukon):
+    from pimoroni_yukon.errors import OverCurrentError
+    board, _, _ = monitor_mode
+
+    yukon.set_current_limit(2)
+    board.current = 0.5
+    for _ in range(DEPTH + 2):
+        yukon.monitor()
+    board.current = 3
+    with pytest.raises(OverCurrentError) as info:
+        yukon.monitor()
+
+    # Only the most recent ticks are kept, the last of which holds the current that tripped
+    record = info.value.flight_record
+    assert len(record) == DEPTH
+    assert record.reading(DEPTH - 1, "C") == pytest.approx(3, abs=0.1)
+    assert record.reading(DEPTH - 2, "C") == pytest.approx(0.5, abs=0.1)
@@ -0,0 +1,101 @@
+import pytest
+
+"""
+Tests that monitoring turns off the main output and raises the right error when each of
+Yukon's limits is exceeded, whichever way it monitors.
+"""
+
+UNDERVOLTAGE_TICKS = 10     # More monitor ticks than an under voltage should take to trip
+
+
+@pytest.fixture
+def yukon(monitor_mode, make_yukon):
+    board, mode, _ = monitor_mode
+    board.attach(1, "BigMotorModule")
+
+    from pimoroni_yukon.modules import BigMotorModule
+    yukon = make_yukon()
+    yukon.register_with_slot(BigMotorModule(), 1)
+    yukon.verify_and_initialise()
+    yukon.change_monitor_mode(mode)
+    yukon.enable_main_output()
+    return yukon
+
+
+def test_native_monitor_used(monitor_mode, yukon):
+    import pimoroni_yukon
+    _, _, native = monitor_mode
+    assert (pimoroni_yukon.yukon_monitor is not None) == native
+
+
+def test_no_trip(yukon):
+    for _ in range(5):
+        yukon.monitor()
+    assert yukon.is_main_output_enabled()
+
+
+def test_over_current(monitor_mode, yukon):
+    from pimoroni_yukon.errors import OverCurrentError
+    board, _, _ = monitor_mode
+
+    yukon.set_current_limit(2)
+    yukon.monitor()
+    board.current = 3
+    with pytest.raises(OverCurrentError):
+        yukon.monitor()
+    assert not yukon.is_main_output_enabled()
+
+
+def test_over_temperature(monitor_mode, yukon):
+    from pimoroni_yukon.errors import OverTemperatureError
+    board, _, _ = monitor_mode
+
+    board.temperature = 90
+    with pytest.raises(OverTemperatureError):
+        yukon.monitor()
+    assert not yukon.is_main_output_enabled()
+
+
+def test_under_voltage(monitor_mode, yukon):
+    from pimoroni_yukon.errors import UnderVoltageError
+    board, _, _ = monitor_mode
+
+    # A brief dip is tolerated, but one that lasts is not
+    board.voltage_in = 3.0
+    yukon.monitor()
+    assert yukon.is_main_output_enabled()
+
+    with pytest.raises(UnderVoltageError):
+        for _ in range(UNDERVOLTAGE_TICKS):
+            yukon.monitor()
+    assert not yukon.is_main_output_enabled()
+
+
+def test_module_fault(monitor_mode, yukon):
+    from pimoroni_yukon.errors import FaultError
+    board, _, _ = monitor_mode
+
+    board.press("SLOT1_SLOW2")  # The Big Motor's fault output, which is active low
+    with pytest.raises(FaultError):
+        yukon.monitor()
+    assert not yukon.is_main_output_enabled()
+
+
+def test_no_trip_with_output_off(monitor_mode, make_yukon):
+    # Monitoring carries on whilst the output is off, without mistaking the lack of output voltage for a short circuit.
+    # A Big Motor holds its fault output low when unpowered, so a module whose signals do not change is used instead
+    board, mode, _ = monitor_mode
+    board.attach(1, "DualOutputModule")
+
+    from pimoroni_yukon.modules import DualOutputModule
+    yukon = make_yukon()
+    yukon.register_with_slot(DualOutputModule(), 1)
+    yukon.verify_and_initialise()
+    yukon.change_monitor_mode(mode)
+
+    yukon.enable_main_output()
+    yukon.monitor()
+    yukon.disable_main_output()
+    for _ in range(5):
+        yukon.monitor()
+    assert not yukon.is_main_output_enabled()
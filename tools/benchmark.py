@@ -0,0 +1,298 @@
+import gc
+import sys
+import time
+import json
+
+"""
+This program measures the cost of the pimoroni_yukon library's hot paths:
+- Yukon.monitor() throughput and per-tick latency, with 0 to 6 registered modules
+- The time each module's own monitor() adds to a tick
+- Module detection (per slot) and verify_and_initialise()
+- Heap allocated per tick (MicroPython only), and I2C transactions per tick (simulator only)
+- Heap allocated over a long run of ticks with all modules registered (MicroPython only)
+
+It runs either on a Yukon, benchmarking whichever modules are attached, or on a computer
+using the simulator in tools/yukon_sim, where six modules are simulated. For example:
+
+    python tools/benchmark.py --save            # Record a new baseline
+    python tools/benchmark.py                   # Compare against the baseline
+    python tools/benchmark.py --zero-alloc      # Benchmark Yukon's zero allocation monitor mode
+    python tools/benchmark.py --temperature-interval 10     # Sample temperatures every 10th tick
+
+Results are compared against the baseline file if one exists. Any timing that has become
+worse by more than TIME_TOLERANCE, or any count of allocations or I2C transactions that has
+increased at all, is reported as a regression. Baselines are only compared against results
+taken with the same monitor mode and temperature interval.
+"""
+
+# Constants
+TICKS = 200                                 # The number of monitor ticks to time for each module count
+WARMUP_TICKS = 10                           # The number of untimed ticks to perform first
+DETECTION_REPEATS = 5                       # The number of times to detect each slot
+MODULE_REPEATS = 100                        # The number of times to call each module's monitor()
+BASELINE_FILE = "benchmark_baseline.json"   # Where to save and load baseline results
+SAVE_BASELINE = False                       # Whether to save the results as the new baseline
+TIME_TOLERANCE = 0.25                       # How much worse a timing can get before being a regression
+COUNT_TOLERANCE = 0.0                       # How much worse a count (of bytes or I2C transactions) can get
+LOOP_PERIODS_MS = (10, 20)                  # Control loop periods to report the monitor's share of
+STEADY_TICKS = 10000                        # The number of ticks to check for steady state allocations over
+ZERO_ALLOC = False                          # Whether to benchmark the zero allocation monitor mode
+TEMPERATURE_INTERVAL = 1                    # How many ticks to sample temperatures every
+
+# Handle command line arguments, when there are any
+args = sys.argv[1:] if hasattr(sys, "argv") else []
+if "--save" in args:
+    SAVE_BASELINE = True
+if "--baseline" in args:
+    BASELINE_FILE = args[args.index("--baseline") + 1]
+if "--zero-alloc" in args:
+    ZERO_ALLOC = True
+if "--temperature-interval" in args:
+    TEMPERATURE_INTERVAL = int(args[args.index("--temperature-interval") + 1])
+
+# Use the simulator if it is available (i.e. when not running on a Yukon)
+try:
+    import yukon_sim
+    sim = yukon_sim.install()
+except ImportError:
+    sim = None
+
+from pimoroni_yukon import Yukon                            # noqa: E402
+from pimoroni_yukon.logging import LOG_NONE                 # noqa: E402
+from pimoroni_yukon.modules import BigMotorModule, DualOutputModule, BenchPowerModule, DualMotorModule, QuadServoRegModule, LEDStripModule   # noqa: E402
+
+# The modules to simulate in slots 1 to 6, and how to create their drivers
+SIM_MODULES = (
+    ("BigMotorModule", lambda: BigMotorModule()),
+    ("DualOutputModule", lambda: DualOutputModule()),
+    ("BenchPowerModule", lambda: BenchPowerModule()),
+    ("DualMotorModule", lambda: DualMotorModule()),
+    ("QuadServoRegModule", lambda: QuadServoRegModule()),
+    ("LEDStripModule", lambda: LEDStripModule(LEDStripModule.NEOPIXEL, 0, 0, 60)),
+)
+
+
+def mem_alloc():
+    # Heap allocation tracking is only meaningful on MicroPython
+    return gc.mem_alloc() if hasattr(gc, "mem_alloc") else None
+
+
+def i2c_transactions():
+    return sim.i2c_transactions() if sim is not None else None
+
+
+def percentile(ordered, fraction):
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def summarise(samples):
+    # Reduce a list of durations in microseconds to its key statistics
+    ordered = sorted(samples)
+    total = sum(ordered)
+    return {
+        "mean_us": total / len(ordered),
+        "p50_us": percentile(ordered, 0.50),
+        "p90_us": percentile(ordered, 0.90),
+        "p99_us": percentile(ordered, 0.99),
+        "max_us": ordered[-1],
+    }
+
+
+def find_modules(yukon):
+    # Create a driver for each module in the board's slots, in slot order
+    modules = []
+    if sim is not None:
+        for slot, (name, factory) in enumerate(SIM_MODULES, 1):
+            sim.attach(slot, name)
+            modules.append((slot, factory()))
+    else:
+        for slot in range(1, Yukon.NUM_SLOTS + 1):
+            detected = yukon.detect_in_slot(slot)
+            if detected is not None and detected.__name__ != "YukonModule":
+                try:
+                    modules.append((slot, detected()))   # Only modules that need no arguments can be benchmarked
+                except Exception as e:
+                    print(f"[Slot{slot}] Skipping '{detected.NAME}', as it could not be created: {e}")
+    return modules
+
+
+def bench_detection(yukon, results):
+    durations = []
+    for slot in range(1, Yukon.NUM_SLOTS + 1):
+        slot_durations = []
+        for _ in range(DETECTION_REPEATS):
+            start = time.ticks_us()
+            yukon.detect_in_slot(slot)
+            durations.append(time.ticks_diff(time.ticks_us(), start))
+            slot_durations.append(yukon.detection_time_us(slot))
+
+        # Record the time spent sampling and matching the slot, excluding the output voltage check before it
+        slot_stats = summarise(slot_durations)
+        results[f"detect.slot{slot}_us"] = slot_stats["mean_us"]
+        print(f"[Slot{slot}] Detect:          mean {slot_stats['mean_us'] / 1000:.2f} ms")
+
+    stats = summarise(durations)
+    results["detect.mean_us"] = stats["mean_us"]
+    results["detect.max_us"] = stats["max_us"]
+    print(f"Detect slot:             mean {stats['mean_us'] / 1000:.2f} ms, max {stats['max_us'] / 1000:.2f} ms")
+
+
+def bench_monitor(yukon, modules, count, results):
+    # Register the first `count` modules, then time the monitor with them
+    yukon.disable_main_output()
+    for slot in range(1, Yukon.NUM_SLOTS + 1):
+        yukon.deregister_slot(slot)
+    for slot, module in modules[:count]:
+        yukon.register_with_slot(module, slot)
+
+    start = time.ticks_us()
+    yukon.verify_and_initialise(allow_unregistered=True, allow_no_modules=True)
+    verify_us = time.ticks_diff(time.ticks_us(), start)
+    yukon.change_monitor_mode(Yukon.MONITOR_ZERO_ALLOC if ZERO_ALLOC else Yukon.MONITOR_STANDARD)
+    yukon.set_temperature_interval(TEMPERATURE_INTERVAL)
+    yukon.enable_main_output()
+
+    for _ in range(WARMUP_TICKS):
+        yukon.monitor()
+
+    durations = []
+    allocs = []
+    gc.collect()
+    if sim is not None:
+        sim.reset_counters()
+
+    start_all = time.ticks_us()
+    for _ in range(TICKS):
+        before = mem_alloc()
+        start = time.ticks_us()
+        yukon.monitor()
+        durations.append(time.ticks_diff(time.ticks_us(), start))
+        if before is not None:
+            allocated = mem_alloc() - before
+            if allocated >= 0:      # A negative value means a collection happened mid-tick, so discard it
+                allocs.append(allocated)
+    total_us = time.ticks_diff(time.ticks_us(), start_all)
+    transactions = i2c_transactions()
+
+    stats = summarise(durations)
+    prefix = f"monitor[{count}]."
+    for key, value in stats.items():
+        results[prefix + key] = value
+    results[prefix + "ticks_per_s"] = TICKS * 1000000 / total_us
+    results[prefix + "verify_us"] = verify_us
+    if allocs:
+        results[prefix + "alloc_bytes"] = sum(allocs) / len(allocs)
+    if transactions is not None:
+        results[prefix + "i2c"] = transactions / TICKS
+
+    line = f"Monitor, {count} module(s):  {results[prefix + 'ticks_per_s']:.0f} ticks/s, "
+    line += f"p50 {stats['p50_us']} us, p99 {stats['p99_us']} us, max {stats['max_us']} us"
+    if allocs:
+        line += f", {results[prefix + 'alloc_bytes']:.0f} B/tick"
+    if transactions is not None:
+        line += f", {results[prefix + 'i2c']:.1f} I2C/tick"
+    print(line)
+
+    budget = ", ".join(f"{100 * stats['p99_us'] / (period * 1000):.1f}% of {period} ms" for period in LOOP_PERIODS_MS)
+    print(f"                         verify {verify_us / 1000:.1f} ms, p99 tick uses {budget}")
+
+
+def bench_steady_alloc(yukon, results):
+    # Check the heap over a long run of ticks, with all modules still registered from the last monitor run.
+    # Automatic collections are disabled so that every allocation is seen
+    if mem_alloc() is None:
+        return
+
+    gc.collect()
+    gc.disable()
+    try:
+        before = mem_alloc()
+        for _ in range(STEADY_TICKS):
+            yukon.monitor()
+        allocated = mem_alloc() - before
+    finally:
+        gc.enable()
+        yukon.clear_readings()
+
+    results["steady.alloc_bytes"] = allocated
+    print(f"Steady state:            {allocated} B allocated over {STEADY_TICKS} ticks")
+
+
+def bench_modules(modules, results):
+    # Time each module's own monitor() in isolation. All modules are still registered from the last monitor run
+    for slot, module in modules:
+        durations = []
+        for _ in range(MODULE_REPEATS):
+            start = time.ticks_us()
+            module.monitor()
+            durations.append(time.ticks_diff(time.ticks_us(), start))
+        module.clear_readings()
+
+        stats = summarise(durations)
+        name = type(module).__name__
+        results[f"module.{name}.mean_us"] = stats["mean_us"]
+        print(f"[Slot{slot}] {module.NAME + ':':<30} mean {stats['mean_us']:.0f} us, p99 {stats['p99_us']} us")
+
+
+def compare(results, baseline):
+    # Report any metric that has got worse by more than its tolerance. Only ticks_per_s is better when higher
+    regressions = 0
+    for key, value in results.items():
+        old = baseline.get(key)
+        if not isinstance(old, (int, float)) or not isinstance(value, (int, float)) or old == 0:
+            continue
+
+        change = (value - old) / old
+        if key.endswith("ticks_per_s"):
+            change = -change
+
+        counted = key.endswith("alloc_bytes") or key.endswith("i2c")
+        if change > (COUNT_TOLERANCE if counted else TIME_TOLERANCE):
+            regressions += 1
+            print(f"REGRESSION {key}: {old:.2f} -> {value:.2f} ({100 * change:+.1f}% worse)")
+
+    if regressions == 0:
+        print(f"No regressions against {BASELINE_FILE} (timing tolerance {100 * TIME_TOLERANCE:.0f}%)")
+    return regressions
+
+
+# Variables
+yukon = Yukon(logging_level=LOG_NONE)       # Create a Yukon object, with logging off so as not to skew timings
+results = {"platform": sys.platform, "implementation": sys.implementation.name,
+           "monitor_mode": "zero_alloc" if ZERO_ALLOC else "standard",
+           "temperature_interval": TEMPERATURE_INTERVAL}
+
+# Wrap the code in a try block, to catch any exceptions (including KeyboardInterrupt)
+try:
+    modules = find_modules(yukon)
+
+    print(f"Benchmarking on {sys.platform} ({sys.implementation.name}) with {len(modules)} module(s), in {results['monitor_mode']} monitor mode, "
+          f"sampling temperatures every {TEMPERATURE_INTERVAL} tick(s)\n")
+
+    bench_detection(yukon, results)
+    for count in range(len(modules) + 1):
+        bench_monitor(yukon, modules, count, results)
+    bench_steady_alloc(yukon, results)
+    bench_modules(modules, results)
+    print()
+
+    try:
+        with open(BASELINE_FILE) as f:
+            baseline = json.load(f)
+    except OSError:
+        baseline = None
+
+    if baseline is not None and not SAVE_BASELINE:
+        if baseline.get("monitor_mode", "standard") != results["monitor_mode"] or baseline.get("temperature_interval", 1) != TEMPERATURE_INTERVAL:
+            print(f"Not comparing against {BASELINE_FILE}, as it was taken with a different monitor mode or temperature interval")
+        else:
+            compare(results, baseline)
+
+    if SAVE_BASELINE:
+        with open(BASELINE_FILE, "w") as f:
+            json.dump(results, f)
+        print(f"Saved baseline to {BASELINE_FILE}")
+
+finally:
+    # Put the board back into a safe state, regardless of how the program may have ended
+    yukon.reset()
@@ -0,0 +1,58 @@
+import os
+import re
+import sys
+
+"""
+This program checks that a built firmware fits within the part of flash left to it by
+the board's flash layout. The layout comes from the board's headers: the flash size
+(PICO_FLASH_SIZE_BYTES) less the filesystem stored at the end of it
+(MICROPY_HW_FLASH_STORAGE_BYTES). As the pimoroni_yukon library is frozen into the
+firmware, it is included in the size checked. CI runs it after each build:
+
+    python3 tools/firmware_size.py firmware/PIMORONI_YUKON path/to/firmware.bin
+
+It runs on a computer, rather than on a Yukon.
+"""
+
+# Constants
+FLASH_SIZE_DEFINE = "PICO_FLASH_SIZE_BYTES"             # The define giving the size of the board's flash
+STORAGE_SIZE_DEFINE = "MICROPY_HW_FLASH_STORAGE_BYTES"  # The define giving the size of the filesystem
+WARNING_FREE = 64 * 1024                                # Warn when less than this much flash is left for the firmware to grow into
+
+
+def find_define(board_dir, name):
+    # Find the value of a define in any of the board's headers, evaluating simple expressions such as (16 * 1024 * 1024)
+    pattern = re.compile(r"^\s*#define\s+" + name + r"\s+(.+?)\s*(//.*)?$")
+    for file in sorted(os.listdir(board_dir)):
+        if file.endswith(".h"):
+            with open(os.path.join(board_dir, file)) as header:
+                for line in header:
+                    match = pattern.match(line)
+                    if match and re.fullmatch(r"[\d\s()*+]+", match.group(1)):
+                        return eval(match.group(1))
+    raise ValueError(f"{name} is not defined in the headers of {board_dir}")
+
+
+def format_kb(size):
+    return f"{size / 1024:.1f}KB"
+
+
+if len(sys.argv) != 3:
+    print(f"Usage: {sys.argv[0]} <board dir> <firmware.bin>")
+    sys.exit(2)
+
+board_dir, firmware = sys.argv[1:]
+flash_size = find_define(board_dir, FLASH_SIZE_DEFINE)
+storage_size = find_define(board_dir, STORAGE_SIZE_DEFINE)
+available = flash_size - storage_size
+used = os.path.getsize(firmware)
+free = available - used
+
+print(f"Flash: {format_kb(flash_size)}, of which the filesystem takes {format_kb(storage_size)}, leaving {format_kb(available)} for the firmware")
+print(f"Firmware: {format_kb(used)} ({100 * used / available:.1f}% of that), leaving {format_kb(free)} free")
+
+if free < 0:
+    print(f"Error: The firmware is {format_kb(-free)} too large, and would overlap the filesystem")
+    sys.exit(1)
+elif free < WARNING_FREE:
+    print(f"Warning: Less than {format_kb(WARNING_FREE)} is left for the firmware to grow into")
@@ -0,0 +1,87 @@
+import gc
+import sys
+import time
+
+"""
+This program reports the time and heap taken to import the pimoroni_yukon library
+from each place it can be found: frozen into the firmware, or as source files on the
+filesystem (where it lived before being frozen). Source files are compiled into RAM
+when imported, whereas frozen modules are compiled ahead of time and run from flash.
+
+To compare both, copy the lib/pimoroni_yukon folder to Yukon's /lib folder, then run
+this straight after a reset. Heap usage is only reported on MicroPython. It can also
+be run on a computer using the simulator in tools/yukon_sim, where only the source
+files are available:
+
+    python tools/frozen_report.py
+"""
+
+# Constants
+FROZEN_PATH = ".frozen"     # The entry of sys.path that frozen modules are imported from
+
+# Use the simulator if it is available (i.e. when not running on a Yukon)
+try:
+    import yukon_sim
+    yukon_sim.install()
+except ImportError:
+    pass
+
+
+def mem_free():
+    # Heap tracking is only meaningful on MicroPython
+    gc.collect()
+    return gc.mem_free() if hasattr(gc, "mem_free") else None
+
+
+def unload_library():
+    # Remove every part of the library from the imported modules, so the next import starts afresh
+    for name in [name for name in sys.modules if name == "pimoroni_yukon" or name.startswith("pimoroni_yukon.")]:
+        del sys.modules[name]
+    gc.collect()
+
+
+def import_library():
+    from pimoroni_yukon import Yukon    # noqa: F401
+    import pimoroni_yukon
+    return pimoroni_yukon.__file__ if hasattr(pimoroni_yukon, "__file__") else "unknown"
+
+
+def measure(frozen):
+    # Import the library with sys.path arranged to find either the frozen or the source copy first. Returns where it
+    # was imported from, how long it took in microseconds, how much more heap was in use afterwards, and the free heap
+    original = list(sys.path)
+    if FROZEN_PATH in sys.path:
+        sys.path.remove(FROZEN_PATH)
+    if frozen:
+        sys.path.insert(0, FROZEN_PATH)
+
+    unload_library()
+    try:
+        before = mem_free()
+        start = time.ticks_us()
+        location = import_library()
+        duration = time.ticks_diff(time.ticks_us(), start)
+        after = mem_free()
+    except ImportError:
+        return None
+    finally:
+        sys.path.clear()
+        sys.path.extend(original)
+
+    if frozen != location.startswith(FROZEN_PATH):
+        return None     # The other copy was found instead, so this one is not available
+    return location, duration, None if before is None else before - after, after
+
+
+def format_bytes(size):
+    return "n/a" if size is None else f"{size} bytes"
+
+
+print(f"Import report on {sys.platform} ({sys.implementation.name})\n")
+for name, frozen in (("Frozen", True), ("Source", False)):
+    result = measure(frozen)
+    if result is None:
+        print(f"{name}: not available")
+    else:
+        location, duration, used, free = result
+        print(f"{name}: {duration / 1000:.1f} ms, {format_bytes(used)} used, {format_bytes(free)} free, from {location}")
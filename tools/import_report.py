@@ -0,0 +1,76 @@
+import gc
+import sys
+import time
+
+"""
+This program reports the time and heap taken to import the pimoroni_yukon library,
+comparing a program that only uses one module (where only that module's driver is
+imported) against importing every module driver, as happened before drivers were
+loaded lazily. Heap usage is only reported on MicroPython.
+
+Run it straight after a reset for the most representative numbers, either on a Yukon
+or on a computer using the simulator in tools/yukon_sim:
+
+    python tools/import_report.py
+"""
+
+# Constants
+MODULE_NAME = "DualOutputModule"    # The module a typical single-module program would use
+
+# Use the simulator if it is available (i.e. when not running on a Yukon)
+try:
+    import yukon_sim
+    yukon_sim.install()
+except ImportError:
+    pass
+
+
+def mem_alloc():
+    # Heap allocation tracking is only meaningful on MicroPython
+    gc.collect()
+    return gc.mem_alloc() if hasattr(gc, "mem_alloc") else None
+
+
+def measure(func):
+    # Return how long a function took to run in microseconds, and how much more heap was in use afterwards
+    before = mem_alloc()
+    start = time.ticks_us()
+    func()
+    duration = time.ticks_diff(time.ticks_us(), start)
+    after = mem_alloc()
+    return duration, None if before is None else after - before
+
+
+def import_lazily():
+    from pimoroni_yukon import Yukon    # noqa: F401
+    import pimoroni_yukon.modules
+    getattr(pimoroni_yukon.modules, MODULE_NAME)
+
+
+def import_remaining():
+    from pimoroni_yukon.modules import KNOWN_MODULES   # noqa: F401
+
+
+def drivers_loaded():
+    return sorted(name for name in sys.modules if name.startswith("pimoroni_yukon.modules.") and not name.endswith(".common"))
+
+
+def format_bytes(size):
+    return "n/a" if size is None else f"{size} bytes"
+
+
+lazy_us, lazy_bytes = measure(import_lazily)
+lazy_drivers = drivers_loaded()
+rest_us, rest_bytes = measure(import_remaining)
+eager_drivers = drivers_loaded()
+
+eager_us = lazy_us + rest_us
+eager_bytes = None if lazy_bytes is None else lazy_bytes + rest_bytes
+
+print(f"Import report on {sys.platform} ({sys.implementation.name}), for a program using {MODULE_NAME}\n")
+print(f"Lazy:  {lazy_us / 1000:.1f} ms, {format_bytes(lazy_bytes)}, {len(lazy_drivers)} driver(s) imported")
+print(f"Eager: {eager_us / 1000:.1f} ms, {format_bytes(eager_bytes)}, {len(eager_drivers)} driver(s) imported")
+if lazy_bytes is not None:
+    print(f"Saved: {rest_us / 1000:.1f} ms, {rest_bytes} bytes")
+else:
+    print(f"Saved: {rest_us / 1000:.1f} ms")
@@ -0,0 +1,174 @@
+import sys
+
+"""
+This program builds the table of which module each detection signature belongs to,
+the same table Yukon uses to match modules, and prints it as a markdown table.
+Any signatures claimed by more than one module are reported, which is useful for
+checking that a custom module's address does not clash with any existing module.
+It also checks that the signature bitmasks in MODULE_REGISTRY still match each
+driver's is_module(), printing the correct bitmask for any that do not.
+
+It runs either on a Yukon, or on a computer using the simulator in tools/yukon_sim,
+where it can also regenerate the bitmasks in MODULE_REGISTRY (along with the comment
+describing each), and the signature table in the module detection docs:
+
+    python tools/module_signatures.py                   # Print the table
+    python tools/module_signatures.py --update docs/module_detection.md
+    python tools/module_signatures.py --check           # Only check the registry, as CI does
+"""
+
+# Constants
+TABLE_START = "<!-- signature table start -->"  # The markers between which the docs table is placed
+TABLE_END = "<!-- signature table end -->"
+REGISTRY_START = "# --- generated registry start ---"    # The markers between which MODULE_REGISTRY is generated
+REGISTRY_END = "# --- generated registry end ---"
+LEVEL_ORDER = ("LOW", "FLOAT", "HIGH")          # The order to list ADC levels in
+
+# Handle command line arguments, when there are any
+args = sys.argv[1:] if hasattr(sys, "argv") else []
+UPDATE = "--update" in args
+DOCS_FILE = None
+if UPDATE and args.index("--update") + 1 < len(args) and not args[args.index("--update") + 1].startswith("--"):
+    DOCS_FILE = args[args.index("--update") + 1]
+CHECK_ONLY = "--check" in args
+
+# Use the simulator if it is available (i.e. when not running on a Yukon)
+try:
+    import yukon_sim
+    yukon_sim.install()
+except ImportError:
+    pass
+
+import pimoroni_yukon.modules   # noqa: E402
+from pimoroni_yukon.modules import MODULE_REGISTRY, ADC_LEVEL_NAMES, SIGNATURE_COUNT, load_module, signature_mask, signature_table, signature_levels, describe_signature   # noqa: E402
+
+
+def join_levels(levels):
+    if len(levels) == len(ADC_LEVEL_NAMES):
+        return "ALL"
+    names = [ADC_LEVEL_NAMES[level] for level in levels]
+    return " or ".join(name for name in LEVEL_ORDER if name in names)
+
+
+def group_signatures(indices):
+    # Group signatures by their SLOW levels, then merge ADC1 levels that share the same ADC2 levels,
+    # returning rows of ADC1 levels, ADC2 levels, and the SLOW levels
+    groups = {}
+    for index in indices:
+        adc1_level, adc2_level, slow1, slow2, slow3 = signature_levels(index)
+        groups.setdefault((int(slow1), int(slow2), int(slow3), adc1_level), set()).add(adc2_level)
+
+    merged = {}
+    for (slow1, slow2, slow3, adc1_level), adc2_levels in groups.items():
+        merged.setdefault((slow1, slow2, slow3, tuple(sorted(adc2_levels))), set()).add(adc1_level)
+
+    rows = []
+    for (slow1, slow2, slow3, adc2_levels), adc1_levels in merged.items():
+        rows.append((join_levels(adc1_levels), join_levels(adc2_levels), slow1, slow2, slow3))
+    rows.sort(key=lambda row: (row[2:5], row[0], row[1]))
+    return rows
+
+
+def build_rows(table):
+    # List each known module's signatures, grouped as compactly as possible
+    indices = {}
+    for index in range(SIGNATURE_COUNT):
+        if table[index] is None or table[index] == "YukonModule":
+            continue
+        indices.setdefault(load_module(table[index]).NAME, []).append(index)
+
+    rows = []
+    for name, module_indices in indices.items():
+        rows.extend(row + (name,) for row in group_signatures(module_indices))
+    rows.sort(key=lambda row: (row[5], row[2:5], row[0], row[1]))
+    return rows
+
+
+def describe_mask(mask):
+    # Describe the signatures in a bitmask, for the comment above each registry entry
+    rows = group_signatures(index for index in range(SIGNATURE_COUNT) if mask & (1 << index))
+    return "; ".join(f"ADC1 {adc1}, ADC2 {adc2}, SLOW {slow1}/{slow2}/{slow3}" for adc1, adc2, slow1, slow2, slow3 in rows)
+
+
+def format_registry():
+    # Write out MODULE_REGISTRY with each bitmask generated from its driver's is_module()
+    lines = ["MODULE_REGISTRY = ["]
+    for file, name, _ in MODULE_REGISTRY:
+        if file is None:
+            continue    # Registered at runtime with register_module(), so not part of the library
+        mask = signature_mask(load_module(name))
+        lines.append(f"    # {describe_mask(mask)}")
+        lines.append(f"    [\"{file}\", \"{name}\", {hex(mask)}],")
+    lines.append("]")
+    return "\n".join(lines)
+
+
+def replace_between(text, start_marker, end_marker, replacement):
+    start = text.index(start_marker) + len(start_marker)
+    end = text.index(end_marker)
+    return text[:start] + "\n" + replacement + "\n" + text[end:]
+
+
+def format_table(rows):
+    lines = ["| ADC1 | ADC2 | SLOW1 | SLOW2 | SLOW3 | Module |",
+             "|------|------|-------|-------|-------|--------|"]
+    for row in rows:
+        lines.append("| " + " | ".join(str(cell) for cell in row) + " |")
+    return "\n".join(lines)
+
+
+def check_registry():
+    # Compare each registry entry's bitmask against what its driver's is_module() actually returns
+    mismatches = 0
+    for file, name, mask in MODULE_REGISTRY:
+        actual = signature_mask(load_module(name))
+        if actual != mask:
+            mismatches += 1
+            print(f"Mismatch: '{name}' has a bitmask of {hex(mask)} in MODULE_REGISTRY, but its is_module() gives {hex(actual)}")
+
+    if mismatches == 0:
+        print(f"All {len(MODULE_REGISTRY)} bitmasks in MODULE_REGISTRY match their drivers")
+    return mismatches
+
+
+registry_file = pimoroni_yukon.modules.__file__
+with open(registry_file) as f:
+    source = f.read()
+generated = replace_between(source, REGISTRY_START, REGISTRY_END, format_registry())
+
+if UPDATE:
+    if generated != source:
+        with open(registry_file, "w") as f:
+            f.write(generated)
+        print(f"Updated {registry_file}")
+    else:
+        print(f"{registry_file} is up to date")
+
+    # Also correct the registry already imported, so the checks and table below use the new bitmasks
+    for entry in MODULE_REGISTRY:
+        entry[2] = signature_mask(load_module(entry[1]))
+    source = generated
+
+mismatches = check_registry()
+if generated != source and not UPDATE:
+    mismatches += 1
+    print(f"The generated part of {registry_file} is out of date. Run this with --update to regenerate it")
+
+if CHECK_ONLY:
+    sys.exit(1 if mismatches > 0 else 0)
+
+table, ambiguous = signature_table()
+text = format_table(build_rows(table))
+print(text)
+
+for index, names in ambiguous.items():
+    joined = ", ".join(f"'{name}'" for name in names)
+    print(f"Ambiguous: {describe_signature(index)} is claimed by {joined}")
+
+if DOCS_FILE is not None:
+    with open(DOCS_FILE) as f:
+        docs = f.read()
+
+    with open(DOCS_FILE, "w") as f:
+        f.write(replace_between(docs, TABLE_START, TABLE_END, text))
+    print(f"Updated {DOCS_FILE}")
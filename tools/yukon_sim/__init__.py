@@ -0,0 +1,111 @@
+"""
+A simulated Yukon, for running and profiling the pimoroni_yukon library on a
+host (CPython 3, or the unix port of MicroPython) with no board attached.
+
+    import yukon_sim
+    board = yukon_sim.install()
+    board.attach(1, "BigMotorModule")
+
+    from pimoroni_yukon import Yukon
+    yukon = Yukon()
+
+See README.md alongside this file for more details.
+"""
+
+import sys
+
+__board = None
+
+
+def __repo_root():
+    # Up from tools/yukon_sim/__init__.py to the root of the repository
+    path = __file__.replace("\\", "/")
+    for _ in range(3):
+        path = path[:path.rfind("/")] if "/" in path else ".."
+    return path if path else "/"
+
+
+def read_pins(path):
+    # Parse a board's pins.csv into {name: (is_ext, id)}
+    pins = {}
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            name, gpio = line.split(",")
+            if gpio.startswith("EXT_GPIO"):
+                pins[name] = (True, int(gpio[8:]))
+            else:
+                pins[name] = (False, int(gpio[4:]))
+
+    # Also give each pin its raw name, as Pin.board does
+    for is_ext, id in list(pins.values()):
+        pins[f"EXT_GPIO{id}" if is_ext else f"GPIO{id}"] = (is_ext, id)
+    return pins
+
+
+def board():
+    if __board is None:
+        raise RuntimeError("the simulator has not been installed. Call yukon_sim.install() first")
+    return __board
+
+
+def install(pins_csv=None, lib_path=None, native_monitor=False):
+    """Register the stand-in hardware modules and put the library on the path.
+    Must be called before anything from pimoroni_yukon is imported. Set native_monitor
+    to also stand in for the firmware's `yukon_monitor` module"""
+    global __board
+
+    from yukon_sim import compat
+    cpython = compat.is_cpython()
+    if cpython:
+        compat.patch_time()
+        compat.patch_asyncio()
+        sys.modules["micropython"] = compat.micropython_module()
+        sys.modules["ucollections"] = compat.ucollections_module()
+
+    repo = __repo_root()
+    if pins_csv is None:
+        pins_csv = repo + "/firmware/PIMORONI_YUKON/pins.csv"
+    if lib_path is None:
+        lib_path = repo + "/lib"
+    if lib_path not in sys.path:
+        sys.path.insert(0, lib_path)
+
+    from yukon_sim.hardware import Board
+    pins = read_pins(pins_csv)
+    __board = Board(pins)
+
+    # Modules are entered into sys.modules directly, as on MicroPython that is the
+    # only way to take precedence over the built-in `machine` module
+    from yukon_sim import machine, tca, motor, encoder, servo, plasma
+    machine.Pin.board = machine._build_board_pins(pins)
+    sys.modules["machine"] = machine
+    sys.modules["tca"] = tca
+    sys.modules["motor"] = motor
+    sys.modules["encoder"] = encoder
+    sys.modules["servo"] = servo
+    sys.modules["plasma"] = plasma
+    if native_monitor:
+        from yukon_sim import yukon_monitor
+        sys.modules["yukon_monitor"] = yukon_monitor
+    else:
+        sys.modules.pop("yukon_monitor", None)
+
+    if cpython:
+        # Load the library now so its classes can be given MicroPython's (lack of) name mangling
+        import pimoroni_yukon
+        import pimoroni_yukon.devices.lx_servo
+        import pimoroni_yukon.devices.stepper
+        compat.demangle(compat.library_classes())
+
+    return __board
+
+
+def demangle(*classes):
+    """Apply MicroPython's name handling to user-defined classes (such as custom
+    modules) that do not derive from a library class. Has no effect on MicroPython"""
+    from yukon_sim import compat
+    if compat.is_cpython():
+        compat.demangle(classes)
@@ -0,0 +1,116 @@
+import sys
+import time
+
+"""
+Shims that let MicroPython code run under CPython. None of this is needed (or
+applied) when the simulator runs on the unix port of MicroPython.
+"""
+
+TICKS_PERIOD = 1 << 30
+TICKS_MAX = TICKS_PERIOD - 1
+TICKS_HALFPERIOD = TICKS_PERIOD // 2
+
+
+def is_cpython():
+    return sys.implementation.name != "micropython"
+
+
+def __ticks_add(ticks, delta):
+    return (ticks + delta) & TICKS_MAX
+
+
+def __ticks_diff(end, start):
+    # Signed difference of two wrapping tick values, as MicroPython's time.ticks_diff
+    return ((end - start + TICKS_HALFPERIOD) & TICKS_MAX) - TICKS_HALFPERIOD
+
+
+def patch_time():
+    time.ticks_ms = lambda: int(time.monotonic_ns() // 1000000) & TICKS_MAX
+    time.ticks_us = lambda: int(time.monotonic_ns() // 1000) & TICKS_MAX
+    time.ticks_cpu = time.ticks_us
+    time.ticks_add = __ticks_add
+    time.ticks_diff = __ticks_diff
+    time.sleep_ms = lambda ms: time.sleep(ms / 1000)
+    time.sleep_us = lambda us: time.sleep(us / 1000000)
+
+
+def patch_asyncio():
+    # MicroPython's asyncio has millisecond sleeps, which the library uses
+    import asyncio
+
+    async def sleep_ms(ms):
+        await asyncio.sleep(ms / 1000)
+
+    asyncio.sleep_ms = sleep_ms
+
+
+class _Module:
+    # A plain namespace to stand in for a module object
+    def __init__(self, name, **attrs):
+        self.__name__ = name
+        for key, value in attrs.items():
+            setattr(self, key, value)
+
+
+def __const(value):
+    return value
+
+
+def __passthrough(func):
+    return func
+
+
+def __schedule(func, arg):
+    func(arg)
+
+
+def micropython_module():
+    return _Module("micropython",
+                   const=__const,
+                   native=__passthrough,
+                   viper=__passthrough,
+                   schedule=__schedule,
+                   alloc_emergency_exception_buf=lambda size: None,
+                   mem_info=lambda verbose=False: None,
+                   opt_level=lambda level=None: 0)
+
+
+def ucollections_module():
+    import collections
+    return _Module("ucollections", OrderedDict=collections.OrderedDict, namedtuple=collections.namedtuple, deque=collections.deque)
+
+
+def __demangled_getattr(self, name):
+    # Called only when normal lookup fails. Strip the accessing class's mangled prefix
+    # and look for the member under the mangled name of each class in this object's MRO
+    if name.startswith("_") and "__" in name[1:]:
+        member = "__" + name[1:].split("__", 1)[1]
+        for cls in type(self).__mro__:
+            mangled = "_" + cls.__name__.lstrip("_") + member
+            if mangled != name:
+                try:
+                    return object.__getattribute__(self, mangled)
+                except AttributeError:
+                    pass
+    raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+
+def demangle(classes):
+    """MicroPython does not mangle double underscore names, so the library freely
+    accesses `self.__name` members that were defined in a parent class (or on
+    another object entirely). Give each class a fallback lookup that finds the
+    member under whichever class's mangled name it was actually stored."""
+    for cls in classes:
+        if "__getattr__" not in cls.__dict__:
+            cls.__getattr__ = __demangled_getattr
+
+
+def library_classes():
+    # Find every class defined within the loaded pimoroni_yukon modules
+    classes = []
+    for name, module in list(sys.modules.items()):
+        if name == "pimoroni_yukon" or name.startswith("pimoroni_yukon."):
+            for value in vars(module).values():
+                if isinstance(value, type) and value.__module__ == name and value not in classes:
+                    classes.append(value)
+    return classes
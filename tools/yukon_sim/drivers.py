@@ -0,0 +1,140 @@
+"""
+Minimal stand-ins for the pimoroni-pico driver bindings (`motor`, `encoder`,
+`servo` and `plasma`) that the Yukon modules create during initialisation.
+They hold on to whatever they are given, and return it when asked.
+"""
+
+
+class Recorder:
+    # Any method not defined explicitly acts as a getter/setter for a value of the same name
+    def __init__(self, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        self.values = {}
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        def accessor(value=None, *args):
+            if value is None:
+                return self.values.get(name, 0)
+            self.values[name] = value
+        return accessor
+
+
+class Motor(Recorder):
+    def __init__(self, pins, calibration=None, freq=25000, **kwargs):
+        super().__init__(pins, calibration, freq=freq, **kwargs)
+        self.__enabled = False
+
+    def enable(self):
+        self.__enabled = True
+
+    def disable(self):
+        self.__enabled = False
+
+    def is_enabled(self):
+        return self.__enabled
+
+    def speed(self, value=None):
+        if value is None:
+            return self.values.get("speed", 0.0)
+        self.values["speed"] = value
+        self.__enabled = True
+
+    def stop(self):
+        self.speed(0.0)
+
+    def coast(self):
+        self.values["speed"] = 0.0
+        self.disable()
+
+    def brake(self):
+        self.stop()
+
+
+class Encoder(Recorder):
+    def __init__(self, pio, sm, pins, common_pin=None, direction=0, counts_per_rev=1, count_microsteps=False, freq_divider=1):
+        super().__init__(pio, sm, pins)
+        self.counts_per_rev = counts_per_rev
+
+    def count(self):
+        return 0
+
+    def revolutions(self):
+        return 0.0
+
+    def degrees(self):
+        return 0.0
+
+    def radians(self):
+        return 0.0
+
+    def zero(self):
+        pass
+
+    def capture(self):
+        return Capture()
+
+
+class Capture:
+    count = 0
+    delta = 0
+    frequency = 0.0
+    revolutions = 0.0
+    degrees = 0.0
+    radians = 0.0
+    revolutions_delta = 0.0
+    degrees_delta = 0.0
+    radians_delta = 0.0
+    revolutions_per_second = 0.0
+    revolutions_per_minute = 0.0
+    degrees_per_second = 0.0
+    radians_per_second = 0.0
+
+
+class Servo(Recorder):
+    def __init__(self, pin, calibration=None, freq=50):
+        super().__init__(pin, calibration, freq=freq)
+        self.__enabled = False
+
+    def enable(self):
+        self.__enabled = True
+
+    def disable(self):
+        self.__enabled = False
+
+    def is_enabled(self):
+        return self.__enabled
+
+    def value(self, value=None):
+        if value is None:
+            return self.values.get("value", 0.0)
+        self.values["value"] = value
+        self.__enabled = True
+
+
+class Strip(Recorder):
+    def __init__(self, num_leds, *args, **kwargs):
+        super().__init__(num_leds, *args, **kwargs)
+        self.__num_leds = num_leds
+        self.updates = 0
+
+    def num_leds(self):
+        return self.__num_leds
+
+    def set_rgb(self, index, r, g, b, *args):
+        pass
+
+    def set_hsv(self, index, h, s=1.0, v=1.0, *args):
+        pass
+
+    def update(self):
+        self.updates += 1
+
+    def start(self, fps=60):
+        pass
+
+    def clear(self):
+        pass
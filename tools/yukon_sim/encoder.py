@@ -0,0 +1,6 @@
+from yukon_sim.drivers import Encoder
+
+NORMAL_DIR = 0x00
+REVERSED_DIR = 0x01
+MMME_CPR = 12
+ROTARY_CPR = 24
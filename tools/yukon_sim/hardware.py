@@ -0,0 +1,432 @@
+import math
+import time
+
+"""
+A software model of the Yukon board, used by the stand-in `machine` and `tca`
+modules so that the pimoroni_yukon library can run on a host with no hardware.
+
+It models the two TCA9555 IO expanders (including the local memory shadow the
+firmware uses to skip no-op writes), the shared ADC and the analog muxes that
+feed it, the main output, and whatever modules are attached to each slot.
+"""
+
+ADC_REF = 3.3
+U16_MAX = 65535
+
+# The level voltages used when building a module's detection signature
+LOW_V = 0.0
+FLOAT_V = 1.65
+HIGH_V = 3.3
+
+# The initial expander states, as set by board_init() in firmware/PIMORONI_YUKON/board.c
+EXPANDER_INIT = ((0x8800, 0x07BF), (0x0000, 0xFCE6))   # (output, config) for each chip
+
+# The mux addresses of the board's own sensors
+CURRENT_SENSE_ADDR = 12
+TEMP_SENSE_ADDR = 13
+VOLTAGE_OUT_SENSE_ADDR = 14
+VOLTAGE_IN_SENSE_ADDR = 15
+
+# The mux addresses of each slot's ADC1 and ADC2, indexed by slot ID - 1
+SLOT_ADC1_ADDRS = (0, 1, 4, 5, 8, 9)
+SLOT_ADC2_ADDRS = (3, 6, 2, 7, 11, 10)
+
+
+def temp_to_voltage(celsius, pullup=5100, r25=10000.0, beta=3435):
+    # The inverse of conversion.analog_to_temp, for a thermistor on a 5.1k pull-up
+    t_kelvin = celsius + 273.15
+    r_thermistor = r25 * math.exp(beta * ((1 / t_kelvin) - (1 / 298.15)))
+    return ADC_REF * r_thermistor / (r_thermistor + pullup)
+
+
+def voltage_to_u16(voltage):
+    return max(0, min(int((voltage * U16_MAX) / ADC_REF + 0.5), U16_MAX))
+
+
+def invert_u16(conversion, value):
+    # Find the raw reading that a (non-decreasing) conversion function maps to the given value
+    low = 0
+    high = U16_MAX
+    while low < high:
+        mid = (low + high) // 2
+        if conversion(mid) < value:
+            low = mid + 1
+        else:
+            high = mid
+    return low
+
+
+class SimModule:
+    """The electrical signature of something attached to a slot.
+
+    `adc1` and `adc2` are the voltages the slot's analog pins sit at, and `slow`
+    holds the levels the module drives on SLOW1 to SLOW3 (None leaves a pin to
+    the expander's pull-up). Modules with a thermistor on ADC2 should leave
+    `adc2` as None and set `temperature` instead. The `*_powered` values, when
+    given, replace their unpowered equivalents whilst the main output is on.
+    """
+    def __init__(self, name, adc1=FLOAT_V, adc2=None, slow=(None, None, None), temperature=25.0,
+                 adc1_powered=None, adc2_powered=None, slow_powered=None, fast=None):
+        self.name = name
+        self.adc1 = adc1
+        self.adc2 = adc2
+        self.slow = slow
+        self.temperature = temperature
+        self.adc1_powered = adc1_powered
+        self.adc2_powered = adc2_powered
+        self.slow_powered = slow_powered
+        self.fast = fast if fast is not None else {}   # Levels driven onto FAST pins, keyed by 1 to 4
+
+    def adc1_voltage(self, powered):
+        if powered and self.adc1_powered is not None:
+            return self.adc1_powered
+        return self.adc1
+
+    def adc2_voltage(self, powered):
+        if powered and self.adc2_powered is not None:
+            return self.adc2_powered
+        if self.adc2 is None:
+            return temp_to_voltage(self.temperature)
+        return self.adc2
+
+    def slow_level(self, index, powered):
+        levels = self.slow_powered if powered and self.slow_powered is not None else self.slow
+        return levels[index]
+
+    def __repr__(self):
+        return f"SimModule({self.name})"
+
+
+# Signatures for each of the modules Pimoroni produce, taken from the address tables in each driver.
+# Where a module drives its SLOW pins differently once powered, this is reflected in `slow_powered`
+def audio_amp():
+    return SimModule("Audio Amp", adc1=FLOAT_V, slow=(0, 1, 1), slow_powered=(None, None, None))
+
+
+def bench_power():
+    return SimModule("Bench Power", adc1=LOW_V, slow=(1, 0, 0), adc1_powered=1.3094, fast={1: 1})
+
+
+def big_motor():
+    return SimModule("Big Motor + Encoder", adc1=LOW_V, slow=(0, 0, 1), adc1_powered=ADC_REF / 2, slow_powered=(0, 1, None))
+
+
+def dual_motor():
+    return SimModule("Dual Motor", adc1=HIGH_V, slow=(0, 0, 1))
+
+
+def dual_output():
+    return SimModule("Dual Switched Output", adc1=FLOAT_V, slow=(1, 0, 1))
+
+
+def led_strip():
+    return SimModule("LED Strip", adc1=LOW_V, slow=(1, 1, 1), fast={1: 1})
+
+
+def proto_pot():
+    return SimModule("Proto Potentiometer", adc1=FLOAT_V, adc2=HIGH_V, slow=(1, 1, 0))
+
+
+def quad_servo_direct():
+    return SimModule("Quad Servo Direct", adc1=FLOAT_V, adc2=FLOAT_V, slow=(0, 0, 0))
+
+
+def quad_servo_reg():
+    return SimModule("Quad Servo Regulated", adc1=HIGH_V, slow=(0, 1, 1), slow_powered=(None, 1, 1))
+
+
+def rm2_wireless():
+    return SimModule("RM2 Wireless", adc1=LOW_V, adc2=FLOAT_V, slow=(1, 0, 1))
+
+
+def serial_servo():
+    return SimModule("Serial Bus Servo", adc1=HIGH_V, adc2=HIGH_V, slow=(1, 0, 0))
+
+
+PRESETS = {
+    "AudioAmpModule": audio_amp,
+    "BenchPowerModule": bench_power,
+    "BigMotorModule": big_motor,
+    "DualMotorModule": dual_motor,
+    "DualOutputModule": dual_output,
+    "LEDStripModule": led_strip,
+    "ProtoPotModule": proto_pot,
+    "QuadServoDirectModule": quad_servo_direct,
+    "QuadServoRegModule": quad_servo_reg,
+    "RM2WirelessModule": rm2_wireless,
+    "SerialServoModule": serial_servo,
+}
+
+
+class Expander:
+    """A TCA9555, with counters for the I2C transactions issued to it"""
+    def __init__(self, output, config):
+        self.output = output
+        self.config = config        # 1 = input, 0 = output
+        self.polarity = 0
+        self.reset_counters()
+
+    def reset_counters(self):
+        self.reads = 0
+        self.writes = 0
+        self.skipped = 0
+
+
+class Board:
+    def __init__(self, pins):
+        self.pins = pins            # name -> (is_ext, id), as parsed from pins.csv
+        self.expanders = [Expander(output, config) for output, config in EXPANDER_INIT]
+        self.slots = [None] * 6
+
+        # The board's own sensors, in physical units
+        self.voltage_in = 12.0
+        self.current = 0.5
+        self.temperature = 25.0
+
+        # How the output rail behaves when switched. A time constant of zero is an instant change
+        self.rise_tau = 0.0
+        self.discharge_tau = 0.0
+        self.__vout_from = 0.0
+        self.__vout_since = time.ticks_us()
+        self.__powered = False
+
+        self.noise = 0              # Peak noise (in u16 counts) to add to each shared ADC sample
+        self.__seed = 12345
+
+        self.i2c_delay_us = 0       # Time to spend on each I2C transaction, to emulate the 400kHz bus
+        self.adc_delay_us = 0       # Time to spend on each ADC conversion
+
+        self.pressed = {"SW_A": False, "SW_B": False, "USER_SW": False}
+        self.gpio_inputs = {}       # Levels driven onto RP2040 GPIOs by external hardware, keyed by GPIO number
+        self.gpio_analog = {}       # Voltages on the RP2040's other ADC pins, keyed by GPIO number
+
+        self.adc_reads = 0
+        self.tick_hook = None       # Called with the board on every shared ADC sample, for scripting scenarios
+
+        self.__conversions = None
+        self.__ext_map = {}
+        for name, (is_ext, id) in pins.items():
+            if is_ext and id not in self.__ext_map:     # Keep the first (descriptive) name over EXT_GPIOn
+                self.__ext_map[id] = name
+
+    # -----------------------------------------------------
+    # Scripting
+    # -----------------------------------------------------
+    def attach(self, slot, module):
+        """Attach a module to a slot (1 to 6). `module` can be a SimModule, a
+        preset name such as "BigMotorModule", or a YukonModule class"""
+        if not isinstance(module, SimModule) and module is not None:
+            name = module if isinstance(module, str) else module.__name__
+            if name not in PRESETS:
+                raise ValueError(f"no simulated signature for '{name}'")
+            module = PRESETS[name]()
+        self.slots[slot - 1] = module
+        return module
+
+    def detach(self, slot):
+        self.slots[slot - 1] = None
+
+    def signature(self, slot, adc1, adc2, slow1, slow2, slow3):
+        """Attach an arbitrary signature to a slot, using "LOW", "FLOAT" or "HIGH"
+        for the ADCs (or a voltage), and 0 or 1 for the SLOW pins"""
+        levels = {"LOW": LOW_V, "FLOAT": FLOAT_V, "HIGH": HIGH_V}
+        adc1 = levels.get(adc1, adc1)
+        adc2 = levels.get(adc2, adc2)
+        return self.attach(slot, SimModule("Custom", adc1=adc1, adc2=adc2, slow=(slow1, slow2, slow3)))
+
+    def press(self, switch, state=True):
+        self.pressed[switch] = state
+
+    def reset_counters(self):
+        for expander in self.expanders:
+            expander.reset_counters()
+        self.adc_reads = 0
+
+    def i2c_transactions(self):
+        total = 0
+        for expander in self.expanders:
+            total += expander.reads + expander.writes
+        return total
+
+    # -----------------------------------------------------
+    # Expander
+    # -----------------------------------------------------
+    def __transaction(self):
+        if self.i2c_delay_us > 0:
+            end = time.ticks_add(time.ticks_us(), self.i2c_delay_us)
+            while time.ticks_diff(end, time.ticks_us()) > 0:
+                pass
+
+    def write_output(self, chip, mask, state):
+        expander = self.expanders[chip]
+        new_output = (expander.output & ~mask) | (state & mask)
+        if new_output == expander.output:
+            expander.skipped += 1
+            return
+        expander.writes += 1
+        self.__transaction()
+        self.__update_output(chip, new_output)
+
+    def write_output_sequence(self, chip, steps):
+        # Like the firmware, every state that changes the outputs is written within a single transaction
+        expander = self.expanders[chip]
+        output = expander.output
+        changed = False
+        for mask, state in steps:
+            new_output = (output & ~mask) | (state & mask)
+            if new_output == output:
+                expander.skipped += 1
+                continue
+            if not changed:
+                expander.writes += 1
+                self.__transaction()
+                changed = True
+            self.__update_output(chip, new_output)
+            output = new_output
+
+    def write_config(self, chip, mask, state):
+        expander = self.expanders[chip]
+        new_config = (expander.config & ~mask) | (state & mask)
+        if new_config == expander.config:
+            expander.skipped += 1
+            return
+        expander.writes += 1
+        self.__transaction()
+        expander.config = new_config
+
+    def write_polarity(self, chip, mask, state):
+        expander = self.expanders[chip]
+        new_polarity = (expander.polarity & ~mask) | (state & mask)
+        if new_polarity == expander.polarity:
+            expander.skipped += 1
+            return
+        expander.writes += 1
+        self.__transaction()
+        expander.polarity = new_polarity
+
+    def read_register(self, chip, value):
+        # Any read of the chip costs a transaction, regardless of what is being read
+        self.expanders[chip].reads += 1
+        self.__transaction()
+        return value
+
+    def read_input_port(self, chip):
+        expander = self.expanders[chip]
+        state = 0
+        for bit in range(16):
+            if self.__ext_level(chip * 16 + bit):
+                state |= 1 << bit
+        return self.read_register(chip, state ^ expander.polarity)
+
+    def __ext_level(self, ext_id):
+        expander = self.expanders[ext_id // 16]
+        bit = 1 << (ext_id % 16)
+        if not (expander.config & bit):
+            return (expander.output & bit) != 0
+
+        name = self.__ext_map.get(ext_id)
+        if name is not None:
+            if name in self.pressed:
+                return not self.pressed[name]     # Switches pull low when pressed
+
+            if name.startswith("SLOT") and "_SLOW" in name:
+                module = self.slots[int(name[4]) - 1]
+                if module is not None:
+                    level = module.slow_level(int(name[-1]) - 1, self.__powered)
+                    if level is not None:
+                        return level != 0
+        return True     # Inputs are pulled up
+
+    def __update_output(self, chip, new_output):
+        self.expanders[chip].output = new_output
+        main_en = self.pins["MAIN_EN"][1]
+        if chip == main_en // 16:
+            powered = (new_output & (1 << (main_en % 16))) != 0
+            if powered != self.__powered:
+                self.__vout_from = self.voltage_out()
+                self.__vout_since = time.ticks_us()
+                self.__powered = powered
+
+    # -----------------------------------------------------
+    # Analog
+    # -----------------------------------------------------
+    def is_powered(self):
+        return self.__powered
+
+    def voltage_out(self):
+        elapsed = time.ticks_diff(time.ticks_us(), self.__vout_since) / 1000000
+        target = self.voltage_in if self.__powered else 0.0
+        tau = self.rise_tau if self.__powered else self.discharge_tau
+        if tau <= 0:
+            return target
+        return target + (self.__vout_from - target) * math.exp(-elapsed / tau)
+
+    def mux_address(self):
+        # Work out which mux channel is feeding the shared ADC, from the expander's output state
+        output = self.expanders[self.pins["ADC_ADDR_1"][1] // 16].output
+
+        def bit(name):
+            id = self.pins[name][1]
+            return (output >> (id % 16)) & 1
+
+        address = bit("ADC_ADDR_1") | (bit("ADC_ADDR_2") << 1) | (bit("ADC_ADDR_3") << 2)
+        en1 = bit("ADC_MUX_EN_1")
+        en2 = bit("ADC_MUX_EN_2")
+        if en1 == 0 and en2 == 1:
+            return address
+        if en2 == 0 and en1 == 1:
+            return address | 0b1000
+        return None     # Either both muxes are disabled, or both are enabled and fighting
+
+    def __conversion(self):
+        if self.__conversions is None:
+            from pimoroni_yukon.conversion import u16_to_voltage_in, u16_to_voltage_out, u16_to_current
+            self.__conversions = (u16_to_voltage_in, u16_to_voltage_out, u16_to_current)
+        return self.__conversions
+
+    def channel_voltage(self, address):
+        if address is None:
+            return 0.0
+
+        u16_to_voltage_in, u16_to_voltage_out, u16_to_current = self.__conversion()
+        if address == VOLTAGE_IN_SENSE_ADDR:
+            return invert_u16(u16_to_voltage_in, self.voltage_in) * ADC_REF / U16_MAX
+        if address == VOLTAGE_OUT_SENSE_ADDR:
+            return invert_u16(u16_to_voltage_out, self.voltage_out()) * ADC_REF / U16_MAX
+        if address == CURRENT_SENSE_ADDR:
+            current = self.current if self.__powered else 0.0
+            return invert_u16(u16_to_current, current) * ADC_REF / U16_MAX
+        if address == TEMP_SENSE_ADDR:
+            return temp_to_voltage(self.temperature)
+
+        if address in SLOT_ADC1_ADDRS:
+            module = self.slots[SLOT_ADC1_ADDRS.index(address)]
+            return FLOAT_V if module is None else module.adc1_voltage(self.__powered)
+
+        module = self.slots[SLOT_ADC2_ADDRS.index(address)]
+        return HIGH_V if module is None else module.adc2_voltage(self.__powered)
+
+    def shared_adc_u16(self):
+        self.adc_reads += 1
+        if self.tick_hook is not None:
+            self.tick_hook(self)
+
+        if self.adc_delay_us > 0:
+            end = time.ticks_add(time.ticks_us(), self.adc_delay_us)
+            while time.ticks_diff(end, time.ticks_us()) > 0:
+                pass
+
+        value = voltage_to_u16(self.channel_voltage(self.mux_address()))
+        if self.noise > 0:
+            self.__seed = (self.__seed * 1103515245 + 12345) & 0x7FFFFFFF
+            value += (self.__seed % (2 * self.noise + 1)) - self.noise
+        return max(0, min(value, U16_MAX))
+
+    def gpio_level(self, id, default):
+        for slot in range(6):
+            module = self.slots[slot]
+            if module is not None and module.fast:
+                for index, level in module.fast.items():
+                    if self.pins.get(f"SLOT{slot + 1}_FAST{index}") == (False, id):
+                        return level
+        return self.gpio_inputs.get(id, default)
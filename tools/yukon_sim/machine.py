@@ -0,0 +1,243 @@
+import time
+import yukon_sim
+
+"""
+A stand-in for the parts of MicroPython's `machine` module that the
+pimoroni_yukon library uses, backed by the simulated board.
+"""
+
+
+class Pin:
+    IN = 0
+    OUT = 1
+    OPEN_DRAIN = 2
+    ALT = 3
+    PULL_UP = 1
+    PULL_DOWN = 2
+    IRQ_FALLING = 4
+    IRQ_RISING = 8
+
+    board = None
+
+    def __init__(self, id, mode=-1, pull=-1, *, value=None, name=None, is_ext=False):
+        self.id = id
+        self.name = name if name is not None else f"GPIO{id}"
+        self.is_ext = is_ext
+        self.__mode = Pin.IN
+        self.__pull = None
+        self.__value = 0
+        self.__handler = None
+        if mode != -1 or value is not None:
+            self.init(mode, pull, value=value)
+
+    def init(self, mode=-1, pull=-1, *, value=None):
+        board = yukon_sim.board()
+        if self.is_ext:
+            chip = self.id // 16
+            bit = 1 << (self.id % 16)
+            if value is not None:
+                board.write_output(chip, bit, bit if value else 0)
+            if mode == Pin.IN:
+                board.write_config(chip, bit, bit)
+            elif mode == Pin.OUT or mode == Pin.OPEN_DRAIN:
+                board.write_config(chip, bit, 0)
+        else:
+            if mode != -1:
+                self.__mode = mode
+            if pull != -1:
+                self.__pull = pull
+            if value is not None:
+                self.__value = 1 if value else 0
+
+    def value(self, value=None):
+        board = yukon_sim.board()
+        if self.is_ext:
+            chip = self.id // 16
+            bit = 1 << (self.id % 16)
+            if value is None:
+                return 1 if board.read_input_port(chip) & bit else 0
+            board.write_output(chip, bit, bit if value else 0)
+            return None
+
+        if value is None:
+            if self.__mode == Pin.OUT:
+                return self.__value
+            return board.gpio_level(self.id, 0 if self.__pull == Pin.PULL_DOWN else 1)
+        self.__value = 1 if value else 0
+        return None
+
+    def __call__(self, value=None):
+        return self.value(value)
+
+    def on(self):
+        self.value(1)
+
+    def off(self):
+        self.value(0)
+
+    def high(self):
+        self.value(1)
+
+    def low(self):
+        self.value(0)
+
+    def toggle(self):
+        self.value(1 - self.value())
+
+    def irq(self, handler=None, trigger=IRQ_FALLING | IRQ_RISING, hard=False):
+        self.__handler = handler
+
+    def __repr__(self):
+        return f"Pin({self.name})"
+
+
+class _Board:
+    pass
+
+
+def _build_board_pins(pins):
+    # Create one Pin object per physical pin, shared by all the names that alias it
+    board = _Board()
+    created = {}
+    for name, (is_ext, id) in pins.items():
+        key = (is_ext, id)
+        if key not in created:
+            created[key] = Pin(id, name=name, is_ext=is_ext)
+        setattr(board, name, created[key])
+    return board
+
+
+class ADC:
+    CORE_TEMP = 4
+
+    def __init__(self, pin):
+        self.pin = pin
+
+    def read_u16(self):
+        board = yukon_sim.board()
+        if isinstance(self.pin, Pin) and self.pin.name == "SHARED_ADC":
+            return board.shared_adc_u16()
+        id = self.pin.id if isinstance(self.pin, Pin) else self.pin
+        voltage = board.gpio_analog.get(id, 0.0)
+        return max(0, min(int((voltage * 65535) / 3.3), 65535))
+
+
+class PWM:
+    def __init__(self, pin, freq=1000, duty_u16=0):
+        self.pin = pin
+        self.__freq = freq
+        self.__duty = duty_u16
+
+    def freq(self, value=None):
+        if value is None:
+            return self.__freq
+        self.__freq = value
+
+    def duty_u16(self, value=None):
+        if value is None:
+            return self.__duty
+        self.__duty = value
+
+    def deinit(self):
+        pass
+
+
+class I2C:
+    def __init__(self, id, sda=None, scl=None, freq=400000):
+        self.id = id
+
+    def scan(self):
+        return []
+
+
+class UART:
+    def __init__(self, id, baudrate=115200, tx=None, rx=None, **kwargs):
+        self.id = id
+        self.baudrate = baudrate
+        self.rx_buffer = bytearray()
+        self.tx_log = bytearray()
+
+    def any(self):
+        return len(self.rx_buffer)
+
+    def read(self, nbytes=None):
+        if len(self.rx_buffer) == 0:
+            return None
+        if nbytes is None:
+            nbytes = len(self.rx_buffer)
+        data = bytes(self.rx_buffer[:nbytes])
+        self.rx_buffer = self.rx_buffer[nbytes:]
+        return data
+
+    def write(self, buffer):
+        self.tx_log.extend(buffer)
+        return len(buffer)
+
+    def txdone(self):
+        return True
+
+
+class I2S:
+    TX = 0
+    RX = 1
+    MONO = 0
+    STEREO = 1
+
+    def __init__(self, id, **kwargs):
+        self.id = id
+        self.__handler = None
+
+    def irq(self, handler):
+        self.__handler = handler
+
+    def write(self, buffer):
+        return len(buffer)
+
+    def deinit(self):
+        pass
+
+
+class Timer:
+    ONE_SHOT = 0
+    PERIODIC = 1
+
+    def __init__(self, id=-1, **kwargs):
+        self.callback = None
+        if kwargs:
+            self.init(**kwargs)
+
+    def init(self, mode=PERIODIC, freq=-1, period=-1, callback=None):
+        # Timers are not run automatically. Call fire() to invoke the callback
+        self.callback = callback
+
+    def fire(self):
+        if self.callback is not None:
+            self.callback(self)
+
+    def deinit(self):
+        self.callback = None
+
+
+def idle():
+    pass
+
+
+def freq(hz=None):
+    return 200_000_000 if hz is None else None
+
+
+def unique_id():
+    return b"YUKONSIM"
+
+
+def lightsleep(ms=None):
+    if ms is not None:
+        time.sleep_ms(ms)
+
+
+def disable_irq():
+    return 0
+
+
+def enable_irq(state=0):
+    pass
@@ -0,0 +1,11 @@
+from yukon_sim.drivers import Motor
+
+NORMAL_DIR = 0x00
+REVERSED_DIR = 0x01
+FAST_DECAY = 0
+SLOW_DECAY = 1
+
+
+class MotorCluster:
+    def __init__(self, *args, **kwargs):
+        raise NotImplementedError("MotorCluster is not simulated")
@@ -0,0 +1,10 @@
+from yukon_sim.drivers import Strip
+
+
+class WS2812(Strip):
+    pass
+
+
+class APA102(Strip):
+    def set_brightness(self, brightness):
+        self.values["brightness"] = brightness
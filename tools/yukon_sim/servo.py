@@ -0,0 +1,6 @@
+from yukon_sim.drivers import Servo
+
+
+class ServoCluster:
+    def __init__(self, *args, **kwargs):
+        raise NotImplementedError("ServoCluster is not simulated")
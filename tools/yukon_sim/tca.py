@@ -0,0 +1,136 @@
+import yukon_sim
+
+"""
+A stand-in for the `tca` module (firmware/modules/tca9555/tca.c), backed by the
+simulated board. Argument checking matches that of the firmware.
+"""
+
+CHIP_COUNT = 2
+GPIO_COUNT = 16
+SEQUENCE_MAX = 32   # The most output states the firmware writes in one transaction
+
+__input_cache = False
+
+
+def __check_pin(pin):
+    from machine import Pin
+    if not isinstance(pin, Pin):
+        raise TypeError(f"pin must be of type Pin, not {type(pin).__name__}")
+    if not pin.is_ext:
+        raise TypeError("pin is not an external pin")
+
+
+def __check_args(chip, mask, state):
+    if chip < 0 or chip >= CHIP_COUNT:
+        raise ValueError(f"chip can only be 0 to {CHIP_COUNT - 1}")
+    if mask < 0 or mask > 0xFFFF:
+        raise ValueError("mask only supports 16 bits")
+    if state < 0 or state > 0xFFFF:
+        raise ValueError("state only supports 16 bits")
+
+
+def __check_chip(chip):
+    if chip < 0 or chip >= CHIP_COUNT:
+        raise ValueError(f"chip can only be 0 to {CHIP_COUNT - 1}")
+
+
+def get_number(pin):
+    __check_pin(pin)
+    return pin.id % GPIO_COUNT
+
+
+def get_chip(pin):
+    __check_pin(pin)
+    return pin.id // GPIO_COUNT
+
+
+def change_output_mask(chip, mask, state):
+    __check_args(chip, mask, state)
+    yukon_sim.board().write_output(chip, mask, state)
+
+
+def change_config_mask(chip, mask, state):
+    __check_args(chip, mask, state)
+    yukon_sim.board().write_config(chip, mask, state)
+
+
+def change_polarity_mask(chip, mask, state):
+    __check_args(chip, mask, state)
+    yukon_sim.board().write_polarity(chip, mask, state)
+
+
+def apply(chip, output_mask, output_state, config_mask=0, config_state=0):
+    __check_args(chip, output_mask, output_state)
+    __check_args(chip, config_mask, config_state)
+    board = yukon_sim.board()
+    if output_mask > 0:
+        board.write_output(chip, output_mask, output_state)
+    if config_mask > 0:
+        board.write_config(chip, config_mask, config_state)
+
+
+def change_output_sequence(chip, steps):
+    for mask, state in steps:
+        __check_args(chip, mask, state)
+    steps = list(steps)
+    for i in range(0, len(steps), SEQUENCE_MAX):
+        yukon_sim.board().write_output_sequence(chip, steps[i:i + SEQUENCE_MAX])
+
+
+def counters(chip):
+    __check_chip(chip)
+    expander = yukon_sim.board().expanders[chip]
+    return (expander.reads + expander.writes, expander.skipped)
+
+
+def reset_counters():
+    for expander in yukon_sim.board().expanders:
+        expander.reset_counters()
+
+
+def input_cache(*args):
+    # The simulated expanders are read directly, which gives the same results as the firmware's cache
+    global __input_cache
+    if len(args) > 1:
+        raise TypeError(f"function expected at most 1 arguments, got {len(args)}")
+    if len(args) == 0:
+        return __input_cache
+    __input_cache = bool(args[0])
+
+
+def read_input(chip):
+    __check_chip(chip)
+    return yukon_sim.board().read_input_port(chip)
+
+
+def read_output(chip):
+    __check_chip(chip)
+    board = yukon_sim.board()
+    return board.read_register(chip, board.expanders[chip].output)
+
+
+def read_config(chip):
+    __check_chip(chip)
+    board = yukon_sim.board()
+    return board.read_register(chip, board.expanders[chip].config)
+
+
+def read_polarity(chip):
+    __check_chip(chip)
+    board = yukon_sim.board()
+    return board.read_register(chip, board.expanders[chip].polarity)
+
+
+def stored_output(chip):
+    __check_chip(chip)
+    return yukon_sim.board().expanders[chip].output
+
+
+def stored_config(chip):
+    __check_chip(chip)
+    return yukon_sim.board().expanders[chip].config
+
+
+def stored_polarity(chip):
+    __check_chip(chip)
+    return yukon_sim.board().expanders[chip].polarity
@@ -0,0 +1,86 @@
+import yukon_sim
+from yukon_sim import tca
+
+"""
+A stand-in for the `yukon_monitor` module (firmware/modules/yukon_monitor/yukon_monitor.c),
+backed by the simulated board. Argument checking matches that of the firmware.
+"""
+
+ENTRY_SIZE = 6      # Address, mux state, samples, low, high, accumulator slot
+PASSED = -1
+NUM_ADDRESSES = 16
+NUM_ADC_CHANNELS = 5
+SHARED_ADC_CHANNEL = 3
+SUM_SPLIT = 1 << 24
+
+
+def __check_int_array(obj):
+    if getattr(obj, "typecode", None) != 'i':
+        raise TypeError("expected an array of type 'i'")
+
+
+def sweep(chip, io_mask, channel, table, due, values, accumulators):
+    if chip < 0 or chip >= tca.CHIP_COUNT:
+        raise ValueError(f"chip can only be 0 to {tca.CHIP_COUNT - 1}")
+    if io_mask < 0 or io_mask > 0xFFFF:
+        raise ValueError("mask only supports 16 bits")
+    if channel < 0 or channel >= NUM_ADC_CHANNELS:
+        raise ValueError(f"channel can only be 0 to {NUM_ADC_CHANNELS - 1}")
+    if channel != SHARED_ADC_CHANNEL:
+        raise NotImplementedError("only the shared ADC is simulated")
+
+    __check_int_array(table)
+    if len(table) % ENTRY_SIZE != 0:
+        raise ValueError("table length must be a multiple of the entry size")
+    if getattr(values, "typecode", None) != 'H' or len(values) < NUM_ADDRESSES:
+        raise TypeError("values must be an array of type 'H', with an item per address")
+
+    slots = 0
+    if accumulators is not None:
+        if len(accumulators) != 4:
+            raise ValueError("requested length 4 but object has length " + str(len(accumulators)))
+        for accumulator in accumulators:
+            __check_int_array(accumulator)
+        slots = min(len(accumulator) for accumulator in accumulators)
+
+    entries = [table[i:i + ENTRY_SIZE] for i in range(0, len(table), ENTRY_SIZE)]
+    for address, state, samples, low, high, slot in entries:
+        if address < 0 or address >= NUM_ADDRESSES:
+            raise ValueError("address out of range")
+        if state < 0 or state > 0xFFFF:
+            raise ValueError("state only supports 16 bits")
+        if samples < 1:
+            raise ValueError("samples must be 1 or greater")
+        if accumulators is not None and slot >= slots:
+            raise ValueError("slot out of range")
+
+    board = yukon_sim.board()
+    for address, state, samples, low, high, slot in entries:
+        if due & (1 << address):
+            tca.change_output_mask(chip, io_mask, state)
+            total = 0
+            for _ in range(samples):
+                total += board.shared_adc_u16()
+            values[address] = total // samples
+
+    for i in range(len(entries)):
+        address, state, samples, low, high, slot = entries[i]
+        if values[address] < low or values[address] > high:
+            return i
+
+    if accumulators is not None:
+        max_, min_, sum_hi, sum_lo = accumulators
+        for address, state, samples, low, high, slot in entries:
+            if slot >= 0:
+                value = values[address]
+                if value > max_[slot]:
+                    max_[slot] = value
+                if value < min_[slot]:
+                    min_[slot] = value
+                lo = sum_lo[slot] + value
+                if lo >= SUM_SPLIT:
+                    lo -= SUM_SPLIT
+                    sum_hi[slot] += 1
+                sum_lo[slot] = lo
+
+    return PASSED